@@ -10,7 +10,16 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .aiohtp1 import Htp1
-from .const import DOMAIN
+from .const import (
+    CONF_CHANGEMSO_CHUNK_BYTES,
+    CONF_CHANGEMSO_CHUNK_DELAY,
+    CONF_FOLLOWER_RULES,
+    CONF_HISTORY_SIZE,
+    DOMAIN,
+    LOGGER,
+)
+from .followers import FollowerError, parse_rules
+from .history import DEFAULT_HISTORY_SIZE
 
 PLATFORMS = ["sensor", "number", "switch", "select", "button", "media_player"]
 
@@ -20,6 +29,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     session = async_get_clientsession(hass)
     htp1 = Htp1(entry.data["host"], session)
+    htp1.set_history_size(entry.options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE))
+    htp1.changemso_chunk_bytes = entry.options.get(
+        CONF_CHANGEMSO_CHUNK_BYTES, Htp1.CHANGEMSO_CHUNK_BYTES
+    )
+    htp1.changemso_chunk_delay = entry.options.get(
+        CONF_CHANGEMSO_CHUNK_DELAY, Htp1.CHANGEMSO_CHUNK_DELAY
+    )
+    try:
+        htp1.followers.set_rules(parse_rules(entry.options.get(CONF_FOLLOWER_RULES)))
+    except FollowerError as err:
+        LOGGER.error("Ignoring invalid follower rules: %s", err)
 
     try:
         # Ensure websocket + initial state are ready during setup.
@@ -34,6 +54,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.async_on_unload(
             hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _shutdown)
         )
+        entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
         # Forward platforms; if this fails, we must clean up.
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -51,6 +72,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"HTP-1 not ready: {err}") from err
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     htp1 = hass.data[DOMAIN].pop(entry.entry_id)
     await htp1.stop()
@@ -2,20 +2,52 @@
 
 import asyncio
 import inspect
+import time
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from contextlib import suppress
+from copy import deepcopy
 from json import dumps, loads
 from logging import getLogger
 from typing import Any
+from .peq_occupancy import (
+    BEQ_SLOT_COUNT,
+    PeqOccupancy,
+    iter_bits,
+)
+from .availability import Availability
+from .capture import FrameRecorder
+from .followers import FollowerEngine
+from .history import PathHistory
+from . import jsonpatch, registry
+from .msodiff import diff, same, unescape
 from .trigger_manager import TriggerManager
+from .volume_stepper import VolumeStepper
 
 import aiodns
 import aiohttp
 
 FILTER_TYPE_MAP = {"PeakingEQ": 0, "LowShelf": 1, "HighShelf": 2}
-# FilterType values: 0=PeakingEQ, 1=LowShelf, 2=HighShelf, 3=AllPass, 4=LPF, 5=HPF
-GAIN_INDEPENDENT_FILTER_TYPES = {3, 4, 5}  # Active even when gaindB == 0
-BEQ_SLOT_COUNT = 16  # Total PEQ slots (0-15)
+FILTER_TYPE_NAMES = {code: name for name, code in FILTER_TYPE_MAP.items()}
+BEQ_SUB_CHANNELS = ("sub1", "sub2", "sub3", "sub4", "sub5")
+CHANNEL_TRIM_KEYS = (
+    "lf", "rf", "c", "lfe", "rs", "ls", "rb", "lb",
+    "ltf", "rtf", "ltm", "rtm", "ltr", "rtr", "lw", "rw", "lfh", "rfh", "lhb", "rhb",
+)
+CHANNEL_TRIM_MIN = -12
+CHANNEL_TRIM_MAX = 12
+CHANNEL_TRIM_STEP = 0.25
+# /speakers/groups entry each trim channel belongs to (None: always present)
+TRIM_CHANNEL_GROUPS = {
+    "lf": "lr", "rf": "lr", "c": "c", "lfe": None,
+    "ls": "lrs", "rs": "lrs", "lb": "lrb", "rb": "lrb",
+    "ltf": "lrtf", "rtf": "lrtf", "ltm": "lrtm", "rtm": "lrtm",
+    "ltr": "lrtr", "rtr": "lrtr", "lw": "lrw", "rw": "lrw",
+    "lfh": "lrfh", "rfh": "lrfh", "lhb": "lrhb", "rhb": "lrhb",
+}
+BEQ_PLAN_CACHE_SIZE = 16  # Memoized load_beq() payloads kept per client
+MAX_CHANGEMSO_CHUNK_BYTES = 65536  # Upper bound for the chunk size option
+MAX_CHANGEMSO_CHUNK_DELAY = 1.0  # Upper bound for the chunk delay option (s)
 
 
 def _num(v):
@@ -25,6 +57,24 @@ def _num(v):
     return v
 
 
+def _peq_slot_ops(slot: int, ch: str, filter_type: int, freq, gain, q) -> list[dict]:
+    """Ops that write one filter into a PEQ slot/channel."""
+    base = f"/peq/slots/{slot}/channels/{ch}"
+    return [
+        {"op": "replace", "path": f"{base}/Fc", "value": _num(freq)},
+        {"op": "replace", "path": f"{base}/gaindB", "value": _num(gain)},
+        {"op": "replace", "path": f"{base}/Q", "value": _num(q)},
+        {"op": "replace", "path": f"{base}/FilterType", "value": filter_type},
+    ]
+
+
+def _beq_slot_clear_ops(slot: int, ch: str) -> list[dict]:
+    """Ops that reset one BEQ-tagged slot/channel back to a flat filter."""
+    return _peq_slot_ops(slot, ch, 0, 100, 0, 1) + [
+        {"op": "remove", "path": f"/peq/slots/{slot}/channels/{ch}/beq"},
+    ]
+
+
 class AioHtp1Exception(Exception):
     pass
 
@@ -37,6 +87,8 @@ class Htp1:
     RECONNECT_DELAY_INITIAL = 3
     RECONNECT_DELAY_MAX = 60
     MSO_WAIT_TIMEOUT = 3
+    CHANGEMSO_CHUNK_BYTES = 4096  # Max encoded size of one changemso frame
+    CHANGEMSO_CHUNK_DELAY = 0.05  # Pause between chunks of one batch (s)
 
     log = getLogger("aiohtp1")
 
@@ -53,26 +105,75 @@ class Htp1:
         self._state_ready = asyncio.Event()
         self._tx: dict[str, Any] | None = None
 
+        # Change counters per top-level subtree ("inputs", "upmix", "cal", ...)
+        # and the values memoized against them, see version().
+        self._epoch = 0
+        self._versions: dict[str, int] = {}
+        self._derived: dict[str, tuple[tuple[int, ...], Any]] = {}
+
+        # Free/user/BEQ slot bitmasks, maintained from mso/msoupdate.
+        self.peq_occupancy = PeqOccupancy()
+
+        # Recent msoupdate values per path; None when history is disabled.
+        self.history: PathHistory | None = None
+
+        # Raw frame recorder, see start_capture().
+        self._recorder: FrameRecorder | None = None
+
+        # Encoded load_beq() batches keyed by filters, subs and slot occupancy.
+        # Each plan is [ops, chunks, minimal]; minimal holds the last diffed
+        # (peq version, op count, chunks) for the default minimal_diff path.
+        self._beq_plans: OrderedDict[tuple, list] = OrderedDict()
+
         self._trying_to_connect = False
         self._ha_stopping = False
 
-        # If True, disable control entities (numbers/selects/buttons) when device is off/standby.
-        # Sensors remain available regardless.
-        self.lock_controls_when_off: bool = True
+        # Availability of control entities; sensors remain available regardless.
+        self.availability = Availability(self)
+
+        # Large changemso batches are split into chunks of this many bytes
+        # (0 disables chunking) with this pause (s) between them.
+        self.changemso_chunk_bytes: int = self.CHANGEMSO_CHUNK_BYTES
+        self.changemso_chunk_delay: float = self.CHANGEMSO_CHUNK_DELAY
+        self.changemso_stats: deque[dict] = deque(maxlen=64)
 
         self.trigger = TriggerManager(self)
 
+        # Accumulating volume_up/volume_down stepper.
+        self.volume_stepper = VolumeStepper(self)
+
+        # Linked parameters, see followers.parse_rules().
+        self.followers = FollowerEngine(self)
+
         self.reset()
 
+    def set_history_size(self, size: int) -> None:
+        """Keep the last `size` changes per path (0 disables history)."""
+        if not size:
+            self.history = None
+        elif self.history is None or self.history.size != size:
+            self.history = PathHistory(size)
+
     def reset(self):
         self._state = None
+        self._epoch += 1
         self._tx = None
+        self.peq_occupancy.rebuild(None)
         self._state_ready.clear()
 
     @property
     def connected(self):
         return self._state_ready.is_set()
 
+    @property
+    def lock_controls_when_off(self) -> bool:
+        """If True, disable control entities (numbers/selects/buttons) when device is off/standby."""
+        return self.availability.lock_controls_when_off
+
+    @lock_controls_when_off.setter
+    def lock_controls_when_off(self, value: bool) -> None:
+        self.availability.lock_controls_when_off = value
+
     #
     # CONNECT
     #
@@ -192,23 +293,14 @@ class Htp1:
                 if msg.type != aiohttp.WSMsgType.TEXT:
                     continue
 
-                data = msg.data
-                if " " not in data:
-                    continue
-
-                cmd, payload = data.split(" ", 1)
-                handler = getattr(self, f"_cmd_{cmd}", None)
-                if not handler:
-                    continue
-
-                try:
-                    await handler(loads(payload))
-                except Exception:
-                    self.log.exception("handler failed")
+                if self._recorder is not None:
+                    self._recorder.record(msg.data)
+                await self._handle_frame(msg.data)
 
         finally:
             # Clear state to avoid exposing stale values after disconnect.
             self._state = None
+            self._epoch += 1
             self._state_ready.clear()
             self._websocket = None
             self._receive_task = None
@@ -219,12 +311,53 @@ class Htp1:
 
             await self._notify("#connection")
 
+    async def _handle_frame(self, data: str) -> None:
+        """Dispatch one text frame ("<cmd> <json>") to its _cmd_ handler."""
+        if " " not in data:
+            return
+
+        cmd, payload = data.split(" ", 1)
+        handler = getattr(self, f"_cmd_{cmd}", None)
+        if not handler:
+            return
+
+        try:
+            await handler(loads(payload))
+        except Exception:
+            self.log.exception("handler failed")
+
+    #
+    # FRAME CAPTURE
+    #
+
+    @property
+    def capturing(self) -> bool:
+        return self._recorder is not None
+
+    def start_capture(self, path: str) -> None:
+        """Record every received text frame to a gzip JSONL file (see capture.py)."""
+        if self._recorder is not None:
+            raise AioHtp1Exception(f"already capturing to {self._recorder.path}")
+        self._recorder = FrameRecorder(path)
+        # Start with the current state so a replay does not depend on having
+        # captured the connect-time mso frame.
+        if self._state is not None:
+            self._recorder.record(f"mso {dumps(self._state, separators=(',', ':'))}")
+
+    def stop_capture(self) -> FrameRecorder | None:
+        """Stop recording; the file is flushed and closed by the writer thread."""
+        recorder, self._recorder = self._recorder, None
+        if recorder is not None:
+            recorder.close(timeout=0)
+        return recorder
+
     #
     # STOP
     #
 
     async def stop(self):
         self._ha_stopping = True
+        self.stop_capture()
         await self._stop_connect()
         await self._disconnect()
         self.reset()
@@ -235,6 +368,8 @@ class Htp1:
 
     async def _cmd_mso(self, payload):
         self._state = payload
+        self._epoch += 1
+        self.peq_occupancy.rebuild(payload)
         self._state_ready.set()
 
 
@@ -247,61 +382,78 @@ class Htp1:
         if not isinstance(payload, list):
             payload = [payload]
 
+        # Apply the whole frame first, then notify, so subscribers always
+        # see the state as of the end of the frame.
+        patcher = jsonpatch.Patcher(self._state, lenient=True)
+        history = self.history
+        # Values as they were when each op applied, for the history: later
+        # ops in the same frame update containers in place.
+        recorded: list[Any] = []
         for piece in payload:
             try:
-                if not isinstance(piece, dict):
-                    continue
-
-                op = piece.get("op")
-                if op not in ("add", "replace", "remove"):
-                    continue
-
-                raw_path = piece.get("path")
-                if not isinstance(raw_path, str) or not raw_path.startswith("/"):
-                    continue
-
-                parts = [p for p in raw_path[1:].split("/") if p]
-                if not parts:
-                    continue
-
-                target = self._state
-                final = parts.pop()
-
-                # Traverse intermediate nodes safely.
-                for node in parts:
-                    if isinstance(target, list):
-                        node = int(node)
-                    target = target[node]
-
-                if op == "remove":
-                    if isinstance(target, dict):
-                        target.pop(final, None)
-                    elif isinstance(target, list):
-                        del target[int(final)]
-                    await self._notify(raw_path, None)
-                    continue
-
-                value = piece.get("value")
-
-                # Apply final assignment, supporting both dict and list targets.
-                if isinstance(target, list):
-                    idx = int(final)
-                    if idx == len(target) and op == "add":
-                        target.append(value)
-                    elif 0 <= idx < len(target):
-                        target[idx] = value
-                    else:
-                        self.log.debug("msoupdate list index out of range: %s", raw_path)
-                        continue
-                else:
-                    target[final] = value
+                patcher.apply_op(piece)
+            except jsonpatch.PatchTestError as err:
+                # Our copy of the state has diverged: drop the rest of the
+                # frame and ask for a fresh snapshot.
+                self.log.warning("msoupdate %s; requesting full state", err)
+                if self._websocket is not None:
+                    await self._websocket.send_str("getmso")
+                break
+            except jsonpatch.PatchError:
+                self.log.debug("msoupdate apply failed: %r", piece, exc_info=True)
+            if history is not None:
+                recorded.extend(
+                    deepcopy(value) if isinstance(value, (dict, list)) else value
+                    for _op, _path, value in patcher.changes[len(recorded):]
+                )
+        self._state = patcher.doc
+
+        # Bump versions for the whole frame before any subscriber reads.
+        versions = self._versions
+        for _op, path, _value in patcher.changes:
+            tokens = jsonpatch.parse_pointer(path)
+            if tokens:
+                versions[tokens[0]] = versions.get(tokens[0], 0) + 1
+            else:
+                self._epoch += 1
+
+        now = time.monotonic()
+        for idx, (op, path, value) in enumerate(patcher.changes):
+            if path == "/peq" or path.startswith("/peq/"):
+                try:
+                    self.peq_occupancy.apply_path(self._state, op, path)
+                except (KeyError, IndexError, TypeError):
+                    # Slot removed again later in the same frame.
+                    self.peq_occupancy.rebuild(self._state)
+            elif not path:
+                self.peq_occupancy.rebuild(self._state)
+            if history is not None:
+                history.record(path, recorded[idx], now)
+            await self._notify(path, value)
+
+    def version(self, *subtrees: str) -> tuple[int, ...]:
+        """Change counter of top-level state subtrees (e.g. "inputs", "cal").
+
+        The tuple differs from any earlier one whenever anything below one
+        of the subtrees may have changed, including a new full snapshot, so
+        values derived from them can be memoized against it.
+        """
+        versions = self._versions
+        return (self._epoch, *[versions.get(s, 0) for s in subtrees])
 
-                await self._notify(raw_path, value)
+    def _memo(self, name: str, subtrees: tuple[str, ...], build: Callable[[], Any]) -> Any:
+        """Value of build(), rebuilt only when one of the subtrees changed.
 
-            except (KeyError, IndexError, ValueError, TypeError):
-                self.log.debug("msoupdate apply failed: %r", piece, exc_info=True)
+        Memoized values are shared between callers and must not be modified.
+        """
+        version = self.version(*subtrees)
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = build()
+        self._derived[name] = (version, value)
+        return value
 
-    
     def subscribe(self, subject, callback):
         """Subscribe to a subject. Callback may be sync or async."""
         subs = self._subscriptions.setdefault(subject, [])
@@ -388,49 +540,15 @@ class Htp1:
         await self._websocket.send_str(msg)
 
 
-
     #
     # ALL PROPERTY ACCESSORS
     #
+    # Plain path accessors (volume, bass_level, video_mode, ...) are generated
+    # from registry.REGISTRY at the end of this module; the ones below need
+    # more than a single path read or write.
+    #
 
 
-    @property
-    def serial_number(self):
-        """Retrieve the HTP-1 device's serial number."""
-        if not self._state:
-            return None
-        versions = self._state.get("versions")
-        if not isinstance(versions, dict):
-            return None
-        return versions.get("SerialNumber")
-
-    @property
-    def cal_vph(self):
-        if not self._state:
-            return None
-        cal = self._state.get("cal")
-        if not isinstance(cal, dict):
-            return None
-        return cal.get("vph")
-
-    @property
-    def cal_vpl(self):
-        if not self._state:
-            return None
-        cal = self._state.get("cal")
-        if not isinstance(cal, dict):
-            return None
-        return cal.get("vpl")
-
-    @property
-    def power_on_vol(self):
-        """Retrieve the HTP-1 power-on volume."""
-        if self._tx is not None and "/powerOnVol" in self._tx:
-            return self._tx["/powerOnVol"]
-        if not self._state:
-            return None
-        return self._state.get("powerOnVol")
-
     @property
     def cal_current_slot_name(self):
         if not self._state:
@@ -458,6 +576,16 @@ class Htp1:
         return name or None
 
 
+    @property
+    def cal_slot_names(self) -> list[str | None]:
+        """Names of the Dirac calibration slots, in slot order."""
+        if not self._state:
+            return []
+        slots = self._state.get("cal", {}).get("slots", [])
+        if not isinstance(slots, list):
+            return []
+        return [slot.get("name") if isinstance(slot, dict) else None for slot in slots]
+
     @property
     def cal_current_dirac_slot(self):
         if not self._state:
@@ -477,59 +605,6 @@ class Htp1:
         self._tx["/cal/currentdiracslot"] = v
 
 
-    @property
-    def loudness_raw(self):
-        if not self._state:
-            return "off"
-        return self._state.get("loudness", "off")
-
-    @property
-    def muted(self):
-        if self._tx is not None and "/muted" in self._tx:
-            return self._tx["/muted"]
-        if not self._state:
-            return False
-        return self._state.get("muted", False)
-
-
-    @muted.setter
-    def muted(self, value):
-        """Set the HTP-1 device's muted value."""
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/muted"] = value
-
-    @property
-    def volume(self):
-        if self._tx is not None and "/volume" in self._tx:
-            return self._tx["/volume"]
-        if not self._state:
-            return None
-        return self._state.get("volume")
-
-
-    @volume.setter
-    def volume(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/volume"] = value
-
-    @property
-    def power(self):
-        if self._tx is not None and "/powerIsOn" in self._tx:
-            return self._tx["/powerIsOn"]
-        if not self._state:
-            return None
-        return self._state.get("powerIsOn")
-
-    @power.setter
-    def power(self, value):
-        """Set the HTP-1 device's power state."""
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/powerIsOn"] = value
-
-
     @property
     def input(self):
         if not self._state:
@@ -553,195 +628,84 @@ class Htp1:
         """Set the HTP-1 device's input."""
         if self._tx is None:
             raise AioHtp1Exception("no transaction in progress")
-        for _id, info in self._state["inputs"].items():
-            if value == info["label"]:
-                self._tx["/input"] = _id
-                return
-        raise AioHtp1Exception(f"input '{value}' not found")
-
-
-    @property
-    def inputs(self):
-        if not self._state:
-            return []
-        try:
-            return [i["label"] for i in self._state["inputs"].values() if i.get("visible")]
-        except Exception:
-            return []
-
+        _id = self._input_ids.get(value)
+        if _id is None:
+            raise AioHtp1Exception(f"input '{value}' not found")
+        self._tx["/input"] = _id
 
     @property
-    def secondary_volume(self):
-        if not self._state:
-            return None
-        try:
-            return self._state["secondaryVolume"]
-        except Exception:
-            return None
+    def _input_ids(self) -> dict[str, str]:
+        """{label: input id}; the first input wins when labels repeat."""
 
-    @secondary_volume.setter
-    def secondary_volume(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/secondaryVolume"] = value
+        def build():
+            ids: dict[str, str] = {}
+            for _id, info in self._state["inputs"].items():
+                ids.setdefault(info["label"], _id)
+            return ids
 
+        return self._memo("input_ids", ("inputs",), build)
 
     @property
-    def secondary_poweron_volume(self):
+    def inputs(self):
         if not self._state:
-            return None
+            return []
         try:
-            return self._state["secondaryPowerOnVolume"]
+            return self._memo(
+                "inputs",
+                ("inputs",),
+                lambda: [i["label"] for i in self._state["inputs"].values() if i.get("visible")],
+            )
         except Exception:
-            return None
-
-    @secondary_poweron_volume.setter
-    def secondary_poweron_volume(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/secondaryPowerOnVolume"] = value
-
-
-    @property
-    def secondary_muted(self):
-        if self._tx is not None and "/secondaryMuted" in self._tx:
-            return self._tx["/secondaryMuted"]
-        if not self._state:
-            return False
-        return self._state.get("secondaryMuted", False)
-
-
-    @secondary_muted.setter
-    def secondary_muted(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/secondaryMuted"] = value
-
-
-    @property
-    def dialnorm(self):
-        if self._tx is not None and "/dialnorm" in self._tx:
-            return self._tx["/dialnorm"]
-        if not self._state:
-            return None
-        return self._state.get("dialnorm")
-
-    @dialnorm.setter
-    def dialnorm(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/dialnorm"] = value
-
+            return []
 
     @property
-    def dialogenh(self):
+    def input_labels(self) -> dict[str, str]:
+        """All inputs as {input id: label}, including hidden ones."""
         if not self._state:
-            return None
+            return {}
         try:
-            return self._state["dialogEnh"]
+            return self._memo(
+                "input_labels",
+                ("inputs",),
+                lambda: {_id: info.get("label", _id) for _id, info in self._state["inputs"].items()},
+            )
         except Exception:
-            return None
-
-    @dialogenh.setter
-    def dialogenh(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/dialogEnh"] = value
-
-
-    @property
-    def dirac_active(self):
-        if not self._state:
-            return None
-        if self._tx is not None and "/cal/diracactive" in self._tx:
-            return self._tx["/cal/diracactive"]
-        cal = self._state.get("cal")
-        if not isinstance(cal, dict):
-            return None
-        return cal.get("diracactive")
-
-    @dirac_active.setter
-    def dirac_active(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/cal/diracactive"] = value
-
-
-    @property
-    def night_mode(self):
-        if not self._state:
-            return None
-        if self._tx is not None and "/night" in self._tx:
-            return self._tx["/night"]
-        return self._state.get("night")
-
-    @night_mode.setter
-    def night_mode(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/night"] = value
-
-
-    @property
-    def upmix(self):
-        if not self._state:
-            return None
-        if self._tx is not None and "/upmix/select" in self._tx:
-            return self._tx["/upmix/select"]
-        upmix = self._state.get("upmix")
-        if not isinstance(upmix, dict):
-            return None
-        return upmix.get("select")
+            return {}
 
 
-    @upmix.setter
-    def upmix(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/upmix/select"] = value
-
     @property
     def upmixes(self):
         if not self._state:
             return []
         try:
-            return [
-                k for k, v in self._state["upmix"].items()
-                if k != "select" and v.get("homevis")
-            ]
+            return self._memo(
+                "upmixes",
+                ("upmix",),
+                lambda: [
+                    k for k, v in self._state["upmix"].items()
+                    if k != "select" and v.get("homevis")
+                ],
+            )
         except Exception:
             return []
 
-    @property
-    def loudness_curve(self):
-        if not self._state:
-            return None
-        if self._tx is not None and "/loudnessCurve" in self._tx:
-            return self._tx["/loudnessCurve"]
-        return self._state.get("loudnessCurve")
-
-    @loudness_curve.setter
-    def loudness_curve(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/loudnessCurve"] = value
 
-    @property
-    def lcvc_selected_curve(self):
-        if not self._state:
-            return None
-        if self._tx is not None and "/lcvc/selectedCurve" in self._tx:
-            return self._tx["/lcvc/selectedCurve"]
-        lcvc = self._state.get("lcvc")
-        if not isinstance(lcvc, dict):
-            return None
-        return lcvc.get("selectedCurve")
+    def set_loudness_curve_selection(self, raw: str) -> None:
+        """Select a loudness curve (iso, vintage, vintageCustom) in the current transaction.
 
-    @lcvc_selected_curve.setter
-    def lcvc_selected_curve(self, value):
+        Vintage Custom parameters are saved when switching away from it and
+        restored when switching back; plain Vintage resets to the defaults.
+        """
         if self._tx is None:
             raise AioHtp1Exception("no transaction in progress")
-        self._tx["/lcvc/selectedCurve"] = value
+        if self.lcvc_selected_curve == "vintageCustom" and raw != "vintageCustom":
+            self.save_lcvc_params()
+        self.loudness_curve = "vintage" if raw == "vintageCustom" else raw
+        self.lcvc_selected_curve = raw
+        if raw == "vintageCustom":
+            self.restore_lcvc_saved_params()
+        elif raw == "vintage":
+            self.reset_lcvc_vintage_defaults()
 
     _LCVC_VINTAGE_DEFAULTS = {
         "/lcvc/freq":     20,
@@ -794,608 +758,181 @@ class Htp1:
             raise AioHtp1Exception("no transaction in progress")
         self._tx.update(self._LCVC_VINTAGE_DEFAULTS)
 
-    @property
-    def bass_level(self):
-        if not self._state:
-            return None
-        try:
-            return self._state["eq"]["bass"]["level"]
-        except Exception:
-            return None
 
-    @bass_level.setter
-    def bass_level(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/eq/bass/level"] = value
+    # ------------------------------------------------------------------
+    # Channel trims
+    # ------------------------------------------------------------------
 
     @property
-    def bass_frequency(self):
-        if not self._state:
-            return None
+    def channel_trims(self) -> dict[str, float]:
+        """All channel trims as {channel key: dB}, including staged writes."""
         try:
-            return self._state["eq"]["bass"]["freq"]
+            trims = dict(self._state["channeltrim"]["channels"])
         except Exception:
-            return None
-
-    @bass_frequency.setter
-    def bass_frequency(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/eq/bass/freq"] = value
+            return {}
+        if self._tx:
+            for ch in trims:
+                path = f"/channeltrim/channels/{ch}"
+                if path in self._tx:
+                    trims[ch] = self._tx[path]
+        return trims
 
     @property
-    def treble_level(self):
-        if not self._state:
-            return None
-        try:
-            return self._state["eq"]["treble"]["level"]
-        except Exception:
-            return None
+    def active_trim_channels(self) -> tuple[str, ...]:
+        """Trim channels whose speaker group is present in the current layout.
 
-    @treble_level.setter
-    def treble_level(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/eq/treble/level"] = value
-
-    @property
-    def treble_frequency(self):
-        if not self._state:
-            return None
+        Channels of groups the device does not report are kept, so an
+        unknown layout never hides controls.
+        """
+        try:
+            groups = self._state["speakers"]["groups"]
+        except (KeyError, TypeError):
+            return CHANNEL_TRIM_KEYS
+        if not isinstance(groups, dict):
+            return CHANNEL_TRIM_KEYS
+        active = []
+        for ch in CHANNEL_TRIM_KEYS:
+            group = groups.get(TRIM_CHANNEL_GROUPS.get(ch))
+            if not isinstance(group, dict) or group.get("present", True):
+                active.append(ch)
+        return tuple(active)
+
+    def channel_trim(self, channel: str) -> float | None:
         try:
-            return self._state["eq"]["treble"]["freq"]
+            return self._state["channeltrim"]["channels"][channel]
         except Exception:
             return None
 
-    @treble_frequency.setter
-    def treble_frequency(self, value):
+    def set_channel_trim(self, channel: str, value) -> None:
         if self._tx is None:
             raise AioHtp1Exception("no transaction in progress")
-        self._tx["/eq/treble/freq"] = value
+        self._tx[f"/channeltrim/channels/{channel}"] = value
+
+    def validate_channel_trims(self, trims: dict[str, Any]) -> dict[str, float]:
+        """Check trims against the device's channels and range, snapped to the step."""
+        channels = self.channel_trims
+        resolved = {}
+        for ch, value in trims.items():
+            if ch not in channels:
+                raise AioHtp1Exception(f"unknown trim channel '{ch}'")
+            trim = _num(round(float(value) / CHANNEL_TRIM_STEP) * CHANNEL_TRIM_STEP)
+            if not CHANNEL_TRIM_MIN <= trim <= CHANNEL_TRIM_MAX:
+                raise AioHtp1Exception(
+                    f"trim {trim} dB for {ch} outside {CHANNEL_TRIM_MIN}..{CHANNEL_TRIM_MAX} dB"
+                )
+            resolved[ch] = trim
+        return resolved
 
-    @property
-    def tone_control(self):
-        if not self._state:
-            return False
-        try:
-            return self._state["eq"]["tc"]
-        except Exception:
-            return False
+    def set_channel_trims(self, trims: dict[str, Any]) -> dict[str, float]:
+        """Stage any subset of channel trims in the current transaction.
 
-    @tone_control.setter
-    def tone_control(self, value: bool):
+        All values are validated before any is staged. Returns the staged
+        {channel key: dB} mapping.
+        """
         if self._tx is None:
             raise AioHtp1Exception("no transaction in progress")
-        self._tx["/eq/tc"] = value
+        resolved = self.validate_channel_trims(trims)
+        for ch, trim in resolved.items():
+            self._tx[f"/channeltrim/channels/{ch}"] = trim
+        return resolved
 
-    @property
-    def widesynth(self):
-        if not self._state:
-            return False
-        try:
-            return self._state["upmix"]["dts"]["ws"]
-        except Exception:
-            return False
+    # ------------------------------------------------------------------
+    # BEQ (Bass EQ) support
+    # ------------------------------------------------------------------
 
-    @widesynth.setter
-    def widesynth(self, value: bool):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/upmix/dts/ws"] = value
 
     @property
-    def aurohs(self):
-        if not self._state:
-            return False
-        return self._state["upmix"]["auro"]["highSides"] == "on"           
-
-    @aurohs.setter
-    def aurohs(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/upmix/auro/highSides"] = "on" if value else "off"
+    def beq_filters(self) -> list[dict]:
+        """BEQ-tagged filters currently in the PEQ slots, in slot order.
 
-    @property
-    def loudness_cal(self):
+        Read from the first BEQ sub channel; returned in the catalogue's
+        type/freq/gain/q form so they can be fed to peq_response.
+        """
         if not self._state:
-            return None
-        return self._state.get("loudnessCal")
+            return []
+        slots = self._state.get("peq", {}).get("slots", [])
+        ch = self._get_sub_channels()[0]
+        filters = []
+        for i in iter_bits(self.peq_occupancy.beq(ch)):
+            ch_data = slots[i]["channels"][ch]
+            filters.append(
+                {
+                    "type": FILTER_TYPE_NAMES.get(ch_data.get("FilterType", 0), "PeakingEQ"),
+                    "freq": ch_data.get("Fc", 100),
+                    "gain": ch_data.get("gaindB", 0),
+                    "q": ch_data.get("Q", 1),
+                }
+            )
+        return filters
+
+    async def send_raw_ops(self, ops: list[dict], chunked: bool = True) -> bool:
+        """Send a list of raw JSON-Patch ops via changemso.
+
+        Large batches are split into size-bounded chunks (see
+        _encode_changemso) and sent in order with a pause between chunks.
+        With chunked=False the ops always go out as one frame, for batches
+        the device must apply all at once or not at all.
+        """
+        if not ops:
+            return True
+        limit = self.changemso_chunk_bytes if chunked else 0
+        return await self._send_changemso(self._encode_changemso(ops, limit))
 
-    @loudness_cal.setter
-    def loudness_cal(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/loudnessCal"] = value
-
-    @property
-    def loudness_status(self):
-        if not self._state:
-            return False
-        return self._state.get("loudness") == "on"
-
-
-    @loudness_status.setter
-    def loudness_status(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-
-        self._tx["/loudness"] = "on" if value else "off"
-
-
-    @property
-    def lipsync_delay(self):
-        if not self._state:
-            return None
-        try:
-            return self._state["cal"]["lipsync"]
-        except Exception:
-            return None
-
-    @lipsync_delay.setter
-    def lipsync_delay(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/cal/lipsync"] = value
-
-    @property
-    def display_brightness(self):
-        if not self._state:
-            return None
-        try:
-            return self._state["hw"]["fpBright"]
-        except Exception:
-            return None
-
-    @display_brightness.setter
-    def display_brightness(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/hw/fpBright"] = value
-
-
-    @property
-    def video_resolution(self):
-        try:
-            return self._state["videostat"]["VideoResolution"]
-        except Exception:
-            return None
-
-    @property
-    def video_colorspace(self):
-        try:
-            return self._state["videostat"]["VideoColorSpace"]
-        except Exception:
-            return None
-
-    @property
-    def video_mode(self):
-        try:
-            return self._state["videostat"]["VideoMode"]
-        except Exception:
-            return None
-
-    @property
-    def video_bitdepth(self):
-        try:
-            return self._state["videostat"]["VideoBitDepth"]
-        except Exception:
-            return None
-
-    @property
-    def video_hdrstatus(self):
-        try:
-            value = self._state["videostat"].get("HDRstatus")
-            return value if value else "SDR"
-        except Exception:
-            return "SDR"
-
-    @property
-    def peq_status(self):
-        try:
-            return self._state["peq"]["peqsw"]
-        except Exception:
-            return None
-
-    @property
-    def sourceprogram(self):
-        try:
-            return self._state["status"]["DECSourceProgram"]
-        except Exception:
-            return None
-
-    @property
-    def surroundmode(self):
-        try:
-            return self._state["status"]["SurroundMode"]
-        except Exception:
-            return None
-
-    @property
-    def decsamplerate(self):
-        try:
-            return self._state["status"]["DECSampleRate"]
-        except Exception:
-            return None
-
-    @property
-    def decprogramformat(self):
-        try:
-            return self._state["status"]["DECProgramFormat"]
-        except Exception:
-            return None
-
-    @property
-    def enclisteningformat(self):
-        try:
-            return self._state["status"]["ENCListeningFormat"]
-        except Exception:
-            return None
-
-    @property
-    def currentlayout(self):
-        try:
-            return self._state["cal"]["currentLayout"]
-        except Exception:
-            return None
-
-
-    @property
-    def channeltrim_left(self):
-        try:
-            return self._state["channeltrim"]["channels"]["lf"]
-        except Exception:
-            return None
-
-    @channeltrim_left.setter
-    def channeltrim_left(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/lf"] = value
-
-
-    @property
-    def channeltrim_right(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rf"]
-        except Exception:
-            return None
-
-    @channeltrim_right.setter
-    def channeltrim_right(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rf"] = value
-
-
-    @property
-    def channeltrim_center(self):
-        try:
-            return self._state["channeltrim"]["channels"]["c"]
-        except Exception:
-            return None
-
-    @channeltrim_center.setter
-    def channeltrim_center(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/c"] = value
-
-
-    @property
-    def channeltrim_lfe(self):
-        try:
-            return self._state["channeltrim"]["channels"]["lfe"]
-        except Exception:
-            return None
-
-    @channeltrim_lfe.setter
-    def channeltrim_lfe(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/lfe"] = value
-
-
-    @property
-    def channeltrim_rightsurround(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rs"]
-        except Exception:
-            return None
-
-    @channeltrim_rightsurround.setter
-    def channeltrim_rightsurround(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rs"] = value
-
-
-    @property
-    def channeltrim_leftsurround(self):
-        try:
-            return self._state["channeltrim"]["channels"]["ls"]
-        except Exception:
-            return None
-
-    @channeltrim_leftsurround.setter
-    def channeltrim_leftsurround(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/ls"] = value
-
-
-    @property
-    def channeltrim_rightback(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rb"]
-        except Exception:
-            return None
-
-    @channeltrim_rightback.setter
-    def channeltrim_rightback(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rb"] = value
-
-
-    @property
-    def channeltrim_leftback(self):
-        try:
-            return self._state["channeltrim"]["channels"]["lb"]
-        except Exception:
-            return None
-
-    @channeltrim_leftback.setter
-    def channeltrim_leftback(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/lb"] = value
-
-
-
-    @property
-    def channeltrim_ltf(self):
-        try:
-            return self._state["channeltrim"]["channels"]["ltf"]
-        except Exception:
-            return None
-
-    @channeltrim_ltf.setter
-    def channeltrim_ltf(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/ltf"] = value
-
-
-    @property
-    def channeltrim_rtf(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rtf"]
-        except Exception:
-            return None
-
-    @channeltrim_rtf.setter
-    def channeltrim_rtf(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rtf"] = value
-
-
-    @property
-    def channeltrim_ltm(self):
-        try:
-            return self._state["channeltrim"]["channels"]["ltm"]
-        except Exception:
-            return None
-
-    @channeltrim_ltm.setter
-    def channeltrim_ltm(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/ltm"] = value
+    def _encode_changemso(
+        self, ops: list[dict], limit: int | None = None
+    ) -> list[tuple[int, str]]:
+        """Encode ops into JSON arrays of at most limit bytes each.
 
-
-    @property
-    def channeltrim_rtm(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rtm"]
-        except Exception:
-            return None
-
-    @channeltrim_rtm.setter
-    def channeltrim_rtm(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rtm"] = value
-
-
-    @property
-    def channeltrim_ltr(self):
-        try:
-            return self._state["channeltrim"]["channels"]["ltr"]
-        except Exception:
-            return None
-
-    @channeltrim_ltr.setter
-    def channeltrim_ltr(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/ltr"] = value
-
-
-    @property
-    def channeltrim_rtr(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rtr"]
-        except Exception:
-            return None
-
-    @channeltrim_rtr.setter
-    def channeltrim_rtr(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rtr"] = value
-
-
-    @property
-    def channeltrim_lw(self):
-        try:
-            return self._state["channeltrim"]["channels"]["lw"]
-        except Exception:
-            return None
-
-    @channeltrim_lw.setter
-    def channeltrim_lw(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/lw"] = value
-
-
-    @property
-    def channeltrim_rw(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rw"]
-        except Exception:
-            return None
-
-    @channeltrim_rw.setter
-    def channeltrim_rw(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rw"] = value
-
-
-    @property
-    def channeltrim_lfh(self):
-        try:
-            return self._state["channeltrim"]["channels"]["lfh"]
-        except Exception:
-            return None
-
-    @channeltrim_lfh.setter
-    def channeltrim_lfh(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/lfh"] = value
-
-
-    @property
-    def channeltrim_rfh(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rfh"]
-        except Exception:
-            return None
-
-    @channeltrim_rfh.setter
-    def channeltrim_rfh(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rfh"] = value
-
-
-    @property
-    def channeltrim_lhb(self):
-        try:
-            return self._state["channeltrim"]["channels"]["lhb"]
-        except Exception:
-            return None
-
-    @channeltrim_lhb.setter
-    def channeltrim_lhb(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/lhb"] = value
-
-
-    @property
-    def channeltrim_rhb(self):
-        try:
-            return self._state["channeltrim"]["channels"]["rhb"]
-        except Exception:
-            return None
-
-    @channeltrim_rhb.setter
-    def channeltrim_rhb(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/channeltrim/channels/rhb"] = value
-
-    # ------------------------------------------------------------------
-    # Seat Shaker
-    # ------------------------------------------------------------------
-
-    @property
-    def shaker_mute(self) -> bool:
-        try:
-            val = self._state["shaker"]["mute"]
-            if isinstance(val, str):
-                return val.lower() == "on"
-            return bool(val)
-        except Exception:
-            return False
-
-    @shaker_mute.setter
-    def shaker_mute(self, value: bool):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/shaker/mute"] = "on" if value else "off"
-
-    @property
-    def shaker_trim(self):
-        try:
-            return self._state["shaker"]["trim"]
-        except Exception:
-            return None
-
-    @shaker_trim.setter
-    def shaker_trim(self, value):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/shaker/trim"] = value
-
-    @property
-    def shaker_active_preset(self) -> str | None:
-        try:
-            val = self._state["shaker"]["activePreset"]
-            # false means no preset is active
-            if val is False or val is None:
-                return None
-            return str(int(val))
-        except Exception:
-            return None
-
-    @shaker_active_preset.setter
-    def shaker_active_preset(self, value: str):
-        if self._tx is None:
-            raise AioHtp1Exception("no transaction in progress")
-        self._tx["/shaker/activePreset"] = int(value)
-
-    @property
-    def shaker_output(self) -> str | None:
-        try:
-            return self._state["shaker"]["output"]
-        except Exception:
-            return None
-
-    # ------------------------------------------------------------------
-    # BEQ (Bass EQ) support
-    # ------------------------------------------------------------------
-
-    @property
-    def beq_active(self) -> str | None:
-        """Title of the currently loaded BEQ filter, or None."""
-        if not self._state:
-            return None
-        return self._state.get("peq", {}).get("beqActive")
-
-    async def send_raw_ops(self, ops: list[dict]) -> bool:
-        """Send a list of raw JSON-Patch ops via changemso."""
-        if not ops:
-            return True
+        limit defaults to changemso_chunk_bytes; 0 puts all ops in one
+        chunk. Ops are never reordered or split; a single op larger than
+        the limit gets a chunk of its own. Returns (op_count, payload) pairs.
+        """
+        if limit is None:
+            limit = self.changemso_chunk_bytes
+        chunks: list[tuple[int, str]] = []
+        parts: list[str] = []
+        size = 2  # surrounding brackets
+        for op in ops:
+            encoded = dumps(op, separators=(",", ":"))
+            if parts and limit and size + len(encoded) + 1 > limit:
+                chunks.append((len(parts), "[" + ",".join(parts) + "]"))
+                parts = []
+                size = 2
+            parts.append(encoded)
+            size += len(encoded) + 1
+        if parts:
+            chunks.append((len(parts), "[" + ",".join(parts) + "]"))
+        return chunks
+
+    async def _send_changemso(self, chunks: list[tuple[int, str]]) -> bool:
+        """Send pre-encoded changemso chunks in order, pacing between them.
+
+        Per-chunk send timing is kept in changemso_stats for tuning the
+        chunk size and delay against the device.
+        """
         if not self._websocket:
             raise AioHtp1Exception("Not connected")
-        payload = dumps(ops, separators=(",", ":"))
-        await self._websocket.send_str(f"changemso {payload}")
+        last = len(chunks) - 1
+        for idx, (count, payload) in enumerate(chunks):
+            if not self._websocket:
+                raise AioHtp1Exception("Not connected")
+            started = time.monotonic()
+            await self._websocket.send_str(f"changemso {payload}")
+            self.changemso_stats.append(
+                {
+                    "chunk": idx + 1,
+                    "chunks": last + 1,
+                    "ops": count,
+                    "bytes": len(payload),
+                    "send_ms": round((time.monotonic() - started) * 1000, 3),
+                }
+            )
+            if idx < last and self.changemso_chunk_delay > 0:
+                await asyncio.sleep(self.changemso_chunk_delay)
+        if last > 0:
+            self.log.debug(
+                "changemso sent in %d chunks: %s", last + 1, list(self.changemso_stats)[-(last + 1):]
+            )
         return True
 
     def _get_sub_channels(self) -> list[str]:
@@ -1421,17 +958,9 @@ class Htp1:
         """Find the first empty PEQ slot (0-15), skipping user filters."""
         if not self._state:
             return None
-        peq = self._state.get("peq", {})
-        slots = peq.get("slots", [])
         sub_channels = self._get_sub_channels()
         ch = sub_channels[0] if sub_channels else "sub1"
-        for i in range(start_slot, min(BEQ_SLOT_COUNT, len(slots))):
-            ch_data = slots[i].get("channels", {}).get(ch, {})
-            if (ch_data.get("gaindB", 0) == 0
-                    and ch_data.get("FilterType", 0) not in GAIN_INDEPENDENT_FILTER_TYPES
-                    and not ch_data.get("beq")):
-                return i
-        return None
+        return self.peq_occupancy.first_free(ch, start_slot)
 
     async def clear_beq(self) -> bool:
         """Clear all BEQ-tagged filters from all PEQ slots on all sub channels.
@@ -1441,23 +970,8 @@ class Htp1:
         """
         if not self._state:
             return False
-        ops: list[dict] = []
+        ops = self._beq_clear_ops()
         peq = self._state.get("peq", {})
-        slots = peq.get("slots", [])
-        all_subs = ["sub1", "sub2", "sub3", "sub4", "sub5"]
-
-        for i in range(min(16, len(slots))):
-            channels = slots[i].get("channels", {})
-            for ch in all_subs:
-                ch_data = channels.get(ch, {})
-                if ch_data.get("beq"):
-                    ops.extend([
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/Fc", "value": 100},
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/gaindB", "value": 0},
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/Q", "value": 1},
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/FilterType", "value": 0},
-                        {"op": "remove", "path": f"/peq/slots/{i}/channels/{ch}/beq"},
-                    ])
 
         if "beqActive" in peq:
             ops.append({"op": "remove", "path": "/peq/beqActive"})
@@ -1466,42 +980,40 @@ class Htp1:
             return await self.send_raw_ops(ops)
         return True
 
-    async def load_beq(self, title: str, filters: list[dict]) -> bool:
-        """Load BEQ filters into available PEQ slots on all active sub channels.
-
-        Matches WebUI BassEq.vue behavior: starts from slot 0, skips slots
-        that have user filters (gaindB != 0 without beq flag).
-        Builds a single atomic changemso batch: clear existing BEQ-tagged
-        slots, write new filter data, set beqActive, enable PEQ.
-        """
-        if not self._state:
-            return False
-
-        sub_channels = self._get_sub_channels()
-        if not sub_channels:
-            return False
-
+    def _beq_clear_ops(self) -> list[dict]:
+        """Ops resetting every BEQ-tagged slot on sub1-sub5, in slot order."""
+        occupancy = self.peq_occupancy
+        tagged = {ch: occupancy.beq(ch) for ch in BEQ_SUB_CHANNELS}
         ops: list[dict] = []
-        all_subs = ["sub1", "sub2", "sub3", "sub4", "sub5"]
+        for i in iter_bits(occupancy.beq_any(BEQ_SUB_CHANNELS)):
+            for ch in BEQ_SUB_CHANNELS:
+                if tagged[ch] >> i & 1:
+                    ops.extend(_beq_slot_clear_ops(i, ch))
+        return ops
+
+    def _beq_occupancy_fingerprint(self, channels) -> tuple:
+        """Summarise the PEQ slot state that BEQ op generation depends on.
 
+        The free and BEQ slot masks of the given channels, the slot count
+        and the presence of beqActive fully determine the generated op list.
+        """
+        occupancy = self.peq_occupancy
+        return (
+            occupancy.slot_count,
+            "beqActive" in self._state.get("peq", {}),
+            occupancy.snapshot(channels),
+        )
+
+    def _build_beq_ops(
+        self, title: str, filters: list[dict], sub_channels: list[str]
+    ) -> list[dict]:
+        """Build the clear + write op list used by load_beq()."""
+        occupancy = self.peq_occupancy
         peq = self._state.get("peq", {})
-        slots = peq.get("slots", [])
 
         # Phase 1: clear all existing BEQ-tagged entries (all 16 slots, all 5 subs).
-        cleared_slots: set[int] = set()
-        for i in range(min(BEQ_SLOT_COUNT, len(slots))):
-            channels = slots[i].get("channels", {})
-            for ch in all_subs:
-                ch_data = channels.get(ch, {})
-                if ch_data.get("beq"):
-                    ops.extend([
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/Fc", "value": 100},
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/gaindB", "value": 0},
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/Q", "value": 1},
-                        {"op": "replace", "path": f"/peq/slots/{i}/channels/{ch}/FilterType", "value": 0},
-                        {"op": "remove", "path": f"/peq/slots/{i}/channels/{ch}/beq"},
-                    ])
-                    cleared_slots.add(i)
+        ops = self._beq_clear_ops()
+        cleared = occupancy.beq_any(BEQ_SUB_CHANNELS)
 
         if "beqActive" in peq:
             ops.append({"op": "remove", "path": "/peq/beqActive"})
@@ -1509,44 +1021,228 @@ class Htp1:
         # Phase 2+3: find available slots and write BEQ filters per channel.
         # Each channel finds its own free slots independently, matching
         # WebUI BassEq.vue applyBeqFilters() behavior.
-        num_slots = min(BEQ_SLOT_COUNT, len(slots))
         for ch in sub_channels:
-            slot = 0
+            available = iter_bits(occupancy.free(ch) | cleared)
             for filt in filters:
-                # Find next available slot for this channel
-                while slot < num_slots:
-                    if slot in cleared_slots:
-                        break
-                    ch_data = slots[slot].get("channels", {}).get(ch, {})
-                    if (ch_data.get("gaindB", 0) == 0
-                            and ch_data.get("FilterType", 0) not in GAIN_INDEPENDENT_FILTER_TYPES):
-                        break
-                    slot += 1
-                if slot >= num_slots:
+                slot = next(available, None)
+                if slot is None:
                     self.log.warning("No more empty PEQ slots for BEQ on %s", ch)
                     break
 
-                ft = FILTER_TYPE_MAP.get(filt.get("type", "PeakingEQ"), 0)
-                freq = _num(filt.get("freq", 100))
-                gain = _num(filt.get("gain", 0))
-                q = _num(filt.get("q", 1))
-                ops.extend([
-                    {"op": "replace", "path": f"/peq/slots/{slot}/channels/{ch}/Fc", "value": freq},
-                    {"op": "replace", "path": f"/peq/slots/{slot}/channels/{ch}/gaindB", "value": gain},
-                    {"op": "replace", "path": f"/peq/slots/{slot}/channels/{ch}/Q", "value": q},
-                    {"op": "replace", "path": f"/peq/slots/{slot}/channels/{ch}/FilterType", "value": ft},
-                    {"op": "add", "path": f"/peq/slots/{slot}/channels/{ch}/beq", "value": True},
-                ])
-                slot += 1
+                ops.extend(_peq_slot_ops(
+                    slot,
+                    ch,
+                    FILTER_TYPE_MAP.get(filt.get("type", "PeakingEQ"), 0),
+                    filt.get("freq", 100),
+                    filt.get("gain", 0),
+                    filt.get("q", 1),
+                ))
+                ops.append(
+                    {"op": "add", "path": f"/peq/slots/{slot}/channels/{ch}/beq", "value": True}
+                )
 
         ops.extend([
             {"op": "add", "path": "/peq/beqActive", "value": title},
             {"op": "replace", "path": "/peq/peqsw", "value": True},
         ])
+        return ops
+
+    def lookup(self, path: str) -> tuple[bool, Any]:
+        """Public form of _lookup(): (found, value) for a JSON-Patch path."""
+        return self._lookup(path)
+
+    def _lookup(self, path: str) -> tuple[bool, Any]:
+        """Resolve a JSON-Patch path against the current state.
+
+        Returns (found, value); found is False when any segment is missing.
+        """
+        node = self._state
+        try:
+            for part in map(unescape, path[1:].split("/")):
+                if isinstance(node, list):
+                    node = node[int(part)]
+                else:
+                    node = node[part]
+        except (KeyError, IndexError, ValueError, TypeError):
+            return False, None
+        return True, node
+
+    def _minimize_ops(self, ops: list[dict]) -> list[dict]:
+        """Reduce an op list to the ops that actually change the current state.
+
+        Later ops on the same path supersede earlier ones (e.g. a BEQ clear
+        followed by a rewrite of the same slot), then every remaining op is
+        compared with the live value and dropped when it would be a no-op.
+        """
+        final: dict[str, dict] = {}
+        for op in ops:
+            final.pop(op["path"], None)
+            final[op["path"]] = op
+
+        minimal: list[dict] = []
+        for path, op in final.items():
+            found, current = self._lookup(path)
+            if op["op"] == "remove":
+                if found:
+                    minimal.append(op)
+            elif not found or not same(current, op["value"]):
+                minimal.append(op)
+        return minimal
+
+    async def load_beq(
+        self, title: str, filters: list[dict], minimal_diff: bool = True
+    ) -> bool:
+        """Load BEQ filters into available PEQ slots on all active sub channels.
+
+        Matches WebUI BassEq.vue behavior: starts from slot 0, skips slots
+        that have user filters (gaindB != 0 without beq flag).
+        Builds one changemso batch (split into chunks by send_raw_ops'
+        size limit): clear existing BEQ-tagged slots, write new filter
+        data, set beqActive, enable PEQ.
+
+        The encoded batch is memoized on the filter set, the active sub
+        channels and the current slot occupancy, so reloading a title onto
+        an unchanged PEQ layout skips op generation and encoding.
+
+        With minimal_diff the batch is compared against the live /peq state
+        and only ops that change a value are sent, so switching between
+        titles with overlapping filters does not rewrite identical slots.
+        The diffed batch is memoized as well, against the /peq version, so
+        it is only recomputed after the PEQ state changed.
+        """
+        if not self._state:
+            return False
+
+        sub_channels = self._get_sub_channels()
+        if not sub_channels:
+            return False
 
-        self.log.info("BEQ sending %d ops for %s", len(ops), title)
-        self.log.debug("BEQ ops: %s", dumps(ops, separators=(",", ":")))
-        success = await self.send_raw_ops(ops)
+        key = (
+            title,
+            tuple(
+                (f.get("type", "PeakingEQ"), f.get("freq", 100), f.get("gain", 0), f.get("q", 1))
+                for f in filters
+            ),
+            tuple(sub_channels),
+            self.changemso_chunk_bytes,
+            self._beq_occupancy_fingerprint(
+                tuple(dict.fromkeys(BEQ_SUB_CHANNELS + tuple(sub_channels)))
+            ),
+        )
+
+        plan = self._beq_plans.get(key)
+        if plan is not None:
+            self._beq_plans.move_to_end(key)
+            self.log.debug("BEQ plan cache hit for %s", title)
+        else:
+            ops = self._build_beq_ops(title, filters, sub_channels)
+            plan = [ops, self._encode_changemso(ops), None]
+            self._beq_plans[key] = plan
+            if len(self._beq_plans) > BEQ_PLAN_CACHE_SIZE:
+                self._beq_plans.popitem(last=False)
+
+        ops, chunks, minimal = plan
+        if minimal_diff:
+            version = self.version("peq")
+            if minimal is None or minimal[0] != version:
+                minimal_ops = self._minimize_ops(ops)
+                minimal = plan[2] = (
+                    version, len(minimal_ops), self._encode_changemso(minimal_ops)
+                )
+            _, count, chunks = minimal
+            self.log.info("BEQ switch to %s: %d ops (full batch %d)", title, count, len(ops))
+            if not count:
+                return True
+        else:
+            self.log.info("BEQ sending %d ops for %s", len(ops), title)
+
+        self.log.debug("BEQ ops: %s", [payload for _, payload in chunks])
+        success = await self._send_changemso(chunks)
         if success:
             self.log.info("BEQ loaded: %s (%d filters)", title, len(filters))
         return success
+
+    # ------------------------------------------------------------------
+    # User PEQ
+    # ------------------------------------------------------------------
+
+    @property
+    def peq_channels(self) -> list[str]:
+        """Channel keys present in the PEQ slots."""
+        if not self._state:
+            return []
+        channels: dict[str, None] = {}
+        for slot in self._state.get("peq", {}).get("slots", [])[:BEQ_SLOT_COUNT]:
+            channels.update(dict.fromkeys(slot.get("channels", {})))
+        return list(channels)
+
+    async def import_peq(
+        self, filters: list[dict], channels: list[str], clear_remaining: bool = True
+    ) -> int:
+        """Write user PEQ filters to the given channels in one changemso frame.
+
+        Filters fill each channel's non-BEQ slots from slot 0 up; BEQ-tagged
+        slots are left alone. With clear_remaining, user filters in the
+        slots after the imported ones are flattened, so the import replaces
+        the channel's previous correction. Only ops that change the live
+        state are sent. The frame is never chunked (see send_raw_ops), so
+        the device cannot end up with half an import applied. Returns the
+        number of ops sent.
+        """
+        if not self._state:
+            raise AioHtp1Exception("Not connected")
+
+        known = self.peq_channels
+        unknown = [ch for ch in channels if ch not in known]
+        if unknown:
+            raise AioHtp1Exception(f"Unknown PEQ channel(s): {', '.join(unknown)}")
+
+        occupancy = self.peq_occupancy
+        ops: list[dict] = []
+        for ch in channels:
+            slots = list(iter_bits(occupancy.free(ch) | occupancy.user(ch)))
+            if len(filters) > len(slots):
+                raise AioHtp1Exception(
+                    f"{len(filters)} filters do not fit the {len(slots)} non-BEQ PEQ slots on {ch}"
+                )
+            for slot, filt in zip(slots, filters):
+                ops.extend(_peq_slot_ops(
+                    slot, ch, FILTER_TYPE_MAP[filt["type"]], filt["freq"], filt["gain"], filt["q"]
+                ))
+            if clear_remaining:
+                user = occupancy.user(ch)
+                for slot in slots[len(filters):]:
+                    if user >> slot & 1:
+                        ops.extend(_peq_slot_ops(slot, ch, 0, 100, 0, 1))
+        ops.append({"op": "replace", "path": "/peq/peqsw", "value": True})
+
+        ops = self._minimize_ops(ops)
+        self.log.info(
+            "PEQ import: %d filters on %s, %d ops", len(filters), ", ".join(channels), len(ops)
+        )
+        if ops:
+            await self.send_raw_ops(ops, chunked=False)
+        return len(ops)
+
+    def peq_snapshot(self) -> dict | None:
+        """Deep copy of the current /peq subtree, or None when unknown."""
+        if not self._state or not isinstance(self._state.get("peq"), dict):
+            return None
+        return deepcopy(self._state["peq"])
+
+    async def restore_peq(self, peq: dict) -> int:
+        """Bring the live /peq subtree to a saved snapshot in one changemso frame.
+
+        Only the replace/add/remove ops needed to go from the live state to
+        the snapshot are sent, unchunked (see send_raw_ops), so the restore
+        is applied as a whole. Returns the number of ops sent.
+        """
+        if not self._state:
+            raise AioHtp1Exception("Not connected")
+        ops = diff(self._state.get("peq", {}), peq, "/peq")
+        if ops:
+            await self.send_raw_ops(ops, chunked=False)
+        return len(ops)
+
+
+registry.install(Htp1, AioHtp1Exception)
@@ -0,0 +1,118 @@
+"""Availability of HTP-1 control entities, computed once per device."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aiohtp1 import Htp1
+
+# Availability classes. Each entity belongs to exactly one.
+CONNECTED = "connected"  # connected (power switch, local toggles)
+POWERED = "powered"  # connected and not in standby (master volume)
+CONTROL = "control"  # connected, unless in standby while controls are locked
+SHAKER = "shaker"  # CONTROL, and the shaker output is on
+MIX_OUT = "mix_out"  # CONTROL, and Mix Out is not routed to the shaker
+
+CLASSES = (CONNECTED, POWERED, CONTROL, SHAKER, MIX_OUT)
+
+# Device paths the classes depend on, besides the connection.
+INPUT_PATHS = ("/powerIsOn", "/shaker/output")
+
+MIX_OUT_SHAKER_ROUTES = ("mono17", "diff17")
+
+
+class Availability:
+    """Shared availability model for one device.
+
+    The classes are recomputed when power, shaker routing or the UI lock
+    change, and only the listeners of classes that flipped are called. A
+    connection change calls every listener: the fresh state snapshot does
+    not notify individual paths, so entities also need it to refresh their
+    values.
+    """
+
+    def __init__(self, htp1: Htp1) -> None:
+        self._htp1 = htp1
+        self._lock_controls_when_off = True
+        self._state = dict.fromkeys(CLASSES, False)
+        self._listeners: dict[str, list[Callable[[], None]]] = {c: [] for c in CLASSES}
+        self.recomputes = 0
+        self.flips = 0
+
+        for path in INPUT_PATHS:
+            htp1.subscribe(path, self._on_input)
+        htp1.subscribe("#connection", self._on_connection)
+
+    @property
+    def lock_controls_when_off(self) -> bool:
+        """Disable control entities while the device is in standby."""
+        return self._lock_controls_when_off
+
+    @lock_controls_when_off.setter
+    def lock_controls_when_off(self, value: bool) -> None:
+        value = bool(value)
+        if value != self._lock_controls_when_off:
+            self._lock_controls_when_off = value
+            self.update()
+
+    def is_available(self, cls: str) -> bool:
+        return self._state[cls]
+
+    def listen(self, cls: str, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call callback when the availability of cls changes; returns an unsubscribe."""
+        listeners = self._listeners[cls]
+        listeners.append(callback)
+
+        def unsubscribe() -> None:
+            try:
+                listeners.remove(callback)
+            except ValueError:
+                pass
+
+        return unsubscribe
+
+    def update(self, *, notify_all: bool = False) -> None:
+        """Recompute all classes and call the listeners of those that changed."""
+        self.recomputes += 1
+        new = self._compute()
+        for cls, value in new.items():
+            if value == self._state[cls] and not notify_all:
+                continue
+            if value != self._state[cls]:
+                self.flips += 1
+            self._state[cls] = value
+            for callback in list(self._listeners[cls]):
+                callback()
+
+    def stats(self) -> dict:
+        return {
+            "state": dict(self._state),
+            "listeners": {cls: len(cbs) for cls, cbs in self._listeners.items()},
+            "recomputes": self.recomputes,
+            "flips": self.flips,
+        }
+
+    def _compute(self) -> dict[str, bool]:
+        htp1 = self._htp1
+        if not htp1.connected:
+            return dict.fromkeys(CLASSES, False)
+
+        power = htp1.power
+        standby = power is False or power == 0
+        control = not (standby and self._lock_controls_when_off)
+        shaker_output = htp1.shaker_output
+        return {
+            CONNECTED: True,
+            POWERED: not standby,
+            CONTROL: control,
+            SHAKER: control and shaker_output != "off",
+            MIX_OUT: control and shaker_output not in MIX_OUT_SHAKER_ROUTES,
+        }
+
+    def _on_input(self, _value=None) -> None:
+        self.update()
+
+    def _on_connection(self, _value=None) -> None:
+        self.update(notify_all=True)
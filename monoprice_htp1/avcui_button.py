@@ -5,9 +5,9 @@ from typing import Callable
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, ui_lock_signal
+from . import availability
+from .const import DOMAIN
 from .helpers import schedule_entity_update_threadsafe
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,30 +61,15 @@ class Htp1AvcuiButton(ButtonEntity):
 
     @property
     def available(self) -> bool:
-        if not self._htp1.connected:
-            return False
-
-        # When UI lock is enabled, disable AVCUI buttons while device is off/standby.
-        if getattr(self._htp1, "lock_controls_when_off", True):
-            pwr = getattr(self._htp1, "power", None)
-            if pwr is False or pwr == 0:
-                return False
-
-        return True
+        # Disabled while the device is off/standby when the UI lock is enabled.
+        return self._htp1.availability.is_available(availability.CONTROL)
 
     async def async_added_to_hass(self) -> None:
-        # Update state when UI lock changes
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, ui_lock_signal(self._entry_id), self._handle_ui_lock
-            )
+        # Availability follows power, connection and the UI lock.
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONTROL, self._handle_state_change)
         )
 
-        # Also update availability when power or connection changes.
-        # Otherwise the button can remain "unavailable" after standby->on transitions.
-        self._subscribe("/powerIsOn")
-        self._subscribe("#connection")
-
     async def async_will_remove_from_hass(self) -> None:
         for unsub in self._unsubs:
             try:
@@ -93,20 +78,9 @@ class Htp1AvcuiButton(ButtonEntity):
                 pass
         self._unsubs = []
 
-    def _subscribe(self, path: str) -> None:
-        try:
-            unsub = self._htp1.subscribe(path, self._handle_state_change)
-            if callable(unsub):
-                self._unsubs.append(unsub)
-        except Exception:
-            _LOGGER.debug("Subscribe failed for %s", path, exc_info=True)
-
     def _handle_state_change(self, _value=None) -> None:
         schedule_entity_update_threadsafe(self)
 
-    def _handle_ui_lock(self, _value=None) -> None:
-        schedule_entity_update_threadsafe(self)
-
     async def async_press(self) -> None:
         try:
             await self._htp1.send_avcui(self._command)
@@ -3,13 +3,23 @@
 Fetches the BEQ (Bass EQ) catalogue and provides search functionality
 by movie title or TMDB ID. Mirrors the approach used in the Unfolded Circle
 integration but adapted for Home Assistant's service architecture.
+
+The catalogue can come from the public database, an internal mirror URL or
+a local JSON file (optionally gzip/bzip2/xz compressed). Whatever the
+source, entries are slimmed to the fields used here, indexed by TMDB ID and
+persisted so BEQ keeps working offline and across restarts.
 """
 
 from __future__ import annotations
 
 import asyncio
+import bz2
+import gzip
+import json
 import logging
+import lzma
 import re
+import time
 from typing import Any
 
 import aiohttp
@@ -18,35 +28,168 @@ _LOGGER = logging.getLogger(__name__)
 
 BEQ_DB_URL = "https://beqcatalogue.readthedocs.io/en/latest/database.json"
 CACHE_TTL = 3600  # 1 hour
+STORAGE_VERSION = 1
+
+# Fields kept per catalogue entry / filter; everything else (biquads,
+# images, descriptions, ...) is dropped on ingest.
+_SLIM_FIELDS = ("title", "year", "audioTypes", "underlying", "edition")
+_SLIM_FILTER_FIELDS = ("type", "freq", "gain", "q")
 
 _beq_cache: list[dict] | None = None
 _beq_cache_time: float = 0
+_beq_cache_source: str | None = None
+_beq_titles: list[str] = []
+_beq_tmdb_index: dict[int, list[dict]] = {}
+_beq_store = None  # homeassistant.helpers.storage.Store, see async_setup_persistence
 
 
-async def async_fetch_catalogue(session: aiohttp.ClientSession) -> list[dict]:
-    """Fetch the BEQ catalogue from the remote database, with in-memory caching."""
-    global _beq_cache, _beq_cache_time  # noqa: PLW0603
+class CatalogueError(Exception):
+    """Raised when a catalogue source cannot be read or parsed."""
+
+
+def is_url(source: str) -> bool:
+    """Return True when the catalogue source is an http(s) URL."""
+    return source.startswith(("http://", "https://"))
+
+
+def _decode_catalogue(raw: bytes) -> Any:
+    """Decompress (gzip, bzip2 or xz, detected by magic bytes) and parse JSON."""
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    elif raw[:3] == b"BZh":
+        raw = bz2.decompress(raw)
+    elif raw[:6] == b"\xfd7zXZ\x00":
+        raw = lzma.decompress(raw)
+    return json.loads(raw)
+
+
+def _read_catalogue_file(path: str) -> Any:
+    with open(path, "rb") as fh:
+        return _decode_catalogue(fh.read())
+
+
+def _slim_entry(entry: Any) -> dict | None:
+    """Reduce a raw catalogue entry to the fields search and load rely on."""
+    if not isinstance(entry, dict):
+        return None
+    slim = {key: entry[key] for key in _SLIM_FIELDS if key in entry}
+    tmdb_id = _extract_entry_tmdb_id(entry)
+    if tmdb_id is not None:
+        slim["theMovieDB"] = tmdb_id
+    slim["filters"] = [
+        {key: f[key] for key in _SLIM_FILTER_FIELDS if key in f}
+        for f in entry.get("filters", [])
+        if isinstance(f, dict)
+    ]
+    return slim
 
-    now = asyncio.get_event_loop().time()
-    if _beq_cache is not None and (now - _beq_cache_time) < CACHE_TTL:
-        return _beq_cache
 
-    _LOGGER.info("Fetching BEQ catalogue from %s", BEQ_DB_URL)
+def _ingest(data: list, source: str, fetched: float, *, slim: bool = True) -> list[dict]:
+    """Slim, index and cache a catalogue."""
+    global _beq_cache, _beq_cache_time, _beq_cache_source  # noqa: PLW0603
+    global _beq_titles, _beq_tmdb_index  # noqa: PLW0603
+
+    catalogue = [e for e in map(_slim_entry, data) if e is not None] if slim else data
+    index: dict[int, list[dict]] = {}
+    for entry in catalogue:
+        tmdb_id = entry.get("theMovieDB")
+        if tmdb_id is not None:
+            index.setdefault(tmdb_id, []).append(entry)
+
+    _beq_cache = catalogue
+    _beq_cache_time = fetched
+    _beq_cache_source = source
+    _beq_titles = [entry.get("title", "").lower() for entry in catalogue]
+    _beq_tmdb_index = index
+    return catalogue
+
+
+async def async_setup_persistence(store) -> None:
+    """Restore the persisted catalogue so BEQ works before (or without) a fetch."""
+    global _beq_store  # noqa: PLW0603
+
+    if _beq_store is not None:
+        return
+    _beq_store = store
     try:
-        async with session.get(
-            BEQ_DB_URL, timeout=aiohttp.ClientTimeout(total=30)
-        ) as resp:
-            if resp.status != 200:
-                _LOGGER.error("BEQ catalogue fetch failed: HTTP %d", resp.status)
-                return _beq_cache or []
-            data = await resp.json(content_type=None)
-            if isinstance(data, list):
-                _beq_cache = data
-                _beq_cache_time = now
-                _LOGGER.info("BEQ catalogue loaded: %d entries", len(data))
-                return data
+        data = await store.async_load()
     except Exception as err:
-        _LOGGER.error("BEQ catalogue fetch error: %s", err)
+        _LOGGER.warning("Failed to restore persisted BEQ catalogue: %s", err)
+        return
+    if not isinstance(data, dict) or not isinstance(data.get("catalogue"), list):
+        return
+    catalogue = _ingest(
+        data["catalogue"], data.get("source", BEQ_DB_URL), data.get("fetched", 0), slim=False
+    )
+    _LOGGER.debug("BEQ catalogue restored from storage: %d entries", len(catalogue))
+
+
+async def _async_persist() -> None:
+    if _beq_store is None or _beq_cache is None:
+        return
+    try:
+        await _beq_store.async_save(
+            {"source": _beq_cache_source, "fetched": _beq_cache_time, "catalogue": _beq_cache}
+        )
+    except Exception as err:
+        _LOGGER.warning("Failed to persist BEQ catalogue: %s", err)
+
+
+async def async_import_catalogue(
+    session: aiohttp.ClientSession, source: str | None = None
+) -> list[dict]:
+    """Load the catalogue from a URL or local file, then slim, index and persist it.
+
+    Raises CatalogueError when the source cannot be read or is not a catalogue.
+    """
+    source = source or BEQ_DB_URL
+    loop = asyncio.get_running_loop()
+
+    _LOGGER.info("Fetching BEQ catalogue from %s", source)
+    try:
+        if is_url(source):
+            async with session.get(
+                source, timeout=aiohttp.ClientTimeout(total=30)
+            ) as resp:
+                if resp.status != 200:
+                    raise CatalogueError(f"HTTP {resp.status}")
+                raw = await resp.read()
+            data = await loop.run_in_executor(None, _decode_catalogue, raw)
+        else:
+            data = await loop.run_in_executor(None, _read_catalogue_file, source)
+    except CatalogueError:
+        raise
+    except Exception as err:
+        raise CatalogueError(str(err)) from err
+
+    if not isinstance(data, list):
+        raise CatalogueError("catalogue is not a JSON list")
+
+    catalogue = _ingest(data, source, time.time())
+    _LOGGER.info("BEQ catalogue loaded: %d entries", len(catalogue))
+    await _async_persist()
+    return catalogue
+
+
+async def async_fetch_catalogue(
+    session: aiohttp.ClientSession, source: str | None = None
+) -> list[dict]:
+    """Return the cached catalogue, refreshing it from the source when stale.
+
+    On failure the previously cached (or persisted) catalogue is returned.
+    """
+    source = source or BEQ_DB_URL
+    if (
+        _beq_cache is not None
+        and _beq_cache_source == source
+        and (time.time() - _beq_cache_time) < CACHE_TTL
+    ):
+        return _beq_cache
+
+    try:
+        return await async_import_catalogue(session, source)
+    except CatalogueError as err:
+        _LOGGER.error("BEQ catalogue fetch failed: %s", err)
     return _beq_cache or []
 
 
@@ -92,9 +235,13 @@ def search_by_title(
     if not query:
         return []
 
+    if catalogue is _beq_cache:
+        candidates = zip(_beq_titles, catalogue)
+    else:
+        candidates = ((entry.get("title", "").lower(), entry) for entry in catalogue)
+
     results = []
-    for entry in catalogue:
-        entry_title = entry.get("title", "").lower()
+    for entry_title, entry in candidates:
         if query not in entry_title:
             continue
         if year is not None and entry.get("year") != year:
@@ -113,11 +260,13 @@ def search_by_tmdb_id(
     codec: str | None = None,
 ) -> list[dict]:
     """Search the BEQ catalogue by TMDB ID."""
+    if catalogue is _beq_cache:
+        candidates = _beq_tmdb_index.get(tmdb_id, [])
+    else:
+        candidates = [e for e in catalogue if _extract_entry_tmdb_id(e) == tmdb_id]
+
     results = []
-    for entry in catalogue:
-        entry_tmdb = _extract_entry_tmdb_id(entry)
-        if entry_tmdb != tmdb_id:
-            continue
+    for entry in candidates:
         if codec and not _codec_matches(entry, codec):
             continue
         results.append(entry)
@@ -0,0 +1,77 @@
+"""Recording of raw HTP-1 websocket frames to gzip-compressed JSON lines.
+
+The first line is a header; every following line is [t, frame] where t is
+seconds since the capture started (monotonic clock) and frame the text
+exactly as received. Compression and file I/O happen on a writer thread,
+so recording a frame only costs a queue put on the event loop.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from logging import getLogger
+
+CAPTURE_FORMAT = "htp1-capture"
+CAPTURE_VERSION = 1
+
+_LOGGER = getLogger(__name__)
+_STOP = object()
+
+
+class FrameRecorder:
+    """Append frames to a capture file from a background thread."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.frames = 0
+        self.failed = False
+        self._start = time.monotonic()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="htp1-capture", daemon=True
+        )
+        self._thread.start()
+
+    def record(self, frame: str) -> None:
+        if self.failed:
+            return
+        self._queue.put((time.monotonic() - self._start, frame))
+        self.frames += 1
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush queued frames and close the file (waits up to timeout)."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            with gzip.open(self.path, "wt", encoding="utf-8") as fh:
+                header = {
+                    "format": CAPTURE_FORMAT,
+                    "version": CAPTURE_VERSION,
+                    "started": time.time(),
+                }
+                fh.write(json.dumps(header) + "\n")
+                while (item := self._queue.get()) is not _STOP:
+                    t, frame = item
+                    fh.write(json.dumps([round(t, 6), frame], separators=(",", ":")) + "\n")
+        except OSError:
+            self.failed = True
+            _LOGGER.exception("frame capture to %s failed", self.path)
+
+
+def read_frames(path: str) -> Iterator[tuple[float, str]]:
+    """Yield (t, frame) pairs from a capture file."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        header = json.loads(fh.readline() or "null")
+        if not isinstance(header, dict) or header.get("format") != CAPTURE_FORMAT:
+            raise ValueError(f"{path} is not an HTP-1 frame capture")
+        for line in fh:
+            if line.strip():
+                t, frame = json.loads(line)
+                yield t, frame
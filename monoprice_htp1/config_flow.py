@@ -8,13 +8,37 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow as _ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow as _ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
-
-from .aiohtp1 import AioHtp1Exception, ConnectionException, Htp1
-from .const import DOMAIN, LOGGER
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
+
+from .aiohtp1 import (
+    MAX_CHANGEMSO_CHUNK_BYTES,
+    MAX_CHANGEMSO_CHUNK_DELAY,
+    AioHtp1Exception,
+    ConnectionException,
+    Htp1,
+)
+from .const import (
+    CONF_BEQ_SOURCE,
+    CONF_CHANGEMSO_CHUNK_BYTES,
+    CONF_CHANGEMSO_CHUNK_DELAY,
+    CONF_FOLLOWER_RULES,
+    CONF_HISTORY_SIZE,
+    CONF_SENSOR_THROTTLE,
+    DOMAIN,
+    LOGGER,
+)
+from .followers import FollowerError, parse_rules
+from .history import DEFAULT_HISTORY_SIZE, MAX_HISTORY_SIZE
 from .helpers import async_get_clientsession
+from .throttle import DEFAULT_SENSOR_THROTTLE, MAX_SENSOR_THROTTLE
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> str:
@@ -37,6 +61,12 @@ class ConfigFlow(_ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return Htp1OptionsFlow()
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -87,3 +117,71 @@ class ConfigFlow(_ConfigFlow, domain=DOMAIN):
             user_input=dict(user_input) if user_input is not None else None,
             host_default=host_default,
         )
+
+
+class Htp1OptionsFlow(OptionsFlow):
+    """Handle HTP-1 options."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        errors: dict[str, str] = {}
+        placeholders = {"follower_error": ""}
+        if user_input is not None:
+            # Empty source means "use the public BEQ catalogue".
+            source = (user_input.get(CONF_BEQ_SOURCE) or "").strip()
+            rules = (user_input.get(CONF_FOLLOWER_RULES) or "").strip()
+            try:
+                parse_rules(rules)
+            except FollowerError as err:
+                placeholders["follower_error"] = str(err)
+                errors[CONF_FOLLOWER_RULES] = "invalid_follower_rules"
+            else:
+                return self.async_create_entry(
+                    data={
+                        CONF_BEQ_SOURCE: source,
+                        CONF_HISTORY_SIZE: user_input[CONF_HISTORY_SIZE],
+                        CONF_SENSOR_THROTTLE: user_input[CONF_SENSOR_THROTTLE],
+                        CONF_CHANGEMSO_CHUNK_BYTES: user_input[CONF_CHANGEMSO_CHUNK_BYTES],
+                        CONF_CHANGEMSO_CHUNK_DELAY: user_input[CONF_CHANGEMSO_CHUNK_DELAY],
+                        CONF_FOLLOWER_RULES: rules,
+                    }
+                )
+
+        options = user_input if user_input is not None else self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_BEQ_SOURCE,
+                    description={"suggested_value": options.get(CONF_BEQ_SOURCE, "")},
+                ): str,
+                vol.Required(
+                    CONF_HISTORY_SIZE,
+                    default=options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_HISTORY_SIZE)),
+                vol.Required(
+                    CONF_SENSOR_THROTTLE,
+                    default=options.get(CONF_SENSOR_THROTTLE, DEFAULT_SENSOR_THROTTLE),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_SENSOR_THROTTLE)),
+                vol.Required(
+                    CONF_CHANGEMSO_CHUNK_BYTES,
+                    default=options.get(CONF_CHANGEMSO_CHUNK_BYTES, Htp1.CHANGEMSO_CHUNK_BYTES),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_CHANGEMSO_CHUNK_BYTES)),
+                vol.Required(
+                    CONF_CHANGEMSO_CHUNK_DELAY,
+                    default=options.get(CONF_CHANGEMSO_CHUNK_DELAY, Htp1.CHANGEMSO_CHUNK_DELAY),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_CHANGEMSO_CHUNK_DELAY)),
+                vol.Optional(
+                    CONF_FOLLOWER_RULES,
+                    description={"suggested_value": options.get(CONF_FOLLOWER_RULES, "")},
+                ): TextSelector(TextSelectorConfig(multiline=True)),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders=placeholders,
+        )
@@ -5,6 +5,26 @@ import logging
 DOMAIN = "monoprice_htp1"
 LOGGER = logging.getLogger(DOMAIN)
 
-def ui_lock_signal(entry_id: str) -> str:
-    """Dispatcher signal used to refresh entity availability when UI lock toggles."""
-    return f"{DOMAIN}_{entry_id}_ui_lock"
+# Options flow keys
+CONF_BEQ_SOURCE = "beq_catalogue_source"
+CONF_HISTORY_SIZE = "history_size"
+CONF_SENSOR_THROTTLE = "sensor_throttle"
+CONF_FOLLOWER_RULES = "follower_rules"
+CONF_CHANGEMSO_CHUNK_BYTES = "changemso_chunk_bytes"
+CONF_CHANGEMSO_CHUNK_DELAY = "changemso_chunk_delay"
+
+# Raw device values -> UI labels
+UPMIX_RAW_TO_UI = {
+    "off": "Direct",
+    "native": "Native",
+    "dolby": "Dolby Surround",
+    "dts": "DTS Neural:X",
+    "auro": "Auro-3D",
+    "mono": "Mono",
+    "stereo": "Stereo",
+}
+LOUDNESS_CURVE_RAW_TO_UI = {
+    "iso": "ISO 226:2003",
+    "vintage": "Vintage",
+    "vintageCustom": "Vintage Custom",
+}
@@ -0,0 +1,40 @@
+"""Diagnostics support for the Monoprice HTP-1 integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .aiohtp1 import Htp1
+from .const import DOMAIN
+from .helpers import get_update_scheduler
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    htp1: Htp1 | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    data: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "entity_updates": get_update_scheduler(hass).stats(),
+    }
+    if htp1 is None:
+        return data
+
+    data["connected"] = htp1.connected
+    data["availability"] = htp1.availability.stats()
+    data["changemso_stats"] = list(htp1.changemso_stats)
+    data["volume_steps"] = htp1.volume_stepper.stats()
+    data["followers"] = htp1.followers.stats()
+    data["history"] = htp1.history.query() if htp1.history is not None else None
+    return data
@@ -0,0 +1,364 @@
+"""Rules that make one device path follow another.
+
+A rule links a source path to a target path through a transform:
+
+  copy    the source value unchanged (e.g. /muted -> /secondaryMuted)
+  linear  gain * x + offset
+  curve   out_min + (out_max - out_min) * t ** exp, with
+          t = (x - in_min) / (in_max - in_min) clamped to 0..1
+  table   piecewise-linear interpolation between [x, y] points, held
+          constant beyond the first and last point
+
+Numeric results are rounded to `step` (default 1, 0 disables) and clamped
+to `min` / `max` when given. copy leaves non-numeric values alone and
+only rounds numbers when a step is given. Rules are written as a YAML (or JSON) list in
+the integration options, for example:
+
+    - source: /volume
+      target: /secondaryVolume
+      transform: linear
+      offset: -6
+      max: 0
+    - source: /muted
+      target: /secondaryMuted
+      transform: copy
+
+All rules share one subscription per source path. Changes are evaluated
+once per event loop iteration and the resulting target values are sent as
+one changemso batch, skipping targets that already hold the value.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML ships with Home Assistant
+    yaml = None
+
+from .msodiff import same
+
+if TYPE_CHECKING:
+    from .aiohtp1 import Htp1
+
+_LOGGER = getLogger(__name__)
+
+TRANSFORMS = ("copy", "linear", "curve", "table")
+
+_COMMON_KEYS = {"source", "target", "transform", "min", "max", "step"}
+_TRANSFORM_KEYS = {
+    "copy": set(),
+    "linear": {"gain", "offset"},
+    "curve": {"in_min", "in_max", "out_min", "out_max", "exp"},
+    "table": {"points"},
+}
+
+
+class FollowerError(ValueError):
+    """Raised for invalid follower rules."""
+
+
+@dataclass(frozen=True)
+class FollowerRule:
+    """One source -> target link; fn maps a source value to the target value."""
+
+    source: str
+    target: str
+    transform: str
+    fn: Callable[[Any], Any] = field(compare=False, repr=False)
+
+    def apply(self, value: Any) -> Any:
+        return self.fn(value)
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+
+def _number(raw: dict, key: str, default: float | None = None) -> float | None:
+    value = raw.get(key, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise FollowerError(f"'{key}' must be a number")
+    return float(value)
+
+
+def _pointer(raw: dict, key: str) -> str:
+    value = raw.get(key)
+    if not isinstance(value, str) or not value.startswith("/") or value == "/":
+        raise FollowerError(f"'{key}' must be a device path such as /volume")
+    return value
+
+
+def _linear(raw: dict) -> Callable[[float], float]:
+    gain = _number(raw, "gain", 1.0)
+    offset = _number(raw, "offset", 0.0)
+    return lambda x: gain * x + offset
+
+
+def _curve(raw: dict) -> Callable[[float], float]:
+    in_min, in_max = _number(raw, "in_min"), _number(raw, "in_max")
+    out_min, out_max = _number(raw, "out_min"), _number(raw, "out_max")
+    if None in (in_min, in_max, out_min, out_max):
+        raise FollowerError("curve needs in_min, in_max, out_min and out_max")
+    if in_min == in_max:
+        raise FollowerError("curve needs in_min != in_max")
+    exp = _number(raw, "exp", 1.0)
+    if exp <= 0:
+        raise FollowerError("curve needs exp > 0")
+    span = in_max - in_min
+
+    def fn(x: float) -> float:
+        t = max(0.0, min(1.0, (x - in_min) / span))
+        return out_min + (out_max - out_min) * t**exp
+
+    return fn
+
+
+def _table(raw: dict) -> Callable[[float], float]:
+    points = raw.get("points")
+    try:
+        pairs = sorted((float(x), float(y)) for x, y in points)
+    except (TypeError, ValueError):
+        raise FollowerError("table needs points as a list of [x, y] pairs") from None
+    if not pairs:
+        raise FollowerError("table needs at least one point")
+    xs = [x for x, _ in pairs]
+    ys = [y for _, y in pairs]
+
+    def fn(x: float) -> float:
+        i = bisect_right(xs, x)
+        if i == 0:
+            return ys[0]
+        if i == len(xs):
+            return ys[-1]
+        x0, x1, y0, y1 = xs[i - 1], xs[i], ys[i - 1], ys[i]
+        return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+    return fn
+
+
+def _finish(
+    fn: Callable[[Any], Any], raw: dict, default_step: float = 1.0, passthrough: bool = False
+) -> Callable[[Any], Any]:
+    """Wrap a numeric transform with rounding to step and min/max clamping.
+
+    Non-numeric source values raise TypeError, or are returned unchanged
+    with passthrough.
+    """
+    step = _number(raw, "step", default_step)
+    low, high = _number(raw, "min"), _number(raw, "max")
+    if step < 0:
+        raise FollowerError("'step' must not be negative")
+    if low is not None and high is not None and low > high:
+        raise FollowerError("'min' must not be above 'max'")
+
+    def wrapped(value: Any) -> Any:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            if passthrough:
+                return value
+            raise TypeError(f"source value {value!r} is not a number")
+        result = fn(value)
+        if step:
+            result = round(result / step) * step
+            if float(step).is_integer():
+                result = int(result)
+        # Clamp before narrowing to int so fractional limits are kept.
+        whole = isinstance(result, int)
+        if low is not None and result < low:
+            result = low
+        if high is not None and result > high:
+            result = high
+        if whole and float(result).is_integer():
+            result = int(result)
+        return result
+
+    return wrapped
+
+
+def parse_rule(raw: Any) -> FollowerRule:
+    if not isinstance(raw, dict):
+        raise FollowerError("each rule must be a mapping")
+    transform = raw.get("transform", "linear")
+    if transform not in TRANSFORMS:
+        raise FollowerError(f"unknown transform {transform!r} (use {', '.join(TRANSFORMS)})")
+    unknown = set(raw) - _COMMON_KEYS - _TRANSFORM_KEYS[transform]
+    if unknown:
+        raise FollowerError(f"unknown keys for {transform}: {', '.join(sorted(map(str, unknown)))}")
+
+    source, target = _pointer(raw, "source"), _pointer(raw, "target")
+    if source == target:
+        raise FollowerError(f"{source} cannot follow itself")
+
+    if transform == "copy":
+        fn = _finish(lambda value: value, raw, default_step=0.0, passthrough=True)
+    else:
+        fn = _finish({"linear": _linear, "curve": _curve, "table": _table}[transform](raw), raw)
+    return FollowerRule(source, target, transform, fn)
+
+
+def _check_cycles(rules: list[FollowerRule]) -> None:
+    """Reject rule sets where a target (indirectly) drives its own source."""
+    edges: dict[str, set[str]] = {}
+    for rule in rules:
+        edges.setdefault(rule.source, set()).add(rule.target)
+
+    def reaches(start: str, goal: str) -> bool:
+        seen, todo = set(), [start]
+        while todo:
+            node = todo.pop()
+            if node == goal:
+                return True
+            if node not in seen:
+                seen.add(node)
+                todo.extend(edges.get(node, ()))
+        return False
+
+    for rule in rules:
+        if reaches(rule.target, rule.source):
+            raise FollowerError(f"rules loop between {rule.source} and {rule.target}")
+
+
+def parse_rules(text: str | None) -> list[FollowerRule]:
+    """Parse the rules option (a YAML or JSON list); empty text means no rules."""
+    if not text or not text.strip():
+        return []
+    try:
+        data = yaml.safe_load(text) if yaml is not None else json.loads(text)
+    except Exception as err:
+        raise FollowerError(f"cannot parse rules: {err}") from None
+    if data is None:
+        return []
+    if not isinstance(data, list):
+        raise FollowerError("rules must be a list")
+
+    rules = []
+    for idx, raw in enumerate(data, 1):
+        try:
+            rules.append(parse_rule(raw))
+        except FollowerError as err:
+            raise FollowerError(f"rule {idx}: {err}") from None
+    _check_cycles(rules)
+    return rules
+
+
+# ----------------------------------------------------------------------
+# Engine
+# ----------------------------------------------------------------------
+
+
+class FollowerEngine:
+    """Evaluate follower rules on source changes and write targets in batches."""
+
+    def __init__(self, htp1: Htp1) -> None:
+        self._htp1 = htp1
+        self._rules: list[FollowerRule] = []
+        # Rules are referred to by position, which also decides which rule
+        # wins when several drive the same target. A source maps to its own
+        # rules plus every other rule on the same targets, so the winner is
+        # re-evaluated whichever source changed.
+        self._by_source: dict[str, set[int]] = {}
+        self._unsubs: list[Callable[[], None]] = []
+        self._dirty: set[int] = set()
+        self._flush_scheduled = False
+
+        self.evaluations = 0
+        self.batches = 0
+        self.writes = 0
+        self.errors = 0
+
+    @property
+    def rules(self) -> list[FollowerRule]:
+        return list(self._rules)
+
+    def set_rules(self, rules: list[FollowerRule]) -> None:
+        """Replace the rules; one subscription per distinct source path."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._dirty.clear()
+        self._rules = list(rules)
+        by_target: dict[str, set[int]] = {}
+        for idx, rule in enumerate(self._rules):
+            by_target.setdefault(rule.target, set()).add(idx)
+        self._by_source = {}
+        for rule in self._rules:
+            self._by_source.setdefault(rule.source, set()).update(by_target[rule.target])
+        if not self._rules:
+            return
+
+        for source in self._by_source:
+            self._unsubs.append(
+                self._htp1.subscribe(source, lambda _value, source=source: self._mark(source))
+            )
+        # Bring targets in line after (re)connecting.
+        self._unsubs.append(self._htp1.subscribe("#connection", self._on_connection))
+
+    def stats(self) -> dict:
+        return {
+            "rules": [f"{r.source} -> {r.target} ({r.transform})" for r in self._rules],
+            "evaluations": self.evaluations,
+            "batches": self.batches,
+            "writes": self.writes,
+            "errors": self.errors,
+        }
+
+    def _on_connection(self, _value=None) -> None:
+        if self._htp1.connected:
+            for source in self._by_source:
+                self._mark(source)
+
+    def _mark(self, source: str) -> None:
+        self._dirty.update(self._by_source.get(source, ()))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        htp1 = self._htp1
+        if not htp1.connected:
+            return
+
+        # In rule order, so the later rule wins when several drive the
+        # same target; _mark made all of them dirty together.
+        values: dict[str, Any] = {}
+        for idx in sorted(dirty):
+            rule = self._rules[idx]
+            found, source_value = htp1.lookup(rule.source)
+            if not found:
+                continue
+            self.evaluations += 1
+            try:
+                values[rule.target] = rule.apply(source_value)
+            except Exception:
+                self.errors += 1
+                _LOGGER.debug("Follower %s -> %s failed", rule.source, rule.target, exc_info=True)
+
+        ops = []
+        for target, value in values.items():
+            found, current = htp1.lookup(target)
+            if found and same(current, value):
+                continue
+            ops.append({"op": "replace", "path": target, "value": value})
+        if ops:
+            asyncio.get_running_loop().create_task(self._send(ops))
+
+    async def _send(self, ops: list[dict]) -> None:
+        self.batches += 1
+        self.writes += len(ops)
+        try:
+            await self._htp1.send_raw_ops(ops)
+        except Exception:
+            self.errors += 1
+            _LOGGER.warning("Follower write failed: %s", ops, exc_info=True)
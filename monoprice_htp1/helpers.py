@@ -1,9 +1,18 @@
 """Helpers for the Monoprice HTP-1 component."""
 
+import threading
+from typing import Any
+from weakref import WeakKeyDictionary
+
 import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_SCHEDULER_KEY = f"{DOMAIN}_update_scheduler"
 
 # Conservative timeouts for LAN devices.
 CLIENT_TIMEOUT = aiohttp.ClientTimeout(
@@ -19,17 +28,148 @@ def async_get_clientsession(hass: HomeAssistant) -> aiohttp.ClientSession:
     return async_create_clientsession(hass, timeout=CLIENT_TIMEOUT)
 
 
+def _state_signature(entity) -> tuple:
+    """Everything an entity contributes to its written state."""
+    return (
+        entity.available,
+        entity.state,
+        entity.icon,
+        entity.capability_attributes,
+        entity.state_attributes,
+        entity.extra_state_attributes,
+    )
+
+
+class EntityUpdateScheduler:
+    """Coalesce entity state writes to at most one per entity per loop iteration.
+
+    Entities are marked dirty as notifications arrive (a number entity can be
+    notified for its own path, /powerIsOn, /powerOnVol, #connection and the
+    UI lock for the same device frame) and written once by a flush scheduled
+    with call_soon. Must be used on the event loop thread.
+
+    A write is skipped when the entity's derived state is the same as at its
+    last write here and nothing else has written the entity since, e.g. a
+    child sensor notified because its parent object (/videostat, /status)
+    was replaced without its own value changing.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._dirty: dict[Any, None] = {}
+        self._flush_scheduled = False
+        # entity -> (signature, State object) of its last write from here
+        self._last: WeakKeyDictionary[Any, tuple[tuple, Any]] = WeakKeyDictionary()
+        self.requested = 0  # update requests received
+        self.written = 0  # state writes performed
+        self.unchanged = 0  # flushes skipped because nothing changed
+
+    @property
+    def saved(self) -> int:
+        """Requests that did not turn into a state write."""
+        return self.requested - self.written - len(self._dirty)
+
+    def mark_dirty(self, entity) -> None:
+        self.requested += 1
+        if entity in self._dirty:
+            return
+        self._dirty[entity] = None
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        dirty, self._dirty = self._dirty, {}
+        self._flush_scheduled = False
+        for entity in dirty:
+            # Skip entities removed since they were marked.
+            if entity.hass is None or entity.entity_id is None:
+                continue
+            states = self._hass.states
+            try:
+                signature = _state_signature(entity)
+            except Exception:  # noqa: BLE001 - let the write report it
+                signature = None
+            last = self._last.get(entity)
+            if (
+                signature is not None
+                and last is not None
+                and last[0] == signature
+                and last[1] is states.get(entity.entity_id)
+                and not entity.force_update
+            ):
+                self.unchanged += 1
+                continue
+            self.written += 1
+            entity.async_write_ha_state()
+            if signature is not None:
+                self._last[entity] = (signature, states.get(entity.entity_id))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requested": self.requested,
+            "written": self.written,
+            "unchanged": self.unchanged,
+            "saved": self.saved,
+        }
+
+
+def get_update_scheduler(hass: HomeAssistant) -> EntityUpdateScheduler:
+    """Return the update scheduler shared by all HTP-1 entities of this hass."""
+    scheduler = hass.data.get(_SCHEDULER_KEY)
+    if scheduler is None:
+        scheduler = hass.data[_SCHEDULER_KEY] = EntityUpdateScheduler(hass)
+    return scheduler
+
+
 def schedule_entity_update_threadsafe(entity) -> None:
     """Schedule entity state update on the HA event loop from any thread.
 
     Dispatcher callbacks can run on a worker thread. Calling entity state write
-    helpers from that thread is not thread-safe.
+    helpers from that thread is not thread-safe. Requests are coalesced by
+    EntityUpdateScheduler, so an entity is written once per loop iteration
+    however many of its subscriptions fired.
     """
     hass = getattr(entity, "hass", None)
     if hass is None:
         return
+    scheduler = get_update_scheduler(hass)
+    if threading.get_ident() == hass.loop_thread_id:
+        scheduler.mark_dirty(entity)
+        return
     try:
-        hass.loop.call_soon_threadsafe(entity.async_schedule_update_ha_state)
+        hass.loop.call_soon_threadsafe(scheduler.mark_dirty, entity)
     except RuntimeError:
         # Event loop may be closing during shutdown
         return
+
+
+class NamedStore:
+    """Named entries kept in a single HA Store file, loaded on first use."""
+
+    def __init__(self, hass: HomeAssistant, version: int, key: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, version, key)
+        self._data: dict[str, Any] | None = None
+
+    async def _async_data(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = await self._store.async_load() or {}
+        return self._data
+
+    async def async_names(self) -> list[str]:
+        return sorted(await self._async_data())
+
+    async def async_get(self, name: str) -> Any | None:
+        return (await self._async_data()).get(name)
+
+    async def async_set(self, name: str, value: Any) -> None:
+        data = await self._async_data()
+        data[name] = value
+        await self._store.async_save(data)
+
+    async def async_delete(self, name: str) -> bool:
+        data = await self._async_data()
+        if data.pop(name, None) is None:
+            return False
+        await self._store.async_save(data)
+        return True
@@ -0,0 +1,108 @@
+"""Bounded in-memory history of HTP-1 msoupdate changes, per path."""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any
+
+DEFAULT_HISTORY_SIZE = 32  # entries kept per path
+MAX_HISTORY_SIZE = 1024
+MAX_HISTORY_PATHS = 512  # least recently changed paths are dropped beyond this
+
+
+class _Ring:
+    """Fixed-size ring of (monotonic timestamp, value) pairs."""
+
+    __slots__ = ("times", "values", "head", "count")
+
+    def __init__(self, size: int) -> None:
+        self.times = array("d", bytes(8 * size))
+        self.values: list[Any] = [None] * size
+        self.head = 0  # next write position
+        self.count = 0
+
+    def append(self, ts: float, value: Any) -> None:
+        head = self.head
+        self.times[head] = ts
+        self.values[head] = value
+        head += 1
+        self.head = 0 if head == len(self.values) else head
+        if self.count < len(self.values):
+            self.count += 1
+
+    def items(self):
+        """(timestamp, value) pairs, oldest first."""
+        size = len(self.values)
+        start = (self.head - self.count) % size
+        for i in range(self.count):
+            idx = (start + i) % size
+            yield self.times[idx], self.values[idx]
+
+
+class PathHistory:
+    """Last `size` values written to each mso path, with monotonic timestamps.
+
+    Values are stored as given, so callers pass values that will not be
+    modified later; msoupdate records dicts and lists as copies taken when
+    each op is applied, since later ops update the live state in place. A
+    remove op is recorded as None.
+    """
+
+    def __init__(self, size: int = DEFAULT_HISTORY_SIZE) -> None:
+        if not 1 <= size <= MAX_HISTORY_SIZE:
+            raise ValueError(f"history size must be 1..{MAX_HISTORY_SIZE}")
+        self.size = size
+        self._rings: OrderedDict[str, _Ring] = OrderedDict()
+
+    def record(self, path: str, value: Any, ts: float) -> None:
+        ring = self._rings.get(path)
+        if ring is None:
+            if len(self._rings) >= MAX_HISTORY_PATHS:
+                self._rings.popitem(last=False)
+            ring = self._rings[path] = _Ring(self.size)
+        else:
+            self._rings.move_to_end(path)
+        ring.append(ts, value)
+
+    def paths(self) -> list[str]:
+        return list(self._rings)
+
+    def clear(self) -> None:
+        self._rings.clear()
+
+    def query(
+        self,
+        path: str | None = None,
+        since: float | None = None,
+        limit: int | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Entries per path, oldest first.
+
+        path matches that path and everything below it ("/upmix" also
+        returns "/upmix/select"); since is a maximum age in seconds and
+        limit keeps the newest N entries of each path. Each entry carries
+        its age in seconds and the wall-clock time it was received.
+        """
+        now_mono = time.monotonic()
+        now_wall = time.time()
+        prefix = None if path is None else path.rstrip("/") + "/"
+        result: dict[str, list[dict[str, Any]]] = {}
+        for key, ring in self._rings.items():
+            if prefix is not None and key != path and not key.startswith(prefix):
+                continue
+            entries = [
+                {
+                    "age_s": round(now_mono - ts, 3),
+                    "time": round(now_wall - (now_mono - ts), 3),
+                    "value": value,
+                }
+                for ts, value in ring.items()
+                if since is None or now_mono - ts <= since
+            ]
+            if limit is not None:
+                entries = entries[-limit:] if limit > 0 else []
+            if entries:
+                result[key] = entries
+        return result
@@ -0,0 +1,264 @@
+"""RFC 6902 JSON Patch engine used to apply HTP-1 msoupdate frames.
+
+All six ops (add, remove, replace, move, copy, test) are supported. A
+Patcher applies the ops of a frame in order against one document and keeps
+the chain of containers walked for the previous op, so consecutive ops in
+the same subtree (e.g. the four fields of /peq/slots/3/channels/sub1) only
+walk the part of the path that differs.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any
+
+from .msodiff import same, unescape
+
+
+class PatchError(ValueError):
+    """Raised when an op is malformed or its path cannot be resolved."""
+
+
+class PatchTestError(PatchError):
+    """Raised when a test op does not match; the rest of the patch must not be applied."""
+
+
+@lru_cache(maxsize=4096)
+def parse_pointer(path: str) -> tuple[str, ...]:
+    """Split a JSON Pointer into unescaped tokens ("" is the whole document)."""
+    if path == "":
+        return ()
+    if not path.startswith("/"):
+        raise PatchError(f"invalid pointer {path!r}")
+    return tuple(unescape(t) for t in path[1:].split("/"))
+
+
+@lru_cache(maxsize=4096)
+def _intern(parent: tuple[str, ...]) -> tuple[str, ...]:
+    """First-seen object for equal parent tuples (bounded)."""
+    return parent
+
+
+@lru_cache(maxsize=4096)
+def _split(path: str) -> tuple[tuple[str, ...], str] | None:
+    """(parent tokens, last token) of a non-root pointer, None for the root.
+
+    Parent tuples are interned, so ops sharing a parent usually get the
+    same object and the Patcher can recognise a repeat with an identity
+    check; an evicted entry only costs a prefix comparison.
+    """
+    tokens = parse_pointer(path)
+    if not tokens:
+        return None
+    return _intern(tokens[:-1]), tokens[-1]
+
+
+def _index(container: list, token: str, *, allow_end: bool) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise PatchError(f"invalid array index {token!r}")
+    idx = int(token)
+    if idx > len(container) or (idx == len(container) and not allow_end):
+        raise PatchError(f"array index {idx} out of range")
+    return idx
+
+
+class Patcher:
+    """Apply ops to a document in place, reusing container lookups between ops.
+
+    changes collects one (op, path, value) entry per modification in
+    add/replace/remove form: move is reported as a remove of "from" plus an
+    add of "path", copy as an add, test not at all. value is the value
+    written (None for remove).
+
+    With lenient=True the ops follow what the HTP-1 client has always done
+    with msoupdate frames instead of strict RFC 6902: add at an existing
+    array index replaces the element rather than inserting, replace of a
+    missing object member adds it, and removing a missing member is a
+    no-op (still reported as a change). move and copy, which that client
+    never handled, keep their RFC behaviour.
+    """
+
+    __slots__ = ("doc", "lenient", "changes", "_tokens", "_chain")
+
+    def __init__(self, doc: Any, lenient: bool = False) -> None:
+        self.doc = doc
+        self.lenient = lenient
+        self.changes: list[tuple[str, str, Any]] = []
+        # _chain[i] is the container at _tokens[:i].
+        self._tokens: tuple[str, ...] = ()
+        self._chain: list[Any] = [doc]
+
+    def apply(self, ops: list[dict]) -> None:
+        for op in ops:
+            self.apply_op(op)
+
+    def apply_op(self, piece: dict) -> None:
+        if type(piece) is not dict:
+            raise PatchError("op is not an object")
+        op = piece.get("op")
+        path = piece.get("path")
+        if type(path) is not str:
+            raise PatchError("missing path")
+        where = _split(path)
+
+        if op == "replace" and where is not None and "value" in piece:
+            # Fast path for the bulk of msoupdate traffic: replace of an
+            # object member.
+            parent = self._parent(where[0])
+            if type(parent) is dict and (self.lenient or where[1] in parent):
+                value = parent[where[1]] = piece["value"]
+                self.changes.append(("replace", path, value))
+                return
+
+        if op == "replace" or op == "add":
+            if "value" not in piece:
+                raise PatchError(f"{op} without value")
+            value = piece["value"]
+        elif op == "remove":
+            self._remove(where)
+            self.changes.append(("remove", path, None))
+            return
+        elif op == "test":
+            if "value" not in piece:
+                raise PatchError("test without value")
+            if not same(self._get(where), piece["value"]):
+                raise PatchTestError(f"test failed at {path}")
+            return
+        elif op == "move" or op == "copy":
+            src = piece.get("from")
+            if not isinstance(src, str):
+                raise PatchError(f"{op} without from")
+            src_where = _split(src)
+            if op == "move":
+                if src == path:
+                    return
+                if path.startswith(src + "/") or src == "":
+                    raise PatchError(f"cannot move {src} into itself")
+                value = self._get(src_where)
+                self._remove(src_where)
+                self.changes.append(("remove", src, None))
+            else:
+                value = deepcopy(self._get(src_where))
+            if where is None:
+                self._set_root(value)
+            else:
+                self._add(where, value, insert=True)
+            self.changes.append(("add", path, value))
+            return
+        else:
+            raise PatchError(f"unknown op {op!r}")
+
+        if where is None:
+            self._set_root(value)
+        elif op == "replace":
+            self._replace(where, value)
+        else:
+            self._add(where, value)
+        self.changes.append((op, path, value))
+
+    # -- container lookup -------------------------------------------------
+
+    def _parent(self, parent: tuple[str, ...]) -> Any:
+        """Container at the parent tokens, walking only past the cached prefix.
+
+        Ops only modify this parent container, never its ancestors, so the
+        cached chain (which ends at the last parent) stays valid across ops.
+        The cache is only updated once the whole walk has succeeded.
+        """
+        cached = self._tokens
+        if parent is cached:
+            return self._chain[-1]
+        chain = self._chain
+        common = 0
+        if parent and cached and parent[0] == cached[0]:
+            for a, b in zip(parent, cached):
+                if a != b:
+                    break
+                common += 1
+        node = chain[common]
+        walked = []
+        for token in parent[common:]:
+            if type(node) is dict and token in node:
+                node = node[token]
+            else:
+                node = self._child(node, token)
+            walked.append(node)
+        if common + 1 < len(chain):
+            del chain[common + 1 :]
+        chain.extend(walked)
+        self._tokens = parent
+        return node
+
+    @staticmethod
+    def _child(node: Any, token: str) -> Any:
+        try:
+            if isinstance(node, dict):
+                return node[token]
+            if isinstance(node, list):
+                return node[_index(node, token, allow_end=False)]
+        except KeyError:
+            pass
+        raise PatchError(f"path segment {token!r} not found")
+
+    # -- primitives -------------------------------------------------------
+
+    def _get(self, where) -> Any:
+        if where is None:
+            return self.doc
+        return self._child(self._parent(where[0]), where[1])
+
+    def _add(self, where, value: Any, insert: bool = False) -> None:
+        parent = self._parent(where[0])
+        key = where[1]
+        if isinstance(parent, dict):
+            parent[key] = value
+        elif isinstance(parent, list):
+            idx = _index(parent, key, allow_end=True)
+            if self.lenient and not insert and idx < len(parent):
+                parent[idx] = value
+            else:
+                parent.insert(idx, value)
+        else:
+            raise PatchError(f"cannot add below a {type(parent).__name__}")
+
+    def _replace(self, where, value: Any) -> None:
+        parent = self._parent(where[0])
+        key = where[1]
+        if isinstance(parent, dict):
+            if key not in parent and not self.lenient:
+                raise PatchError(f"member {key!r} not found")
+            parent[key] = value
+        elif isinstance(parent, list):
+            parent[_index(parent, key, allow_end=False)] = value
+        else:
+            raise PatchError(f"cannot replace below a {type(parent).__name__}")
+
+    def _remove(self, where) -> Any:
+        if where is None:
+            raise PatchError("cannot remove the whole document")
+        parent = self._parent(where[0])
+        key = where[1]
+        if isinstance(parent, dict):
+            if key not in parent:
+                if self.lenient:
+                    return None
+                raise PatchError(f"member {key!r} not found")
+            return parent.pop(key)
+        if isinstance(parent, list):
+            return parent.pop(_index(parent, key, allow_end=False))
+        raise PatchError(f"cannot remove below a {type(parent).__name__}")
+
+    def _set_root(self, value: Any) -> None:
+        self.doc = value
+        self._tokens = ()
+        self._chain = [value]
+
+
+def apply_patch(doc: Any, ops: list[dict]) -> Any:
+    """Apply all ops to doc in place and return the (possibly new) document."""
+    patcher = Patcher(doc)
+    patcher.apply(ops)
+    return patcher.doc
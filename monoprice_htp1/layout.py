@@ -0,0 +1,177 @@
+"""Per-channel entities that follow the configured speaker layout."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .aiohtp1 import CHANNEL_TRIM_KEYS, TRIM_CHANNEL_GROUPS, Htp1
+from .const import DOMAIN
+
+TRIM_PATH_PREFIX = "/channeltrim/channels/"
+
+# Entity key suffix and display name of each trim channel. Keys are part of
+# the unique ids, so they must not change.
+TRIM_CHANNEL_NAMES = {
+    "lf": ("left", "Left"),
+    "rf": ("right", "Right"),
+    "c": ("center", "Center"),
+    "lfe": ("lfe", "LFE"),
+    "rs": ("rightsurround", "Right Surround"),
+    "ls": ("leftsurround", "Left Surround"),
+    "rb": ("rightback", "Right Back"),
+    "lb": ("leftback", "Left Back"),
+    "ltf": ("ltf", "Left Top Front"),
+    "rtf": ("rtf", "Right Top Front"),
+    "ltm": ("ltm", "Left Top Middle"),
+    "rtm": ("rtm", "Right Top Middle"),
+    "ltr": ("ltr", "Left Top Rear"),
+    "rtr": ("rtr", "Right Top Rear"),
+    "lw": ("lw", "Left Wide"),
+    "rw": ("rw", "Right Wide"),
+    "lfh": ("lfh", "Left Front Height"),
+    "rfh": ("rfh", "Right Front Height"),
+    "lhb": ("lhb", "Left Height Back"),
+    "rhb": ("rhb", "Right Height Back"),
+}
+# Trim entities of the 7.1 bed are enabled by default, the rest are opt-in.
+TRIM_CHANNELS_ENABLED = frozenset(("lf", "rf", "c", "lfe", "rs", "ls", "rb", "lb"))
+
+# Paths whose change can alter the set of active channels. Child paths are
+# notified when a parent object (/speakers, /speakers/groups) is replaced.
+LAYOUT_PATHS = (
+    "/cal/currentLayout",
+    *sorted({f"/speakers/groups/{g}/present" for g in TRIM_CHANNEL_GROUPS.values() if g}),
+)
+
+
+def trim_channel(definition: dict) -> str | None:
+    """Channel key of a per-channel trim entity definition, else None."""
+    path = definition.get("path", "")
+    if path.startswith(TRIM_PATH_PREFIX):
+        return path[len(TRIM_PATH_PREFIX):]
+    return None
+
+
+def trim_definitions(fields: Callable[[str], dict]) -> list[dict]:
+    """One entity definition per trim channel, extended with fields(channel)."""
+    definitions = []
+    for ch in CHANNEL_TRIM_KEYS:
+        suffix, name = TRIM_CHANNEL_NAMES[ch]
+        definition = {
+            "key": f"channeltrim_{suffix}",
+            "name": f"Trim {name}",
+            "path": TRIM_PATH_PREFIX + ch,
+            **fields(ch),
+        }
+        if ch not in TRIM_CHANNELS_ENABLED:
+            definition["entity_registry_enabled_default"] = False
+        definitions.append(definition)
+    return definitions
+
+
+def trim_unique_ids(entry_id: str, definitions: list[dict]) -> dict[str, str]:
+    """{channel: unique id} of the per-channel trim entities in definitions."""
+    return {
+        ch: f"{entry_id}_{definition['key']}"
+        for definition in definitions
+        if (ch := trim_channel(definition)) is not None
+    }
+
+
+def _customized(entry: er.RegistryEntry) -> bool:
+    """Whether the user changed a registry entry in a way worth keeping."""
+    return bool(
+        entry.name
+        or entry.icon
+        or entry.area_id
+        or entry.aliases
+        or getattr(entry, "labels", None)  # HA 2024.4+
+        or entry.disabled_by is er.RegistryEntryDisabler.USER
+        or entry.hidden_by is er.RegistryEntryHider.USER
+    )
+
+
+class ChannelEntityManager:
+    """Keep one platform's per-channel entities in line with the speaker layout.
+
+    Entities of channels whose speaker group is not present are not created;
+    when the layout changes on the device they are added or removed on the
+    fly. A removed channel's registry entry is deleted too, unless the user
+    gave it a name, icon, area, alias or label or disabled or hid it; those
+    entries stay (showing as unavailable) so the setting survives until the
+    channel returns.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        htp1: Htp1,
+        platform_domain: str,
+        factories: dict[str, Callable[[], Entity]],
+        unique_ids: dict[str, str],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        self._hass = hass
+        self._htp1 = htp1
+        self._domain = platform_domain
+        self._factories = factories
+        self._unique_ids = unique_ids
+        self._add = async_add_entities
+        self._entities: dict[str, Entity] = {}
+        self._sync_scheduled = False
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Create the entities for the current layout and follow changes."""
+        self._sync()
+        unsubs = [
+            self._htp1.subscribe(path, self._on_layout_change)
+            for path in (*LAYOUT_PATHS, "#connection")
+        ]
+
+        def unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return unsubscribe
+
+    def _on_layout_change(self, _value=None) -> None:
+        # One frame can touch several groups; resync once after it.
+        if not self._sync_scheduled:
+            self._sync_scheduled = True
+            self._hass.loop.call_soon(self._sync)
+
+    @callback
+    def _sync(self) -> None:
+        self._sync_scheduled = False
+        if not self._htp1.connected:
+            # Keep entities through reconnects; they show as unavailable.
+            return
+
+        active = set(self._htp1.active_trim_channels)
+        new = []
+        for channel, factory in self._factories.items():
+            if channel in active and channel not in self._entities:
+                entity = self._entities[channel] = factory()
+                new.append(entity)
+            elif channel not in active:
+                self._remove(channel)
+        if new:
+            self._add(new, True)
+
+    @callback
+    def _remove(self, channel: str) -> None:
+        entity = self._entities.pop(channel, None)
+        registry = er.async_get(self._hass)
+        entity_id = registry.async_get_entity_id(self._domain, DOMAIN, self._unique_ids[channel])
+        entry = registry.async_get(entity_id) if entity_id is not None else None
+        if entry is not None and not _customized(entry):
+            # Removing the registry entry also removes the live entity.
+            registry.async_remove(entity_id)
+        elif entity is not None and entity.hass is not None:
+            self._hass.async_create_task(entity.async_remove())
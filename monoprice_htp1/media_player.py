@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import time
+
 import voluptuous as vol
 
 from homeassistant.components.media_player import (
@@ -10,41 +13,108 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-
-from . import beq
-from .aiohtp1 import Htp1
-from .const import DOMAIN, LOGGER, ui_lock_signal
-from .helpers import schedule_entity_update_threadsafe
-
-# Raw device values -> UI labels
-UPMIX_RAW_TO_UI = {
-    "off": "Direct",
-    "native": "Native",
-    "dolby": "Dolby Surround",
-    "dts": "DTS Neural:X",
-    "auro": "Auro-3D",
-    "mono": "Mono",
-    "stereo": "Stereo",
-}
+from homeassistant.helpers.storage import Store
+
+from . import availability, beq, peq_snapshot, scene
+from .aiohtp1 import AioHtp1Exception, Htp1
+from .const import CONF_BEQ_SOURCE, DOMAIN, LOGGER, UPMIX_RAW_TO_UI
+from .helpers import NamedStore, schedule_entity_update_threadsafe
+from .peq_import import PeqImportError, parse_filters
+from .peq_response import filter_headroom
+
 # UI labels -> raw device values
 UPMIX_UI_TO_RAW = {v: k for k, v in UPMIX_RAW_TO_UI.items()}
 
 
 SERVICE_LOAD_BEQ = "load_beq_filter"
 SERVICE_CLEAR_BEQ = "clear_beq_filter"
+SERVICE_IMPORT_BEQ_CATALOGUE = "import_beq_catalogue"
+SERVICE_ANALYZE_BEQ = "analyze_beq_filter"
+SERVICE_IMPORT_PEQ = "import_peq"
+SERVICE_SAVE_PEQ_SNAPSHOT = "save_peq_snapshot"
+SERVICE_RESTORE_PEQ_SNAPSHOT = "restore_peq_snapshot"
+SERVICE_DELETE_PEQ_SNAPSHOT = "delete_peq_snapshot"
+SERVICE_SET_CHANNEL_TRIMS = "set_channel_trims"
+SERVICE_APPLY_SCENE = "apply_scene"
+SERVICE_SAVE_SCENE = "save_scene"
+SERVICE_DELETE_SCENE = "delete_scene"
+SERVICE_QUERY_HISTORY = "query_history"
+SERVICE_START_FRAME_CAPTURE = "start_frame_capture"
+SERVICE_STOP_FRAME_CAPTURE = "stop_frame_capture"
 
 LOAD_BEQ_SCHEMA = {
     vol.Optional("title"): cv.string,
     vol.Optional("tmdb_id"): cv.string,
     vol.Optional("year"): vol.Coerce(int),
     vol.Optional("codec"): cv.string,
+    vol.Optional("minimal_diff", default=True): cv.boolean,
+}
+
+ANALYZE_BEQ_SCHEMA = {
+    vol.Optional("title"): cv.string,
+    vol.Optional("tmdb_id"): cv.string,
+    vol.Optional("year"): vol.Coerce(int),
+    vol.Optional("codec"): cv.string,
+}
+
+IMPORT_PEQ_SCHEMA = {
+    vol.Required("channels"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Exclusive("filters", "peq_source"): cv.string,
+    vol.Exclusive("file", "peq_source"): cv.string,
+    vol.Optional("format", default="auto"): vol.In(["auto", "rew", "minidsp"]),
+    vol.Optional("clear_remaining", default=True): cv.boolean,
+}
+
+PEQ_SNAPSHOT_SCHEMA = {
+    vol.Required("name"): cv.string,
+}
+
+SET_CHANNEL_TRIMS_SCHEMA = {
+    vol.Required("trims"): {cv.string: vol.Coerce(float)},
+    vol.Optional("relative", default=False): cv.boolean,
+}
+
+SCENE_SETTINGS_SCHEMA = {
+    vol.Optional("input"): cv.string,
+    vol.Optional("upmix"): cv.string,
+    vol.Optional("volume"): vol.Coerce(float),
+    vol.Optional("loudness_curve"): cv.string,
+    vol.Optional("dirac_slot"): cv.string,
+    vol.Optional("channel_trims"): {cv.string: vol.Coerce(float)},
+}
+
+APPLY_SCENE_SCHEMA = {
+    vol.Optional("name"): cv.string,
+    **SCENE_SETTINGS_SCHEMA,
+}
+
+SAVE_SCENE_SCHEMA = {
+    vol.Required("name"): cv.string,
+    **SCENE_SETTINGS_SCHEMA,
+}
+
+DELETE_SCENE_SCHEMA = {
+    vol.Required("name"): cv.string,
+}
+
+QUERY_HISTORY_SCHEMA = {
+    vol.Optional("path"): cv.string,
+    vol.Optional("since"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+}
+
+START_FRAME_CAPTURE_SCHEMA = {
+    vol.Optional("file"): cv.string,
+}
+
+IMPORT_BEQ_CATALOGUE_SCHEMA = {
+    vol.Optional("source"): cv.string,
 }
 
 
@@ -55,7 +125,32 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Monoprice HTP-1 config entry."""
     htp1: Htp1 = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities((Htp1MediaPlayer(htp1=htp1, entry_id=entry.entry_id),), True)
+
+    # Restore the persisted BEQ catalogue (shared by all HTP-1 entries).
+    await beq.async_setup_persistence(
+        Store(hass, beq.STORAGE_VERSION, f"{DOMAIN}.beq_catalogue")
+    )
+
+    async_add_entities(
+        (
+            Htp1MediaPlayer(
+                htp1=htp1,
+                entry_id=entry.entry_id,
+                beq_source=entry.options.get(CONF_BEQ_SOURCE) or None,
+                peq_snapshots=NamedStore(
+                    hass,
+                    peq_snapshot.STORAGE_VERSION,
+                    f"{DOMAIN}.peq_snapshots.{entry.entry_id}",
+                ),
+                scenes=NamedStore(
+                    hass,
+                    scene.STORAGE_VERSION,
+                    f"{DOMAIN}.scenes.{entry.entry_id}",
+                ),
+            ),
+        ),
+        True,
+    )
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
@@ -68,6 +163,75 @@ async def async_setup_entry(
         {},
         "async_clear_beq_filter",
     )
+    platform.async_register_entity_service(
+        SERVICE_IMPORT_BEQ_CATALOGUE,
+        IMPORT_BEQ_CATALOGUE_SCHEMA,
+        "async_import_beq_catalogue",
+    )
+    platform.async_register_entity_service(
+        SERVICE_ANALYZE_BEQ,
+        ANALYZE_BEQ_SCHEMA,
+        "async_analyze_beq_filter",
+        supports_response=SupportsResponse.ONLY,
+    )
+    platform.async_register_entity_service(
+        SERVICE_IMPORT_PEQ,
+        IMPORT_PEQ_SCHEMA,
+        "async_import_peq",
+    )
+    platform.async_register_entity_service(
+        SERVICE_SAVE_PEQ_SNAPSHOT,
+        PEQ_SNAPSHOT_SCHEMA,
+        "async_save_peq_snapshot",
+    )
+    platform.async_register_entity_service(
+        SERVICE_RESTORE_PEQ_SNAPSHOT,
+        PEQ_SNAPSHOT_SCHEMA,
+        "async_restore_peq_snapshot",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    platform.async_register_entity_service(
+        SERVICE_DELETE_PEQ_SNAPSHOT,
+        PEQ_SNAPSHOT_SCHEMA,
+        "async_delete_peq_snapshot",
+    )
+    platform.async_register_entity_service(
+        SERVICE_SET_CHANNEL_TRIMS,
+        SET_CHANNEL_TRIMS_SCHEMA,
+        "async_set_channel_trims",
+    )
+    platform.async_register_entity_service(
+        SERVICE_APPLY_SCENE,
+        APPLY_SCENE_SCHEMA,
+        "async_apply_scene",
+    )
+    platform.async_register_entity_service(
+        SERVICE_SAVE_SCENE,
+        SAVE_SCENE_SCHEMA,
+        "async_save_scene",
+    )
+    platform.async_register_entity_service(
+        SERVICE_DELETE_SCENE,
+        DELETE_SCENE_SCHEMA,
+        "async_delete_scene",
+    )
+    platform.async_register_entity_service(
+        SERVICE_QUERY_HISTORY,
+        QUERY_HISTORY_SCHEMA,
+        "async_query_history",
+        supports_response=SupportsResponse.ONLY,
+    )
+    platform.async_register_entity_service(
+        SERVICE_START_FRAME_CAPTURE,
+        START_FRAME_CAPTURE_SCHEMA,
+        "async_start_frame_capture",
+    )
+    platform.async_register_entity_service(
+        SERVICE_STOP_FRAME_CAPTURE,
+        {},
+        "async_stop_frame_capture",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
 
 class Htp1MediaPlayer(MediaPlayerEntity):
@@ -78,8 +242,18 @@ class Htp1MediaPlayer(MediaPlayerEntity):
     def _on_ui_lock(self, _value=None):
         schedule_entity_update_threadsafe(self)
 
-    def __init__(self, htp1: Htp1, entry_id: str) -> None:
+    def __init__(
+        self,
+        htp1: Htp1,
+        entry_id: str,
+        beq_source: str | None = None,
+        peq_snapshots: NamedStore | None = None,
+        scenes: NamedStore | None = None,
+    ) -> None:
         self._htp1 = htp1
+        self._beq_source = beq_source
+        self._peq_snapshots = peq_snapshots
+        self._scenes = scenes
 
         self._power_cache: bool | None = None
         self._muted_cache: bool | None = None
@@ -94,7 +268,7 @@ class Htp1MediaPlayer(MediaPlayerEntity):
             name="HTP-1",
         )
 
-        self._attr_volume_step: float | None = None
+        self._volume_step: tuple[tuple[int, ...], float | None] | None = None
         self._unsubs: list[object] = []
 
     @property
@@ -108,9 +282,9 @@ class Htp1MediaPlayer(MediaPlayerEntity):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
-        # Re-render features immediately when UI lock changes.
+        # Re-render features immediately when the UI lock locks or unlocks controls.
         self.async_on_remove(
-            async_dispatcher_connect(self.hass, ui_lock_signal(self._attr_unique_id.split('_media_player', 1)[0]), self._on_ui_lock)
+            self._htp1.availability.listen(availability.CONTROL, self._on_ui_lock)
         )
 
         htp1 = self._htp1
@@ -136,18 +310,9 @@ class Htp1MediaPlayer(MediaPlayerEntity):
                 self._power_cache = None
                 self._muted_cache = None
                 self._volume_cache = None
-                self._attr_volume_step = None
                 schedule_entity_update_threadsafe(self)
                 return
 
-            try:
-                # HTP-1 uses a fixed 1 dB volume step
-                span = htp1.cal_vph - htp1.cal_vpl
-                self._attr_volume_step = (1.0 / span) if span > 0 else None
-            except Exception:
-                LOGGER.debug("Failed to compute volume_step", exc_info=True)
-                self._attr_volume_step = None
-
             # Seed caches from current state
             self._power_cache = htp1.power if htp1.power in (0, 1, True, False) else None
             self._muted_cache = htp1.muted if htp1.muted in (0, 1, True, False) else None
@@ -240,7 +405,17 @@ class Htp1MediaPlayer(MediaPlayerEntity):
 
     @property
     def volume_step(self) -> float | None:
-        return self._attr_volume_step
+        # HTP-1 uses a fixed 1 dB volume step; recomputed only when /cal changes.
+        version = self._htp1.version("cal")
+        if self._volume_step is None or self._volume_step[0] != version:
+            try:
+                span = self._htp1.cal_vph - self._htp1.cal_vpl
+                step = (1.0 / span) if span > 0 else None
+            except Exception:
+                LOGGER.debug("Failed to compute volume_step", exc_info=True)
+                step = None
+            self._volume_step = (version, step)
+        return self._volume_step[1]
 
     @property
     def volume_level(self) -> float | None:
@@ -285,10 +460,32 @@ class Htp1MediaPlayer(MediaPlayerEntity):
             LOGGER.debug("Failed to compute target dB from volume level", exc_info=True)
             return
 
+        # An absolute level supersedes pending volume_up/volume_down steps.
+        self._htp1.volume_stepper.reset()
         async with self._htp1:
             self._htp1.volume = target_db
             await self._htp1.commit()
 
+    async def async_volume_up(self) -> None:
+        """Raise the volume by 1 dB, accumulating with steps still in flight."""
+        await self._async_step_volume(1)
+
+    async def async_volume_down(self) -> None:
+        """Lower the volume by 1 dB, accumulating with steps still in flight."""
+        await self._async_step_volume(-1)
+
+    async def _async_step_volume(self, delta: int) -> None:
+        if not self.available:
+            return
+        try:
+            target = self._htp1.volume_stepper.step(delta)
+        except (TypeError, ValueError):
+            LOGGER.debug("Volume step ignored: volume or calibration not known", exc_info=True)
+            return
+        # Show the pending target right away; the device echo confirms it.
+        self._volume_cache = target
+        schedule_entity_update_threadsafe(self)
+
     @property
     def is_volume_muted(self) -> bool | None:
         if not self.available:
@@ -381,6 +578,7 @@ class Htp1MediaPlayer(MediaPlayerEntity):
         tmdb_id: str | None = None,
         year: int | None = None,
         codec: str | None = None,
+        minimal_diff: bool = True,
     ) -> None:
         """Search the BEQ catalogue and load a bass correction filter."""
         if not title and not tmdb_id:
@@ -391,8 +589,41 @@ class Htp1MediaPlayer(MediaPlayerEntity):
         if not self.available:
             raise HomeAssistantError("HTP-1 is not connected")
 
+        entry, results = await self._async_find_beq_entry(title, tmdb_id, year, codec)
+        filters = beq.prepare_filters(entry)
+        entry_title = entry.get("title", "Unknown")
+        beq_label = entry.get("underlying", entry_title)
+
+        if not filters:
+            raise HomeAssistantError(
+                f"BEQ entry '{entry_title}' has no filters"
+            )
+
+        LOGGER.info(
+            "Loading BEQ filter: %s (%d filters, %d matches found)",
+            beq_label,
+            len(filters),
+            len(results),
+        )
+
+        success = await self._htp1.load_beq(
+            beq_label, filters, minimal_diff=minimal_diff
+        )
+        if not success:
+            raise HomeAssistantError("Failed to load BEQ filter on device")
+
+    async def _async_find_beq_entry(
+        self,
+        title: str | None,
+        tmdb_id: str | None,
+        year: int | None,
+        codec: str | None,
+    ) -> tuple[dict, list[dict]]:
+        """Search the catalogue; return the best match and all results."""
         session = async_get_clientsession(self.hass)
-        catalogue = await beq.async_fetch_catalogue(session)
+        catalogue = await beq.async_fetch_catalogue(
+            session, self._resolve_beq_source(self._beq_source)
+        )
 
         if not catalogue:
             raise HomeAssistantError("Failed to fetch BEQ catalogue")
@@ -417,26 +648,32 @@ class Htp1MediaPlayer(MediaPlayerEntity):
                 f"No BEQ filter found for {search_desc}"
             )
 
-        entry = beq.best_match(results)
-        filters = beq.prepare_filters(entry)
-        entry_title = entry.get("title", "Unknown")
-        beq_label = entry.get("underlying", entry_title)
+        return beq.best_match(results), results
 
-        if not filters:
+    async def async_analyze_beq_filter(
+        self,
+        title: str | None = None,
+        tmdb_id: str | None = None,
+        year: int | None = None,
+        codec: str | None = None,
+    ) -> dict:
+        """Report the peak boost of a BEQ catalogue entry without loading it."""
+        if not title and not tmdb_id:
             raise HomeAssistantError(
-                f"BEQ entry '{entry_title}' has no filters"
+                "Either 'title' or 'tmdb_id' must be provided"
             )
 
-        LOGGER.info(
-            "Loading BEQ filter: %s (%d filters, %d matches found)",
-            beq_label,
-            len(filters),
-            len(results),
-        )
-
-        success = await self._htp1.load_beq(beq_label, filters)
-        if not success:
-            raise HomeAssistantError("Failed to load BEQ filter on device")
+        entry, results = await self._async_find_beq_entry(title, tmdb_id, year, codec)
+        filters = beq.prepare_filters(entry)
+        peak_db, peak_hz = filter_headroom(filters)
+        return {
+            "title": entry.get("title", "Unknown"),
+            "underlying": entry.get("underlying"),
+            "matches": len(results),
+            "filter_count": len(filters),
+            "peak_boost_db": peak_db,
+            "peak_boost_frequency_hz": peak_hz,
+        }
 
     async def async_clear_beq_filter(self) -> None:
         """Clear the currently loaded BEQ filter."""
@@ -446,3 +683,206 @@ class Htp1MediaPlayer(MediaPlayerEntity):
         success = await self._htp1.clear_beq()
         if not success:
             raise HomeAssistantError("Failed to clear BEQ filter on device")
+
+    def _resolve_beq_source(self, source: str | None) -> str | None:
+        """Resolve a local catalogue path against the config dir and check access."""
+        if not source or beq.is_url(source):
+            return source
+        return self._resolve_config_path(source)
+
+    def _resolve_config_path(self, source: str) -> str:
+        """Resolve a path against the config dir and check it may be accessed.
+
+        Symlinks and ".." are resolved first, so the check applies to the
+        file that is actually opened.
+        """
+        path = os.path.realpath(self.hass.config.path(source))
+        config_dir = os.path.realpath(self.hass.config.path())
+        if not (
+            path.startswith(config_dir.rstrip(os.sep) + os.sep)
+            or self.hass.config.is_allowed_path(path)
+        ):
+            raise HomeAssistantError(
+                f"Path '{source}' is not in the config directory or allowlist_external_dirs"
+            )
+        return path
+
+    async def async_import_peq(
+        self,
+        channels: list[str],
+        filters: str | None = None,
+        file: str | None = None,
+        format: str = "auto",
+        clear_remaining: bool = True,
+    ) -> None:
+        """Import a REW or miniDSP filter export into user PEQ slots."""
+        if not filters and not file:
+            raise HomeAssistantError("Either 'filters' or 'file' must be provided")
+
+        if not self.available:
+            raise HomeAssistantError("HTP-1 is not connected")
+
+        if file:
+            path = self._resolve_config_path(file)
+            try:
+                filters = await self.hass.async_add_executor_job(_read_text, path)
+            except OSError as err:
+                raise HomeAssistantError(f"Failed to read {file}: {err}") from err
+
+        try:
+            parsed = parse_filters(filters, format)
+            await self._htp1.import_peq(parsed, channels, clear_remaining=clear_remaining)
+        except (PeqImportError, AioHtp1Exception) as err:
+            raise HomeAssistantError(f"PEQ import failed: {err}") from err
+
+    # PEQ snapshots
+
+    async def async_save_peq_snapshot(self, name: str) -> None:
+        """Save the whole /peq subtree under a name."""
+        peq = self._htp1.peq_snapshot()
+        if peq is None:
+            raise HomeAssistantError("HTP-1 is not connected")
+        await self._peq_snapshots.async_set(name, peq_snapshot.encode(peq))
+        LOGGER.info("Saved PEQ snapshot '%s'", name)
+
+    async def async_restore_peq_snapshot(self, name: str) -> dict:
+        """Restore a saved PEQ snapshot with the minimal set of changes."""
+        data = await self._peq_snapshots.async_get(name)
+        if data is None:
+            raise HomeAssistantError(f"No PEQ snapshot named '{name}'")
+        if not self.available:
+            raise HomeAssistantError("HTP-1 is not connected")
+
+        started = time.monotonic()
+        try:
+            ops = await self._htp1.restore_peq(peq_snapshot.decode(data))
+        except AioHtp1Exception as err:
+            raise HomeAssistantError(f"Failed to restore PEQ snapshot: {err}") from err
+        elapsed_ms = round((time.monotonic() - started) * 1000, 1)
+
+        LOGGER.info("Restored PEQ snapshot '%s': %d ops in %.1f ms", name, ops, elapsed_ms)
+        return {"name": name, "ops": ops, "elapsed_ms": elapsed_ms}
+
+    async def async_delete_peq_snapshot(self, name: str) -> None:
+        """Delete a saved PEQ snapshot."""
+        if not await self._peq_snapshots.async_delete(name):
+            raise HomeAssistantError(f"No PEQ snapshot named '{name}'")
+
+    # Channel trims
+
+    async def async_set_channel_trims(
+        self, trims: dict[str, float], relative: bool = False
+    ) -> None:
+        """Set any subset of channel trims in one transaction."""
+        if not self.available:
+            raise HomeAssistantError("HTP-1 is not connected")
+        if self._htp1.lock_controls_when_off and self._htp1.power in (False, 0):
+            raise HomeAssistantError("HTP-1 is in standby and controls are locked")
+
+        if relative:
+            current = self._htp1.channel_trims
+            trims = {ch: current.get(ch, 0) + offset for ch, offset in trims.items()}
+
+        try:
+            async with self._htp1:
+                self._htp1.set_channel_trims(trims)
+                await self._htp1.commit()
+        except AioHtp1Exception as err:
+            raise HomeAssistantError(f"Failed to set channel trims: {err}") from err
+
+    # Change history
+
+    async def async_query_history(
+        self,
+        path: str | None = None,
+        since: float | None = None,
+        limit: int | None = None,
+    ) -> dict:
+        """Return recorded msoupdate changes, per path."""
+        history = self._htp1.history
+        if history is None:
+            raise HomeAssistantError("Change history is disabled in the integration options")
+        return {"paths": history.query(path, since, limit)}
+
+    # Frame capture
+
+    async def async_start_frame_capture(self, file: str | None = None) -> None:
+        """Record received websocket frames for scripts/htp1_replay.py."""
+        if file is None:
+            file = f"htp1_capture_{time.strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+        path = self._resolve_config_path(file)
+        try:
+            self._htp1.start_capture(path)
+        except AioHtp1Exception as err:
+            raise HomeAssistantError(str(err)) from err
+        LOGGER.info("Capturing HTP-1 frames to %s", path)
+
+    async def async_stop_frame_capture(self) -> dict:
+        """Stop recording frames; returns the file and the number of frames."""
+        recorder = self._htp1.stop_capture()
+        if recorder is None:
+            raise HomeAssistantError("No frame capture in progress")
+        LOGGER.info("Captured %d HTP-1 frames to %s", recorder.frames, recorder.path)
+        return {"file": recorder.path, "frames": recorder.frames}
+
+    # Scenes
+
+    async def async_apply_scene(self, name: str | None = None, **settings) -> None:
+        """Apply a stored and/or inline scene as one atomic changemso."""
+        settings = {k: v for k, v in settings.items() if k in scene.SCENE_KEYS}
+        if name is not None:
+            stored = await self._scenes.async_get(name)
+            if stored is None:
+                raise HomeAssistantError(f"No scene named '{name}'")
+            settings = {**stored, **settings}
+        if not settings:
+            raise HomeAssistantError("Either 'name' or at least one setting must be provided")
+
+        if not self.available:
+            raise HomeAssistantError("HTP-1 is not connected")
+        if self._htp1.lock_controls_when_off and self._htp1.power in (False, 0):
+            raise HomeAssistantError("HTP-1 is in standby and controls are locked")
+
+        try:
+            async with self._htp1:
+                scene.apply(self._htp1, settings)
+                await self._htp1.commit()
+        except (scene.SceneError, AioHtp1Exception) as err:
+            raise HomeAssistantError(f"Failed to apply scene: {err}") from err
+
+        LOGGER.info("Applied scene %s: %s", name or "(inline)", ", ".join(settings))
+
+    async def async_save_scene(self, name: str, **settings) -> None:
+        """Store a scene; without settings the current device state is captured."""
+        settings = {k: v for k, v in settings.items() if k in scene.SCENE_KEYS}
+        if not settings:
+            if not self.available:
+                raise HomeAssistantError("HTP-1 is not connected")
+            settings = scene.capture(self._htp1)
+        await self._scenes.async_set(name, settings)
+        LOGGER.info("Saved scene '%s': %s", name, settings)
+
+    async def async_delete_scene(self, name: str) -> None:
+        """Delete a stored scene."""
+        if not await self._scenes.async_delete(name):
+            raise HomeAssistantError(f"No scene named '{name}'")
+
+    async def async_import_beq_catalogue(self, source: str | None = None) -> None:
+        """Import the BEQ catalogue from a local file or mirror URL and persist it."""
+        source = self._resolve_beq_source(source or self._beq_source)
+        session = async_get_clientsession(self.hass)
+        try:
+            catalogue = await beq.async_import_catalogue(session, source)
+        except beq.CatalogueError as err:
+            raise HomeAssistantError(f"Failed to import BEQ catalogue: {err}") from err
+
+        LOGGER.info(
+            "Imported BEQ catalogue from %s: %d entries",
+            source or beq.BEQ_DB_URL,
+            len(catalogue),
+        )
+
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8-sig", errors="replace") as f:
+        return f.read()
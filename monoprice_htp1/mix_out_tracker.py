@@ -2,9 +2,12 @@
 
 Provides:
   - MixOutTracker: internal helper that subscribes to /volume and writes
-    secondaryVolume to the device whenever tracking is enabled.
+    secondaryVolume to the device whenever tracking is enabled. Targets
+    come from a lookup table over the calibrated volume range.
   - Htp1MixOutTrackingSwitch: HA switch entity (RestoreEntity) that
     enables/disables tracking and owns the MixOutTracker instance.
+  - Htp1MixOutLeadingEdgeSwitch: selects leading-edge, rate-limited
+    writes instead of the default trailing debounce.
   - Five RestoreNumber entities for the tracking parameters:
       * mix_out_tracking_offset  (dB, static offset added to shaped value)
       * mix_out_tracking_thresh  (dB, threshold below which curve kicks in)
@@ -19,14 +22,20 @@ import asyncio
 import logging
 from typing import Callable
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Home Assistant
+    np = None
+
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN, ui_lock_signal
+from . import availability
+from .const import DOMAIN
 from .helpers import schedule_entity_update_threadsafe
+from .throttle import Throttle
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,6 +90,42 @@ def compute_mix_out_volume(
     return int(min(value, 0))
 
 
+def compute_mix_out_lut(
+    low: int,
+    high: int,
+    offset: float,
+    thresh: float,
+    boost: float,
+    exp: float,
+    vol_min: float,
+    curve_enabled: bool = False,
+) -> tuple[int, ...]:
+    """compute_mix_out_volume() for every integer dB from low to high.
+
+    Entry i is the Mix Out volume for main volume low + i. NumPy evaluates
+    the whole range in one pass when available; the results are identical
+    to the scalar function either way.
+    """
+    if high < low:
+        return ()
+    if np is None:
+        return tuple(
+            compute_mix_out_volume(main, offset, thresh, boost, exp, vol_min, curve_enabled)
+            for main in range(low, high + 1)
+        )
+
+    main = np.arange(low, high + 1, dtype=float)
+    shaped = main
+    if curve_enabled:
+        denom = vol_min - thresh
+        if denom != 0:
+            t = np.clip((main - thresh) / denom, 0.0, 1.0)
+            shaped = np.where(main >= thresh, main, main + boost * t**exp)
+        # np.round rounds half to even, like round().
+        shaped = np.round(shaped)
+    return tuple(int(v) for v in np.minimum(shaped + offset, 0).astype(int))
+
+
 # ---------------------------------------------------------------------------
 # Internal tracker (not an HA entity)
 # ---------------------------------------------------------------------------
@@ -97,12 +142,66 @@ class MixOutTracker:
         self._enabled = False
         self._unsub_volume: Callable[[], None] | None = None
         self._pending_task: asyncio.Task | None = None
+        # Leading-edge mode: write at once, then at most once per delay.
+        self._throttle: Throttle | None = None
+
+        # Mix Out volume per main volume over the calibrated range, rebuilt
+        # when a tracking parameter or the range changes.
+        self._lut: tuple[int, ...] = ()
+        self._lut_low = 0
+        self._lut_version: tuple[int, ...] | None = None
+        self.on_curve_change: Callable[[], None] | None = None
 
     # --- parameter sources (set by the switch after entities are available) ---
 
     def _get_param(self, attr: str, default: float) -> float:
         return float(getattr(self._htp1, attr, default))
 
+    def _params(self) -> tuple:
+        return (
+            self._get_param("mix_out_tracking_offset", 0.0),
+            self._get_param("mix_out_tracking_thresh", -20.0),
+            self._get_param("mix_out_tracking_boost",  12.0),
+            self._get_param("mix_out_tracking_exp",     1.0),
+            self._get_param("mix_out_tracking_vol_min", -60.0),
+            bool(getattr(self._htp1, "mix_out_tracking_curve_enabled", False)),
+        )
+
+    # --- lookup table ---
+
+    def invalidate(self) -> None:
+        """Drop the lookup table after a tracking parameter changed."""
+        self._lut_version = None
+        if self.on_curve_change is not None:
+            self.on_curve_change()
+
+    def _table(self) -> tuple[int, tuple[int, ...]]:
+        # Parameter changes, including restored entity values, call
+        # invalidate(); only the calibrated range is tracked here.
+        version = self._htp1.version("cal")
+        if version != self._lut_version:
+            try:
+                low, high = int(self._htp1.cal_vpl), int(self._htp1.cal_vph)
+            except (TypeError, ValueError):
+                low, high = 0, -1  # range not known (disconnected)
+            self._lut_low = low
+            self._lut = compute_mix_out_lut(low, high, *self._params())
+            self._lut_version = version
+        return self._lut_low, self._lut
+
+    def target_for(self, main) -> int:
+        """Mix Out volume for a main volume, from the lookup table when in range."""
+        low, lut = self._table()
+        i = main - low
+        if i == int(i) and 0 <= i < len(lut):
+            return lut[int(i)]
+        return compute_mix_out_volume(main, *self._params())
+
+    def curve(self) -> list[list[int]]:
+        """[main dB, Mix Out dB] pairs over the calibrated range."""
+        low, lut = self._table()
+        return [[low + i, v] for i, v in enumerate(lut)]
+
     # --- lifecycle ---
 
     def enable(self) -> None:
@@ -110,8 +209,8 @@ class MixOutTracker:
             return
         self._enabled = True
         self._unsub_volume = self._htp1.subscribe("/volume", self._on_volume_update)
-        # Store reference on htp1 so parameter entities can trigger recalculate().
-        self._htp1.mix_out_tracker = self
+        # Parameters may have changed while tracking was off.
+        self.invalidate()
         # Sync secondaryPowerOnVolume immediately when tracking is activated.
         self._sync_power_on_volume()
 
@@ -127,24 +226,40 @@ class MixOutTracker:
         if self._pending_task is not None and not self._pending_task.done():
             self._pending_task.cancel()
         self._pending_task = None
-        # Clear reference so parameter entities do not call a disabled tracker.
-        if getattr(self._htp1, "mix_out_tracker", None) is self:
-            self._htp1.mix_out_tracker = None
+        if self._throttle is not None:
+            self._throttle.cancel()
 
     # --- callback / recalculate ---
 
     def _on_volume_update(self, value=None) -> None:
         """Called by aiohtp1 on every /volume WebSocket update.
 
-        Schedules a debounced write so rapid volume sweeps do not flood
-        the device with WebSocket messages.
+        By default writes are debounced: the Mix Out volume follows once the
+        main volume has been still for the tracking delay. In leading-edge
+        mode the first change is written at once and further ones at most
+        once per delay, with a final write after the last change. Either
+        way rapid volume sweeps do not flood the device.
         """
         if not self._enabled:
             return
+        if getattr(self._htp1, "mix_out_tracking_leading_edge", False):
+            self._hass.loop.call_soon_threadsafe(self._throttled_write)
+            return
         asyncio.run_coroutine_threadsafe(
             self._debounced_recalculate(), self._hass.loop
         )
 
+    def _throttled_write(self) -> None:
+        delay = self._get_param("mix_out_tracking_delay", 0.7)
+        if self._throttle is None:
+            self._throttle = Throttle(
+                delay,
+                lambda: self._hass.loop.create_task(self._do_write()),
+                loop=self._hass.loop,
+            )
+        self._throttle.interval = delay
+        self._throttle()
+
     async def _debounced_recalculate(self) -> None:
         """Cancel any pending write, wait DEBOUNCE_DELAY, then write."""
         if self._pending_task is not None and not self._pending_task.done():
@@ -167,6 +282,7 @@ class MixOutTracker:
         user has finished adjusting, so the write should happen right away.
         Any pending debounced write from a volume update is cancelled first.
         """
+        self.invalidate()
         if not self._enabled:
             return
 
@@ -174,6 +290,8 @@ class MixOutTracker:
         if self._pending_task is not None and not self._pending_task.done():
             self._pending_task.cancel()
             self._pending_task = None
+        if self._throttle is not None:
+            self._throttle.cancel()
 
         asyncio.run_coroutine_threadsafe(
             self._do_write(), self._hass.loop
@@ -189,16 +307,7 @@ class MixOutTracker:
             # Positive values are invalid (device quirk / power-on race).
             return
 
-        offset  = self._get_param("mix_out_tracking_offset", 0.0)
-        thresh  = self._get_param("mix_out_tracking_thresh", -20.0)
-        boost   = self._get_param("mix_out_tracking_boost",  12.0)
-        exp     = self._get_param("mix_out_tracking_exp",     1.0)
-        vol_min = self._get_param("mix_out_tracking_vol_min", -60.0)
-        curve_enabled = bool(getattr(self._htp1, "mix_out_tracking_curve_enabled", False))
-
-        target = compute_mix_out_volume(
-            main, offset, thresh, boost, exp, vol_min, curve_enabled
-        )
+        target = self.target_for(main)
 
         current = getattr(self._htp1, "secondary_volume", None)
         if current == target:
@@ -227,16 +336,7 @@ class MixOutTracker:
         if power_on_vol is None or power_on_vol > 0:
             return
 
-        offset  = self._get_param("mix_out_tracking_offset", 0.0)
-        thresh  = self._get_param("mix_out_tracking_thresh", -20.0)
-        boost   = self._get_param("mix_out_tracking_boost",  12.0)
-        exp     = self._get_param("mix_out_tracking_exp",     1.0)
-        vol_min = self._get_param("mix_out_tracking_vol_min", -60.0)
-        curve_enabled = bool(getattr(self._htp1, "mix_out_tracking_curve_enabled", False))
-
-        target = compute_mix_out_volume(
-            power_on_vol, offset, thresh, boost, exp, vol_min, curve_enabled
-        )
+        target = self.target_for(power_on_vol)
 
         current = getattr(self._htp1, "secondary_poweron_volume", None)
         if current == target:
@@ -257,12 +357,19 @@ class MixOutTracker:
 
 
 def _trigger_recalculate(htp1) -> None:
-    """Call recalculate() on the active MixOutTracker if one exists."""
+    """Call recalculate() on the MixOutTracker if one exists (it writes only while enabled)."""
     tracker = getattr(htp1, "mix_out_tracker", None)
     if tracker is not None:
         tracker.recalculate()
 
 
+def _invalidate_curve(htp1) -> None:
+    """Drop the tracker's lookup table after a restored parameter was set."""
+    tracker = getattr(htp1, "mix_out_tracker", None)
+    if tracker is not None:
+        tracker.invalidate()
+
+
 # ---------------------------------------------------------------------------
 # Tracking switch entity
 # ---------------------------------------------------------------------------
@@ -277,6 +384,8 @@ class Htp1MixOutTrackingSwitch(SwitchEntity, RestoreEntity):
     _attr_has_entity_name = True
     _attr_icon = "mdi:link-variant"
     _attr_entity_registry_enabled_default = True
+    # The curve only changes with the tracking parameters; keep it out of history.
+    _unrecorded_attributes = frozenset({"curve"})
 
     def __init__(self, htp1, entry_id: str) -> None:
         self._htp1 = htp1
@@ -295,21 +404,30 @@ class Htp1MixOutTrackingSwitch(SwitchEntity, RestoreEntity):
         )
 
         self._unsubs: list[Callable[[], None]] = []
-        self._unsub_ui_lock: Callable[[], None] | None = None
 
     @property
     def available(self) -> bool:
-        return bool(getattr(self._htp1, "connected", False))
+        return self._htp1.availability.is_available(availability.CONNECTED)
 
     @property
     def is_on(self) -> bool:
         return self._tracking_on
 
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        if not self._htp1.connected:
+            return None
+        # [main dB, Mix Out dB] pairs for graphing the tracking curve.
+        return {"curve": self._tracker.curve()}
+
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
         # Inject hass into the tracker now that it is available.
         self._tracker._hass = self.hass
+        self._tracker.on_curve_change = self._handle_update
+        # Store reference on htp1 so parameter entities can trigger recalculate().
+        self._htp1.mix_out_tracker = self._tracker
 
         # Restore previous state.
         last = await self.async_get_last_state()
@@ -318,18 +436,20 @@ class Htp1MixOutTrackingSwitch(SwitchEntity, RestoreEntity):
             self._tracker.enable()
 
         # Refresh when connection state changes.
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry_id), self._handle_update
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONNECTED, self._handle_update)
         )
+        # The curve spans the calibrated volume range.
+        for path in ("/cal/vpl", "/cal/vph"):
+            self._unsubs.append(self._htp1.subscribe(path, self._handle_update))
 
         schedule_entity_update_threadsafe(self)
 
     async def async_will_remove_from_hass(self) -> None:
         self._tracker.disable()
+        self._tracker.on_curve_change = None
+        if getattr(self._htp1, "mix_out_tracker", None) is self._tracker:
+            self._htp1.mix_out_tracker = None
         for unsub in self._unsubs:
             if callable(unsub):
                 try:
@@ -337,11 +457,6 @@ class Htp1MixOutTrackingSwitch(SwitchEntity, RestoreEntity):
                 except Exception:
                     pass
         self._unsubs = []
-        if callable(self._unsub_ui_lock):
-            try:
-                self._unsub_ui_lock()
-            except Exception:
-                pass
 
     async def async_turn_on(self, **kwargs) -> None:
         self._tracking_on = True
@@ -412,7 +527,7 @@ class Htp1LocalNumber(NumberEntity, RestoreEntity):
 
     @property
     def available(self) -> bool:
-        return bool(getattr(self._htp1, "connected", False))
+        return self._htp1.availability.is_available(availability.CONNECTED)
 
     @property
     def native_value(self) -> float:
@@ -436,11 +551,12 @@ class Htp1LocalNumber(NumberEntity, RestoreEntity):
                 setattr(self._htp1, self._htp1_attr, self._default)
         else:
             setattr(self._htp1, self._htp1_attr, self._default)
+        _invalidate_curve(self._htp1)
 
         # Refresh availability when connection changes.
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONNECTED, self._handle_update)
+        )
 
         schedule_entity_update_threadsafe(self)
 
@@ -493,7 +609,7 @@ class Htp1MixOutMuteTrackingSwitch(SwitchEntity, RestoreEntity):
 
     @property
     def available(self) -> bool:
-        return bool(getattr(self._htp1, "connected", False))
+        return self._htp1.availability.is_available(availability.CONNECTED)
 
     @property
     def is_on(self) -> bool:
@@ -507,15 +623,9 @@ class Htp1MixOutMuteTrackingSwitch(SwitchEntity, RestoreEntity):
         if self._enabled:
             self._subscribe_mute()
 
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry_id), self._handle_update
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONNECTED, self._handle_update)
         )
-        if callable(unsub_lock):
-            self._unsubs.append(unsub_lock)
 
         schedule_entity_update_threadsafe(self)
 
@@ -610,7 +720,7 @@ class Htp1MixOutCurveSwitch(SwitchEntity, RestoreEntity):
 
     @property
     def available(self) -> bool:
-        return bool(getattr(self._htp1, "connected", False))
+        return self._htp1.availability.is_available(availability.CONNECTED)
 
     @property
     def is_on(self) -> bool:
@@ -623,10 +733,11 @@ class Htp1MixOutCurveSwitch(SwitchEntity, RestoreEntity):
         last = await self.async_get_last_state()
         enabled = (last is not None and last.state == "on")
         self._htp1.mix_out_tracking_curve_enabled = enabled
+        _invalidate_curve(self._htp1)
 
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONNECTED, self._handle_update)
+        )
 
         schedule_entity_update_threadsafe(self)
 
@@ -654,6 +765,82 @@ class Htp1MixOutCurveSwitch(SwitchEntity, RestoreEntity):
     def _handle_update(self, *args) -> None:
         schedule_entity_update_threadsafe(self)
 
+# ---------------------------------------------------------------------------
+# Leading-edge mode switch
+# ---------------------------------------------------------------------------
+
+class Htp1MixOutLeadingEdgeSwitch(SwitchEntity, RestoreEntity):
+    """HA switch that selects leading-edge, rate-limited tracking writes.
+
+    When off, Mix Out follows once the main volume has been still for the
+    tracking delay (debounce). When on, the first change is written at once
+    and further ones at most once per tracking delay, with a final write
+    after the last change. Defaults to off. State is persisted via
+    RestoreEntity.
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:transfer-right"
+    _attr_entity_registry_enabled_default = True
+
+    def __init__(self, htp1, entry_id: str) -> None:
+        self._htp1 = htp1
+        self._entry_id = entry_id
+
+        self._attr_unique_id = f"{entry_id}_mix_out_tracking_leading_edge"
+        self._attr_name = "Mix Out Tracking Leading Edge"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            manufacturer="Monoprice",
+            model="HTP-1",
+            name="HTP-1",
+        )
+
+        self._unsubs: list[Callable[[], None]] = []
+
+    @property
+    def available(self) -> bool:
+        return self._htp1.availability.is_available(availability.CONNECTED)
+
+    @property
+    def is_on(self) -> bool:
+        return bool(getattr(self._htp1, "mix_out_tracking_leading_edge", False))
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        # Restore previous state; default is off.
+        last = await self.async_get_last_state()
+        self._htp1.mix_out_tracking_leading_edge = (last is not None and last.state == "on")
+
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONNECTED, self._handle_update)
+        )
+
+        schedule_entity_update_threadsafe(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        for unsub in self._unsubs:
+            if callable(unsub):
+                try:
+                    unsub()
+                except Exception:
+                    pass
+        self._unsubs = []
+
+    async def async_turn_on(self, **kwargs) -> None:
+        self._htp1.mix_out_tracking_leading_edge = True
+        schedule_entity_update_threadsafe(self)
+
+    async def async_turn_off(self, **kwargs) -> None:
+        self._htp1.mix_out_tracking_leading_edge = False
+        schedule_entity_update_threadsafe(self)
+
+    def _handle_update(self, *args) -> None:
+        schedule_entity_update_threadsafe(self)
+
+
 # ---------------------------------------------------------------------------
 # Factory – called from switch.py / number.py async_setup_entry
 # ---------------------------------------------------------------------------
@@ -708,13 +895,14 @@ _TRACKING_NUMBER_DEFS = [
 
 
 def build_mix_out_tracking_switches(htp1, entry_id: str) -> list:
-    """Return switch-platform entities: tracking toggle + curve toggle.
+    """Return switch-platform entities: tracking, curve, mode and mute toggles.
 
     Called from switch.py async_setup_entry.
     """
     return [
         Htp1MixOutTrackingSwitch(htp1, entry_id),
         Htp1MixOutCurveSwitch(htp1, entry_id),
+        Htp1MixOutLeadingEdgeSwitch(htp1, entry_id),
         Htp1MixOutMuteTrackingSwitch(htp1, entry_id),
     ]
 
@@ -0,0 +1,83 @@
+"""Structural diff of HTP-1 mso state trees as RFC 6902 JSON-Patch ops.
+
+The ops use the same {"op", "path", "value"} form that Htp1.send_raw_ops()
+sends and Htp1._cmd_msoupdate() applies, so a diff between two snapshots can
+be sent to the device or replayed locally.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def escape(token: str) -> str:
+    """Escape a key for use as a JSON Pointer token (RFC 6901)."""
+    if "~" in token or "/" in token:
+        return token.replace("~", "~0").replace("/", "~1")
+    return token
+
+
+def unescape(token: str) -> str:
+    """Inverse of escape()."""
+    if "~" in token:
+        return token.replace("~1", "/").replace("~0", "~")
+    return token
+
+
+def same(a: Any, b: Any) -> bool:
+    """Deep equality of device values, where booleans are not numbers.
+
+    True == 1 in Python but the device distinguishes them, as does the
+    RFC 6902 test op.
+    """
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(same(v, b[k]) for k, v in a.items())
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def diff(src: Any, dst: Any, path: str = "") -> list[dict]:
+    """Return the ops that turn src into dst.
+
+    Dicts are diffed per key and lists per index (a length change adds or
+    removes trailing elements); other values that differ are replaced whole.
+    Identical objects are skipped without being walked, so diffing a tree
+    against a partially shared copy only visits the parts that were copied.
+    """
+    ops: list[dict] = []
+    _diff(src, dst, path, ops)
+    return ops
+
+
+def _diff(src: Any, dst: Any, path: str, ops: list[dict]) -> None:
+    if src is dst:
+        return
+
+    if isinstance(src, dict) and isinstance(dst, dict):
+        for key, value in dst.items():
+            child = f"{path}/{escape(key)}"
+            if key in src:
+                _diff(src[key], value, child, ops)
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        for key in src:
+            if key not in dst:
+                ops.append({"op": "remove", "path": f"{path}/{escape(key)}"})
+        return
+
+    if isinstance(src, list) and isinstance(dst, list):
+        common = min(len(src), len(dst))
+        for idx in range(common):
+            _diff(src[idx], dst[idx], f"{path}/{idx}", ops)
+        for idx in range(common, len(dst)):
+            ops.append({"op": "add", "path": f"{path}/{idx}", "value": dst[idx]})
+        # Remove from the end so earlier indices stay valid.
+        for idx in range(len(src) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{idx}"})
+        return
+
+    if not same(src, dst):
+        ops.append({"op": "replace", "path": path, "value": dst})
@@ -1,120 +1,94 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
+from operator import methodcaller
 from typing import Any, Callable
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, ui_lock_signal
+from . import availability
+from .aiohtp1 import CHANNEL_TRIM_MAX, CHANNEL_TRIM_MIN, CHANNEL_TRIM_STEP
+from .const import DOMAIN
 from .helpers import schedule_entity_update_threadsafe
+from .layout import ChannelEntityManager, trim_channel, trim_definitions, trim_unique_ids
+from .registry import number_fields
 
 _LOGGER = logging.getLogger(__name__)
 
+# Volume is locked in standby regardless of the UI lock toggle; everything
+# else not listed follows the toggle.
+_NUMBER_AVAILABILITY = {
+    "volume": availability.POWERED,
+    "shaker_trim": availability.SHAKER,
+    "secondary_volume": availability.MIX_OUT,
+    "secondary_poweron_volume": availability.MIX_OUT,
+}
+
 # -------------------------------------------------------------
 #  HTP-1 Numbers
 # -------------------------------------------------------------
+def _trim_number_fields(ch: str) -> dict[str, Any]:
+    return {
+        "min": CHANNEL_TRIM_MIN,
+        "max": CHANNEL_TRIM_MAX,
+        "step": CHANNEL_TRIM_STEP,
+        "get_fn": methodcaller("channel_trim", ch),
+        "set_fn": lambda h, v: h.set_channel_trim(ch, v),
+    }
+
+
 NUMBER_DEFINITIONS = [
     {
         "key": "volume",
         "name": "Volume",
-        "path": "/volume",
-        "min": lambda h: h.cal_vpl,
-        "max": lambda h: h.cal_vph,
-        "step": 1,
-        "get_fn": lambda h: h.volume,
-        "set_fn": lambda h, v: setattr(h, "volume", v),
+        **number_fields("volume"),
     },
     {
         "key": "secondary_volume",
         "name": "Mix Out Volume",
-        "path": "/secondaryVolume",
-        "min": lambda h: h.cal_vpl,
-        "max": lambda h: h.cal_vph,
-        "step": 1,
-        "get_fn": lambda h: h.secondary_volume,
-        "set_fn": lambda h, v: setattr(h, "secondary_volume", v),
+        **number_fields("secondary_volume"),
     },
     {
         "key": "secondary_poweron_volume",
         "name": "Mix Out Power On Volume",
-        "path": "/secondaryPowerOnVolume",
-        "min": lambda h: h.cal_vpl,
-        "max": lambda h: h.cal_vph,
-        "step": 1,
-        "get_fn": lambda h: h.secondary_poweron_volume,
-        "set_fn": lambda h, v: setattr(h, "secondary_poweron_volume", v),
+        **number_fields("secondary_poweron_volume"),
     },
     {
         "key": "dialogenh",
         "name": "Dialog Enhance",
-        "path": "/dialogEnh",
-        "min": 0,
-        "max": 6,
-        "step": 1,
-        "get_fn": lambda h: h.dialogenh,
-        "set_fn": lambda h, v: setattr(h, "dialogenh", v),
+        **number_fields("dialogenh"),
     },
     {
         "key": "bass_level",
         "name": "Bass Level",
-        "path": "/eq/bass/level",
-        "min": -12,
-        "max": 12,
-        "step": 1,
-        "get_fn": lambda h: h.bass_level,
-        "set_fn": lambda h, v: setattr(h, "bass_level", v),
+        **number_fields("bass_level"),
     },
     {
         "key": "bass_frequency",
         "name": "Bass Corner Frequency",
-        "path": "/eq/bass/freq",
-        "min": 20,
-        "max": 200,
-        "step": 1,
-        "get_fn": lambda h: h.bass_frequency,
-        "set_fn": lambda h, v: setattr(h, "bass_frequency", v),
+        **number_fields("bass_frequency"),
     },
     {
         "key": "treble_level",
         "name": "Treble Level",
-        "path": "/eq/treble/level",
-        "min": -12,
-        "max": 12,
-        "step": 1,
-        "get_fn": lambda h: h.treble_level,
-        "set_fn": lambda h, v: setattr(h, "treble_level", v),
+        **number_fields("treble_level"),
     },
     {
         "key": "treble_frequency",
         "name": "Treble Corner Frequency",
-        "path": "/eq/treble/freq",
-        "min": 2500,
-        "max": 8000,
-        "step": 100,
-        "get_fn": lambda h: h.treble_frequency,
-        "set_fn": lambda h, v: setattr(h, "treble_frequency", v),
+        **number_fields("treble_frequency"),
     },
     {
         "key": "lipsync_delay",
         "name": "Lipsync Delay",
-        "path": "/cal/lipsync",
-        "min": 0,
-        "max": 340,
-        "step": 1,
-        "get_fn": lambda h: h.lipsync_delay,
-        "set_fn": lambda h, v: setattr(h, "lipsync_delay", v),
+        **number_fields("lipsync_delay"),
     },
     {
         "key": "display_brightness",
         "name": "Display Brightness",
-        "path": "/hw/fpBright",
-        "min": 0,
-        "max": 7,
-        "step": 1,
-        "get_fn": lambda h: h.display_brightness,
-        "set_fn": lambda h, v: setattr(h, "display_brightness", v),
+        **number_fields("display_brightness"),
     },
     {
         "key": "cal_current_dirac_slot",
@@ -128,238 +102,17 @@ NUMBER_DEFINITIONS = [
         "get_fn": lambda h: h.cal_current_dirac_slot,
         "set_fn": lambda h, v: setattr(h, "cal_current_dirac_slot", int(v)),
     },
-    {
-        "key": "channeltrim_right",
-        "name": "Trim Right",
-        "path": "/channeltrim/channels/rf",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_right,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_right", v),
-    },
-    {
-        "key": "channeltrim_left",
-        "name": "Trim Left",
-        "path": "/channeltrim/channels/lf",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_left,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_left", v),
-    },
-    {
-        "key": "channeltrim_center",
-        "name": "Trim Center",
-        "path": "/channeltrim/channels/c",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_center,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_center", v),
-    },
-    {
-        "key": "channeltrim_lfe",
-        "name": "Trim LFE",
-        "path": "/channeltrim/channels/lfe",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_lfe,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_lfe", v),
-    },
-    {
-        "key": "channeltrim_rightsurround",
-        "name": "Trim Right Surround",
-        "path": "/channeltrim/channels/rs",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rightsurround,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rightsurround", v),
-    },
-    {
-        "key": "channeltrim_leftsurround",
-        "name": "Trim Left Surround",
-        "path": "/channeltrim/channels/ls",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_leftsurround,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_leftsurround", v),
-    },
-    {
-        "key": "channeltrim_rightback",
-        "name": "Trim Right Back",
-        "path": "/channeltrim/channels/rb",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rightback,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rightback", v),
-    },
-    {
-        "key": "channeltrim_leftback",
-        "name": "Trim Left Back",
-        "path": "/channeltrim/channels/lb",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_leftback,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_leftback", v),
-    },
-    {
-        "key": "channeltrim_ltf",
-        "name": "Trim Left Top Front",
-        "path": "/channeltrim/channels/ltf",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_ltf,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_ltf", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rtf",
-        "name": "Trim Right Top Front",
-        "path": "/channeltrim/channels/rtf",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rtf,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rtf", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_ltm",
-        "name": "Trim Left Top Middle",
-        "path": "/channeltrim/channels/ltm",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_ltm,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_ltm", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rtm",
-        "name": "Trim Right Top Middle",
-        "path": "/channeltrim/channels/rtm",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rtm,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rtm", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_ltr",
-        "name": "Trim Left Top Rear",
-        "path": "/channeltrim/channels/ltr",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_ltr,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_ltr", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rtr",
-        "name": "Trim Right Top Rear",
-        "path": "/channeltrim/channels/rtr",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rtr,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rtr", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_lw",
-        "name": "Trim Left Wide",
-        "path": "/channeltrim/channels/lw",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_lw,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_lw", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rw",
-        "name": "Trim Right Wide",
-        "path": "/channeltrim/channels/rw",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rw,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rw", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_lfh",
-        "name": "Trim Left Front Height",
-        "path": "/channeltrim/channels/lfh",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_lfh,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_lfh", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rfh",
-        "name": "Trim Right Front Height",
-        "path": "/channeltrim/channels/rfh",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rfh,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rfh", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_lhb",
-        "name": "Trim Left Height Back",
-        "path": "/channeltrim/channels/lhb",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_lhb,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_lhb", v),
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rhb",
-        "name": "Trim Right Height Back",
-        "path": "/channeltrim/channels/rhb",
-        "min": -12,
-        "max": 12,
-        "step": 0.25,
-        "get_fn": lambda h: h.channeltrim_rhb,
-        "set_fn": lambda h, v: setattr(h, "channeltrim_rhb", v),
-        "entity_registry_enabled_default": False,
-    },
+    *trim_definitions(_trim_number_fields),
     {
         "key": "loudness_cal",
         "name": "Loudness Calibration",
-        "path": "/loudnessCal",
-        "min": 60,
-        "max": 90,
-        "step": 1,
-        "get_fn": lambda h: h.loudness_cal,
-        "set_fn": lambda h, v: setattr(h, "loudness_cal", v),
+        **number_fields("loudness_cal"),
     },
     {
         "key": "shaker_trim",
         "name": "Seat Shaker Trim",
-        "path": "/shaker/trim",
-        "min": -24,
-        "max": 6,
-        "step": 1,
+        **number_fields("shaker_trim"),
         "icon": "mdi:vibrate",
-        "get_fn": lambda h: h.shaker_trim,
-        "set_fn": lambda h, v: setattr(h, "shaker_trim", v),
     },
 ]
 
@@ -367,30 +120,43 @@ NUMBER_DEFINITIONS = [
 # -------------------------------------------------------------
 # HTP-1 number entities
 # -------------------------------------------------------------
+def _build_number(htp1, entry_id: str, cfg: dict) -> Htp1Number:
+    mode = NumberMode.BOX if cfg.get("mode") == "box" else None
+    return Htp1Number(
+        htp1=htp1,
+        entry_id=entry_id,
+        key=cfg["key"],
+        name=cfg["name"],
+        path=cfg["path"],
+        min=cfg["min"],
+        max=cfg["max"],
+        step=cfg["step"],
+        get_fn=cfg["get_fn"],
+        set_fn=cfg["set_fn"],
+        entity_registry_enabled_default=cfg.get(
+            "entity_registry_enabled_default", True
+        ),
+        icon=cfg.get("icon"),
+        mode=mode,
+    )
+
+
 def build_htp1_numbers(htp1, entry_id: str):
-    entities = []
-    for cfg in NUMBER_DEFINITIONS:
-        mode = NumberMode.BOX if cfg.get("mode") == "box" else None
-        entities.append(
-            Htp1Number(
-                htp1=htp1,
-                entry_id=entry_id,
-                key=cfg["key"],
-                name=cfg["name"],
-                path=cfg["path"],
-                min=cfg["min"],
-                max=cfg["max"],
-                step=cfg["step"],
-                get_fn=cfg["get_fn"],
-                set_fn=cfg["set_fn"],
-                entity_registry_enabled_default=cfg.get(
-                    "entity_registry_enabled_default", True
-                ),
-                icon=cfg.get("icon"),
-                mode=mode,
-            )
-        )
-    return entities
+    """Numbers that do not depend on the speaker layout."""
+    return [
+        _build_number(htp1, entry_id, cfg)
+        for cfg in NUMBER_DEFINITIONS
+        if trim_channel(cfg) is None
+    ]
+
+
+def trim_number_factories(htp1, entry_id: str) -> dict[str, Callable[[], Htp1Number]]:
+    """Per-channel trim number builders, for the layout-driven ChannelEntityManager."""
+    return {
+        ch: partial(_build_number, htp1, entry_id, cfg)
+        for cfg in NUMBER_DEFINITIONS
+        if (ch := trim_channel(cfg)) is not None
+    }
 
 
 # -------------------------------------------------------------
@@ -409,6 +175,17 @@ async def async_setup_entry(hass, entry, async_add_entities):
     # Request an immediate first update so entities don't sit at unknown.
     async_add_entities(entities, True)
 
+    # Channel trims only for speakers present in the current layout.
+    trims = ChannelEntityManager(
+        hass,
+        htp1,
+        "number",
+        trim_number_factories(htp1, entry.entry_id),
+        trim_unique_ids(entry.entry_id, NUMBER_DEFINITIONS),
+        async_add_entities,
+    )
+    entry.async_on_unload(trims.async_start())
+
 
 # -------------------------------------------------------------
 # NumberEntity
@@ -439,6 +216,7 @@ class Htp1Number(NumberEntity):
         self._set_fn = set_fn
         self._key = key
         self._entry_id = entry_id
+        self._availability = _NUMBER_AVAILABILITY.get(key, availability.CONTROL)
 
         self._attr_unique_id = f"{entry_id}_{key}"
         self._attr_name = name
@@ -497,34 +275,7 @@ class Htp1Number(NumberEntity):
 
     @property
     def available(self) -> bool:
-        if not self._htp1.connected:
-            return False
-
-        # Volume must always be locked when the device is explicitly OFF/standby,
-        # regardless of the UI lock toggle state.
-        if self._key == "volume":
-            pwr = getattr(self._htp1, "power", None)
-            if pwr is False or pwr == 0:
-                return False
-            return True
-
-        # Shaker trim is unavailable when shaker output is off.
-        if self._key == "shaker_trim":
-            if getattr(self._htp1, "shaker_output", None) == "off":
-                return False
-
-        # Mix Out volumes are unavailable when the shaker routes through Mix Out.
-        if self._key in ("secondary_volume", "secondary_poweron_volume"):
-            if getattr(self._htp1, "shaker_output", None) in ("mono17", "diff17"):
-                return False
-
-        # Other numbers: lock only if the UI lock toggle is enabled.
-        if getattr(self._htp1, "lock_controls_when_off", True):
-            pwr = getattr(self._htp1, "power", None)
-            if pwr is False or pwr == 0:
-                return False
-
-        return True
+        return self._htp1.availability.is_available(self._availability)
 
     @property
     def native_value(self):
@@ -576,7 +327,7 @@ class Htp1Number(NumberEntity):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        # Volume UI availability/value depends also on power and power-on volume.
+        # Volume value depends also on power and power-on volume.
         if self._key == "volume":
             unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
             if callable(unsub):
@@ -585,24 +336,9 @@ class Htp1Number(NumberEntity):
             if callable(unsub):
                 self._unsubs.append(unsub)
 
-        # Availability depends on power/connection and UI lock.
-        if self._path != "/powerIsOn":
-            unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-            if callable(unsub):
-                self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        # Shaker/Mix Out availability depends on shaker output routing.
-        if self._key in ("shaker_trim", "secondary_volume", "secondary_poweron_volume"):
-            unsub = self._htp1.subscribe("/shaker/output", self._handle_update)
-            if callable(unsub):
-                self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -613,12 +349,5 @@ class Htp1Number(NumberEntity):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            try:
-                unsub()
-            except Exception:
-                pass
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
@@ -0,0 +1,152 @@
+"""Parsers for PEQ filter exports from REW and miniDSP.
+
+Both parsers return filters in the same type/freq/gain/q form as the BEQ
+catalogue, ready for Htp1.import_peq().
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import xml.etree.ElementTree as ET
+
+from .aiohtp1 import BEQ_SLOT_COUNT, FILTER_TYPE_MAP
+
+DEFAULT_SHELF_Q = 0.7071
+
+# REW filter type codes -> HTP-1 filter types
+REW_TYPES = {
+    "PK": "PeakingEQ",
+    "PEQ": "PeakingEQ",
+    "MODAL": "PeakingEQ",
+    "LS": "LowShelf",
+    "LSC": "LowShelf",
+    "LSQ": "LowShelf",
+    "HS": "HighShelf",
+    "HSC": "HighShelf",
+    "HSQ": "HighShelf",
+}
+
+# miniDSP <type> values -> HTP-1 filter types
+MINIDSP_TYPES = {
+    "PK": "PeakingEQ",
+    "PEAK": "PeakingEQ",
+    "LS": "LowShelf",
+    "SL": "LowShelf",
+    "HS": "HighShelf",
+    "SH": "HighShelf",
+}
+
+_REW_LINE = re.compile(r"^\s*Filter\s+(\d+)\s*:\s*(ON|OFF)\s+(\S+)(.*)$", re.IGNORECASE)
+_REW_FC = re.compile(r"\bFc\s+([-+\d.]+)\s*(k?)Hz", re.IGNORECASE)
+_REW_GAIN = re.compile(r"\bGain\s+([-+\d.]+)\s*dB", re.IGNORECASE)
+_REW_Q = re.compile(r"\bQ\s+([-+\d.]+)", re.IGNORECASE)
+
+
+class PeqImportError(ValueError):
+    """Raised when a filter export cannot be parsed or does not fit the HTP-1."""
+
+
+def parse_rew(text: str) -> list[dict]:
+    """Parse REW "Filter N: ON PK Fc 63.0 Hz Gain -5.0 dB Q 4.00" lines.
+
+    OFF and "None" filters are skipped; other unsupported types raise.
+    """
+    filters = []
+    for line in text.splitlines():
+        match = _REW_LINE.match(line)
+        if not match:
+            continue
+        number, state, code, rest = match.groups()
+        code = code.upper()
+        if state.upper() == "OFF" or code == "NONE":
+            continue
+        ftype = REW_TYPES.get(code)
+        if ftype is None:
+            raise PeqImportError(f"Filter {number}: unsupported REW filter type '{code}'")
+
+        fc = _REW_FC.search(rest)
+        gain = _REW_GAIN.search(rest)
+        q = _REW_Q.search(rest)
+        if not fc or not gain:
+            raise PeqImportError(f"Filter {number}: missing Fc or Gain")
+        if q is None and ftype == "PeakingEQ":
+            raise PeqImportError(f"Filter {number}: missing Q")
+
+        try:
+            filters.append(
+                {
+                    "type": ftype,
+                    "freq": float(fc.group(1)) * (1000 if fc.group(2) else 1),
+                    "gain": float(gain.group(1)),
+                    "q": float(q.group(1)) if q else DEFAULT_SHELF_Q,
+                }
+            )
+        except ValueError as err:
+            raise PeqImportError(f"Filter {number}: {err}") from err
+    return filters
+
+
+def parse_minidsp(text: str) -> list[dict]:
+    """Parse a miniDSP XML filter export (<filter> elements with freq/q/boost/type).
+
+    Bypassed filters are skipped.
+    """
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError as err:
+        raise PeqImportError(f"Invalid miniDSP XML: {err}") from err
+
+    filters = []
+    for elem in root.iter("filter"):
+        name = elem.get("name", "?")
+        if (elem.findtext("bypass") or "0").strip() == "1":
+            continue
+        code = (elem.findtext("type") or "PK").strip().upper()
+        ftype = MINIDSP_TYPES.get(code)
+        if ftype is None:
+            raise PeqImportError(f"Filter {name}: unsupported miniDSP filter type '{code}'")
+        freq = elem.findtext("freq")
+        gain = elem.findtext("boost") or elem.findtext("gain")
+        q = elem.findtext("q")
+        if freq is None or gain is None or q is None:
+            raise PeqImportError(f"Filter {name}: missing freq, boost or q")
+        try:
+            filters.append(
+                {"type": ftype, "freq": float(freq), "gain": float(gain), "q": float(q)}
+            )
+        except ValueError as err:
+            raise PeqImportError(f"Filter {name}: {err}") from err
+    return filters
+
+
+def parse_filters(text: str, fmt: str = "auto") -> list[dict]:
+    """Parse and validate a REW or miniDSP export (auto-detected by default)."""
+    if fmt == "auto":
+        fmt = "minidsp" if text.lstrip().startswith("<") else "rew"
+    if fmt == "minidsp":
+        filters = parse_minidsp(text)
+    elif fmt == "rew":
+        filters = parse_rew(text)
+    else:
+        raise PeqImportError(f"Unknown filter format '{fmt}'")
+    validate_filters(filters)
+    return filters
+
+
+def validate_filters(filters: list[dict]) -> None:
+    """Check a filter list against the HTP-1's slot count and filter types."""
+    if not filters:
+        raise PeqImportError("No active filters found")
+    if len(filters) > BEQ_SLOT_COUNT:
+        raise PeqImportError(
+            f"{len(filters)} filters exceed the {BEQ_SLOT_COUNT} PEQ slots"
+        )
+    for idx, filt in enumerate(filters, 1):
+        if filt["type"] not in FILTER_TYPE_MAP:
+            raise PeqImportError(f"Filter {idx}: unsupported type '{filt['type']}'")
+        for key in ("freq", "gain", "q"):
+            if not math.isfinite(filt[key]):
+                raise PeqImportError(f"Filter {idx}: invalid {key}")
+        if filt["freq"] <= 0 or filt["q"] <= 0:
+            raise PeqImportError(f"Filter {idx}: Fc and Q must be positive")
@@ -0,0 +1,157 @@
+"""Incremental index of free / user / BEQ-tagged PEQ slots."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+# FilterType values: 0=PeakingEQ, 1=LowShelf, 2=HighShelf, 3=AllPass, 4=LPF, 5=HPF
+GAIN_INDEPENDENT_FILTER_TYPES = {3, 4, 5}  # Active even when gaindB == 0
+BEQ_SLOT_COUNT = 16  # Total PEQ slots (0-15)
+
+FREE = 0
+USER = 1
+BEQ = 2
+
+
+def classify(ch_data: dict) -> int:
+    """Classify one slot/channel entry as FREE, USER or BEQ.
+
+    Matches the web UI: a slot is free when its gain is 0 and the filter
+    type is not one that acts regardless of gain.
+    """
+    if ch_data.get("beq"):
+        return BEQ
+    if (ch_data.get("gaindB", 0) == 0
+            and ch_data.get("FilterType", 0) not in GAIN_INDEPENDENT_FILTER_TYPES):
+        return FREE
+    return USER
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the indices of the set bits in mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class PeqOccupancy:
+    """Per-channel bitmasks (bit n = slot n) of free, user and BEQ slots.
+
+    Kept current from msoupdate paths via apply_path(), so BEQ load/clear
+    can query occupancy without walking the slot dicts. Channels that do
+    not appear in any slot read as all-free, like a missing entry does.
+    """
+
+    def __init__(self) -> None:
+        self.slot_count = 0
+        self._masks: dict[str, list[int]] = {}  # ch -> [free, user, beq]
+
+    @classmethod
+    def scan(cls, state: dict[str, Any] | None) -> PeqOccupancy:
+        """Build an index from a full scan of the state."""
+        index = cls()
+        index.rebuild(state)
+        return index
+
+    def rebuild(self, state: dict[str, Any] | None) -> None:
+        self._masks = {}
+        slots = _slots(state)
+        self.slot_count = min(BEQ_SLOT_COUNT, len(slots))
+        for i in range(self.slot_count):
+            self._update_slot(slots, i)
+
+    def apply_path(self, state: dict[str, Any], op: str, path: str) -> None:
+        """Update the index after a patch op on path has been applied."""
+        parts = path[1:].split("/")
+        if parts[0] != "peq":
+            return
+        if len(parts) == 1 or parts[1] != "slots":
+            if len(parts) == 1:
+                self.rebuild(state)
+            return
+        if len(parts) <= 3 and (len(parts) == 2 or op != "replace"):
+            # Whole slot list replaced, or a slot inserted/removed (indices shift).
+            self.rebuild(state)
+            return
+        try:
+            slot = int(parts[2])
+        except ValueError:
+            return
+        if slot >= self.slot_count:
+            return
+        slots = _slots(state)
+        if len(parts) <= 4 or parts[3] != "channels":
+            self._update_slot(slots, slot)
+        else:
+            ch = parts[4]
+            ch_data = _channels(slots[slot]).get(ch, {})
+            self._set(ch, slot, classify(ch_data if isinstance(ch_data, dict) else {}))
+
+    def _update_slot(self, slots: list, slot: int) -> None:
+        channels = _channels(slots[slot])
+        for ch in set(channels) | set(self._masks):
+            ch_data = channels.get(ch, {})
+            self._set(ch, slot, classify(ch_data if isinstance(ch_data, dict) else {}))
+
+    def _set(self, ch: str, slot: int, kind: int) -> None:
+        masks = self._masks.get(ch)
+        if masks is None:
+            # New channel: every other slot reads as free until seen.
+            masks = self._masks[ch] = [self._all, 0, 0]
+        bit = 1 << slot
+        for k in (FREE, USER, BEQ):
+            if k == kind:
+                masks[k] |= bit
+            else:
+                masks[k] &= ~bit
+
+    @property
+    def _all(self) -> int:
+        return (1 << self.slot_count) - 1
+
+    def free(self, ch: str) -> int:
+        masks = self._masks.get(ch)
+        return masks[FREE] if masks else self._all
+
+    def user(self, ch: str) -> int:
+        masks = self._masks.get(ch)
+        return masks[USER] if masks else 0
+
+    def beq(self, ch: str) -> int:
+        masks = self._masks.get(ch)
+        return masks[BEQ] if masks else 0
+
+    def beq_any(self, channels) -> int:
+        """Slots that are BEQ-tagged on any of the given channels."""
+        mask = 0
+        for ch in channels:
+            mask |= self.beq(ch)
+        return mask
+
+    def first_free(self, ch: str, start: int = 0) -> int | None:
+        mask = self.free(ch) >> start
+        if not mask:
+            return None
+        return start + (mask & -mask).bit_length() - 1
+
+    def snapshot(self, channels) -> tuple:
+        """(free, beq) masks for channels, for use in cache keys."""
+        return tuple((self.free(ch), self.beq(ch)) for ch in channels)
+
+
+def _slots(state: dict[str, Any] | None) -> list:
+    if not state:
+        return []
+    peq = state.get("peq")
+    if not isinstance(peq, dict):
+        return []
+    slots = peq.get("slots")
+    return slots if isinstance(slots, list) else []
+
+
+def _channels(slot: Any) -> dict:
+    """The channels dict of a slot entry; anything malformed reads as empty."""
+    channels = slot.get("channels") if isinstance(slot, dict) else None
+    return channels if isinstance(channels, dict) else {}
@@ -0,0 +1,151 @@
+"""Magnitude response of cascaded HTP-1 PEQ filters.
+
+Evaluates PeakingEQ, LowShelf and HighShelf biquads (RBJ cookbook, at the
+HTP-1's 48 kHz processing rate) over a log-spaced frequency grid and reports
+the peak boost of the cascade. Used to tell how much headroom a BEQ profile
+eats before it is loaded.
+
+NumPy is used when available (all filters x all grid points in one pass);
+otherwise a pure-Python loop computes the same result.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Home Assistant
+    np = None
+
+_LOGGER = logging.getLogger(__name__)
+
+SAMPLE_RATE = 48000
+GRID_MIN_HZ = 5.0
+GRID_MAX_HZ = 20000.0
+GRID_POINTS = 480
+
+FILTER_TYPES = ("PeakingEQ", "LowShelf", "HighShelf")
+
+_GRID = [
+    GRID_MIN_HZ * (GRID_MAX_HZ / GRID_MIN_HZ) ** (i / (GRID_POINTS - 1))
+    for i in range(GRID_POINTS)
+]
+
+
+def filters_key(filters: list[dict]) -> tuple[tuple[str, float, float, float], ...]:
+    """Hashable (type, freq, gain, q) form of a filter list, used as cache key."""
+    return tuple(
+        (
+            f.get("type", "PeakingEQ"),
+            float(f.get("freq", 100)),
+            float(f.get("gain", 0)),
+            float(f.get("q", 1)),
+        )
+        for f in filters
+    )
+
+
+def _biquad(ftype: str, freq: float, gain: float, q: float) -> tuple[float, ...]:
+    """RBJ cookbook coefficients (b0, b1, b2, a0, a1, a2)."""
+    a = 10 ** (gain / 40)
+    w0 = 2 * math.pi * freq / SAMPLE_RATE
+    cos_w0 = math.cos(w0)
+    alpha = math.sin(w0) / (2 * q)
+
+    if ftype == "PeakingEQ":
+        return (
+            1 + alpha * a,
+            -2 * cos_w0,
+            1 - alpha * a,
+            1 + alpha / a,
+            -2 * cos_w0,
+            1 - alpha / a,
+        )
+
+    sq = 2 * math.sqrt(a) * alpha
+    if ftype == "LowShelf":
+        return (
+            a * ((a + 1) - (a - 1) * cos_w0 + sq),
+            2 * a * ((a - 1) - (a + 1) * cos_w0),
+            a * ((a + 1) - (a - 1) * cos_w0 - sq),
+            (a + 1) + (a - 1) * cos_w0 + sq,
+            -2 * ((a - 1) + (a + 1) * cos_w0),
+            (a + 1) + (a - 1) * cos_w0 - sq,
+        )
+
+    # HighShelf
+    return (
+        a * ((a + 1) + (a - 1) * cos_w0 + sq),
+        -2 * a * ((a - 1) + (a + 1) * cos_w0),
+        a * ((a + 1) + (a - 1) * cos_w0 - sq),
+        (a + 1) - (a - 1) * cos_w0 + sq,
+        2 * ((a - 1) - (a + 1) * cos_w0),
+        (a + 1) - (a - 1) * cos_w0 - sq,
+    )
+
+
+def _coefficients(key) -> list[tuple[float, ...]]:
+    coeffs = []
+    for ftype, freq, gain, q in key:
+        if ftype not in FILTER_TYPES:
+            _LOGGER.debug("Skipping unsupported filter type in response: %s", ftype)
+            continue
+        if gain == 0 or freq <= 0 or q <= 0:
+            continue  # flat
+        coeffs.append(_biquad(ftype, freq, gain, q))
+    return coeffs
+
+
+@lru_cache(maxsize=256)
+def _response_db(key) -> tuple[float, ...]:
+    """Combined magnitude (dB) of the cascade at every grid frequency."""
+    coeffs = _coefficients(key)
+    if not coeffs:
+        return (0.0,) * GRID_POINTS
+
+    # |b0 + b1 z^-1 + b2 z^-2|^2 on the unit circle
+    #   = b0^2 + b1^2 + b2^2 + 2 (b0 b1 + b1 b2) cos w + 2 b0 b2 cos 2w
+    if np is not None:
+        w = 2 * np.pi * np.asarray(_GRID) / SAMPLE_RATE
+        cos_w = np.cos(w)[np.newaxis, :]
+        cos_2w = np.cos(2 * w)[np.newaxis, :]
+        c = np.asarray(coeffs).T[:, :, np.newaxis]  # (6, n_filters, 1)
+        b0, b1, b2, a0, a1, a2 = c
+        num = b0**2 + b1**2 + b2**2 + 2 * (b0 * b1 + b1 * b2) * cos_w + 2 * b0 * b2 * cos_2w
+        den = a0**2 + a1**2 + a2**2 + 2 * (a0 * a1 + a1 * a2) * cos_w + 2 * a0 * a2 * cos_2w
+        return tuple(float(v) for v in (10 * np.log10(num / den)).sum(axis=0))
+
+    total = [0.0] * GRID_POINTS
+    for i, freq in enumerate(_GRID):
+        w = 2 * math.pi * freq / SAMPLE_RATE
+        cos_w = math.cos(w)
+        cos_2w = math.cos(2 * w)
+        for b0, b1, b2, a0, a1, a2 in coeffs:
+            num = b0 * b0 + b1 * b1 + b2 * b2 + 2 * (b0 * b1 + b1 * b2) * cos_w + 2 * b0 * b2 * cos_2w
+            den = a0 * a0 + a1 * a1 + a2 * a2 + 2 * (a0 * a1 + a1 * a2) * cos_w + 2 * a0 * a2 * cos_2w
+            total[i] += 10 * math.log10(num / den)
+    return tuple(total)
+
+
+def response_db(filters: list[dict]) -> list[tuple[float, float]]:
+    """Return (frequency Hz, dB) pairs of the combined response."""
+    return list(zip(_GRID, _response_db(filters_key(filters))))
+
+
+@lru_cache(maxsize=256)
+def _headroom(key) -> tuple[float, float]:
+    response = _response_db(key)
+    idx = max(range(GRID_POINTS), key=response.__getitem__)
+    return round(response[idx], 2) + 0.0, round(_GRID[idx], 1)  # +0.0 folds -0.0
+
+
+def filter_headroom(filters: list[dict]) -> tuple[float, float]:
+    """Return (peak boost dB, frequency of the peak Hz) for a filter list.
+
+    Results are cached per filter set, so repeated queries for the same
+    catalogue entry or loaded profile cost a dict lookup.
+    """
+    return _headroom(filters_key(filters))
@@ -0,0 +1,59 @@
+"""Compact encoding of /peq snapshots."""
+
+from __future__ import annotations
+
+from typing import Any
+
+STORAGE_VERSION = 1
+
+# Per-channel filter fields, stored positionally when a channel entry has
+# exactly these keys (the common case), otherwise the dict is kept as-is.
+FILTER_FIELDS = ("Fc", "gaindB", "Q", "FilterType")
+_FIELD_SET = set(FILTER_FIELDS)
+
+
+def encode(peq: dict[str, Any]) -> dict[str, Any]:
+    """Return a compact, JSON-serialisable copy of a /peq subtree.
+
+    Channel entries become [Fc, gaindB, Q, FilterType] lists; everything
+    else (BEQ tags, top-level flags) is kept verbatim so decode() is lossless.
+    """
+    data = {k: v for k, v in peq.items() if k != "slots"}
+    slots = peq.get("slots")
+    if isinstance(slots, list):
+        data["slots"] = [_encode_slot(slot) for slot in slots]
+    return data
+
+
+def _encode_slot(slot):
+    if not isinstance(slot, dict) or not isinstance(slot.get("channels"), dict):
+        return slot
+    encoded = dict(slot)
+    encoded["channels"] = {
+        ch: [ch_data[f] for f in FILTER_FIELDS]
+        if isinstance(ch_data, dict) and ch_data.keys() == _FIELD_SET
+        else ch_data
+        for ch, ch_data in slot["channels"].items()
+    }
+    return encoded
+
+
+def decode(data: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of encode()."""
+    peq = {k: v for k, v in data.items() if k != "slots"}
+    slots = data.get("slots")
+    if isinstance(slots, list):
+        peq["slots"] = [_decode_slot(slot) for slot in slots]
+    return peq
+
+
+def _decode_slot(slot):
+    if not isinstance(slot, dict) or not isinstance(slot.get("channels"), dict):
+        return slot
+    decoded = dict(slot)
+    decoded["channels"] = {
+        ch: dict(zip(FILTER_FIELDS, ch_data)) if isinstance(ch_data, list) else ch_data
+        for ch, ch_data in slot["channels"].items()
+    }
+    return decoded
+
@@ -0,0 +1,239 @@
+"""Declarative table of simple HTP-1 mso paths.
+
+Each PathSpec maps one device path to an Htp1 property: its default, whether
+it is writable, optional value transforms and the range used by number
+entities. install() generates the properties once at import time and the
+*_fields() helpers fill the path/accessor part of entity definitions, so a
+path string is only written down here.
+
+Some paths stay hand-written on Htp1 because they are more than one value
+read or written as is:
+
+  /channeltrim/channels/*  a family keyed by channel with its own validated
+                           API (channel_trim(), set_channel_trims()); its
+                           entities are generated from CHANNEL_TRIM_KEYS
+  /cal/currentdiracslot    the setter rejects slots the device lacks with
+                           AioHtp1Exception, which callers rely on
+  /input                   read and written as an input label, resolved
+                           through /inputs
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable
+
+from .msodiff import unescape
+
+Range = float | Callable[[Any], Any] | None
+
+
+@dataclass(frozen=True)
+class PathSpec:
+    name: str
+    path: str
+    default: Any = None
+    writable: bool = True
+    # Getter returns the value staged in the open transaction, if any.
+    staged: bool = False
+    read: Callable[[Any], Any] | None = None
+    write: Callable[[Any], Any] | None = None
+    min: Range = None
+    max: Range = None
+    step: float | None = None
+    keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "keys", tuple(unescape(t) for t in self.path.split("/")[1:])
+        )
+
+
+def _on_off(value) -> bool:
+    return value == "on"
+
+
+def _to_on_off(value) -> str:
+    return "on" if value else "off"
+
+
+def _mute_on(value) -> bool:
+    if isinstance(value, str):
+        return value.lower() == "on"
+    return bool(value)
+
+
+def _preset(value) -> str | None:
+    # false means no preset is active
+    if value is False or value is None:
+        return None
+    try:
+        return str(int(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _cal_vpl(htp1):
+    return htp1.cal_vpl
+
+
+def _cal_vph(htp1):
+    return htp1.cal_vph
+
+
+_VOLUME = {"min": _cal_vpl, "max": _cal_vph, "step": 1}
+
+REGISTRY: tuple[PathSpec, ...] = (
+    # Device info / calibration
+    PathSpec("serial_number", "/versions/SerialNumber", writable=False),
+    PathSpec("cal_vph", "/cal/vph", writable=False),
+    PathSpec("cal_vpl", "/cal/vpl", writable=False),
+    PathSpec("currentlayout", "/cal/currentLayout", writable=False),
+    PathSpec("dirac_active", "/cal/diracactive", staged=True),
+    PathSpec("lipsync_delay", "/cal/lipsync", min=0, max=340, step=1),
+    # Main zone
+    PathSpec("power", "/powerIsOn", staged=True),
+    PathSpec("volume", "/volume", staged=True, **_VOLUME),
+    PathSpec("muted", "/muted", default=False, staged=True),
+    PathSpec("power_on_vol", "/powerOnVol", staged=True),
+    PathSpec("dialnorm", "/dialnorm", staged=True),
+    PathSpec("dialogenh", "/dialogEnh", min=0, max=6, step=1),
+    PathSpec("night_mode", "/night", staged=True),
+    PathSpec("upmix", "/upmix/select", staged=True),
+    PathSpec("widesynth", "/upmix/dts/ws", default=False),
+    PathSpec("aurohs", "/upmix/auro/highSides", default=False, read=_on_off, write=_to_on_off),
+    # Mix Out
+    PathSpec("secondary_volume", "/secondaryVolume", **_VOLUME),
+    PathSpec("secondary_poweron_volume", "/secondaryPowerOnVolume", **_VOLUME),
+    PathSpec("secondary_muted", "/secondaryMuted", default=False, staged=True),
+    # Tone controls
+    PathSpec("tone_control", "/eq/tc", default=False),
+    PathSpec("bass_level", "/eq/bass/level", min=-12, max=12, step=1),
+    PathSpec("bass_frequency", "/eq/bass/freq", min=20, max=200, step=1),
+    PathSpec("treble_level", "/eq/treble/level", min=-12, max=12, step=1),
+    PathSpec("treble_frequency", "/eq/treble/freq", min=2500, max=8000, step=100),
+    # Loudness
+    PathSpec("loudness_raw", "/loudness", default="off", writable=False),
+    PathSpec("loudness_status", "/loudness", default=False, read=_on_off, write=_to_on_off),
+    PathSpec("loudness_cal", "/loudnessCal", min=60, max=90, step=1),
+    PathSpec("loudness_curve", "/loudnessCurve", staged=True),
+    PathSpec("lcvc_selected_curve", "/lcvc/selectedCurve", staged=True),
+    # Front panel
+    PathSpec("display_brightness", "/hw/fpBright", min=0, max=7, step=1),
+    # Video / decoder status
+    PathSpec("video_resolution", "/videostat/VideoResolution", writable=False),
+    PathSpec("video_colorspace", "/videostat/VideoColorSpace", writable=False),
+    PathSpec("video_mode", "/videostat/VideoMode", writable=False),
+    PathSpec("video_bitdepth", "/videostat/VideoBitDepth", writable=False),
+    PathSpec(
+        "video_hdrstatus",
+        "/videostat/HDRstatus",
+        default="SDR",
+        writable=False,
+        read=lambda v: v or "SDR",
+    ),
+    PathSpec("sourceprogram", "/status/DECSourceProgram", writable=False),
+    PathSpec("surroundmode", "/status/SurroundMode", writable=False),
+    PathSpec("decsamplerate", "/status/DECSampleRate", writable=False),
+    PathSpec("decprogramformat", "/status/DECProgramFormat", writable=False),
+    PathSpec("enclisteningformat", "/status/ENCListeningFormat", writable=False),
+    # PEQ
+    PathSpec("peq_status", "/peq/peqsw", writable=False),
+    PathSpec("beq_active", "/peq/beqActive", writable=False),
+    # Seat shaker
+    PathSpec("shaker_trim", "/shaker/trim", min=-24, max=6, step=1),
+    PathSpec("shaker_output", "/shaker/output", writable=False),
+    PathSpec("shaker_mute", "/shaker/mute", default=False, read=_mute_on, write=_to_on_off),
+    PathSpec("shaker_active_preset", "/shaker/activePreset", read=_preset, write=int),
+)
+
+SPECS: dict[str, PathSpec] = {spec.name: spec for spec in REGISTRY}
+
+
+# ----------------------------------------------------------------------
+# Accessor generation
+# ----------------------------------------------------------------------
+
+_MISSING = (KeyError, IndexError, TypeError)
+
+
+def _make_getter(spec: PathSpec) -> Callable[[Any], Any]:
+    keys, path, default, read = spec.keys, spec.path, spec.default, spec.read
+
+    def fget(self):
+        tx = self._tx
+        if spec.staged and tx and path in tx:
+            value = tx[path]
+        else:
+            node = self._state
+            try:
+                for key in keys:
+                    node = node[key]
+            except _MISSING:
+                return default
+            value = node
+        return read(value) if read is not None else value
+
+    return fget
+
+
+def _make_setter(spec: PathSpec, error: type[Exception]) -> Callable[[Any, Any], None]:
+    path, write = spec.path, spec.write
+
+    def fset(self, value):
+        if self._tx is None:
+            raise error("no transaction in progress")
+        self._tx[path] = write(value) if write is not None else value
+
+    return fset
+
+
+def install(cls: type, error: type[Exception]) -> None:
+    """Add a property to cls for every registry entry.
+
+    Setters stage writes in the open transaction and raise error when none
+    is open. Entries must not shadow attributes the class defines itself.
+    """
+    for spec in REGISTRY:
+        if spec.name in cls.__dict__:
+            raise TypeError(f"{cls.__name__}.{spec.name} is defined twice")
+        fget = _make_getter(spec)
+        fget.__name__ = spec.name
+        fget.__doc__ = f"Value of {spec.path}."
+        fset = _make_setter(spec, error) if spec.writable else None
+        setattr(cls, spec.name, property(fget, fset))
+
+
+# ----------------------------------------------------------------------
+# Entity definition fields
+# ----------------------------------------------------------------------
+
+
+def _set_fn(name: str) -> Callable[[Any, Any], None]:
+    return lambda htp1, value: setattr(htp1, name, value)
+
+
+def sensor_fields(name: str) -> dict[str, Any]:
+    """path and value_fn for a SENSOR_DEFINITIONS entry."""
+    spec = SPECS[name]
+    return {"path": spec.path, "value_fn": attrgetter(name)}
+
+
+def switch_fields(name: str) -> dict[str, Any]:
+    """path, get_fn and set_fn for a SWITCH_DEFINITIONS entry."""
+    spec = SPECS[name]
+    return {"path": spec.path, "get_fn": attrgetter(name), "set_fn": _set_fn(name)}
+
+
+def number_fields(name: str) -> dict[str, Any]:
+    """path, range and accessors for a NUMBER_DEFINITIONS entry."""
+    spec = SPECS[name]
+    return {
+        "path": spec.path,
+        "min": spec.min,
+        "max": spec.max,
+        "step": spec.step,
+        "get_fn": attrgetter(name),
+        "set_fn": _set_fn(name),
+    }
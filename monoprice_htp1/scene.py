@@ -0,0 +1,118 @@
+"""Named multi-setting scenes applied as a single HTP-1 transaction."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import LOUDNESS_CURVE_RAW_TO_UI, UPMIX_RAW_TO_UI
+
+STORAGE_VERSION = 1
+
+SCENE_KEYS = ("input", "upmix", "volume", "loudness_curve", "dirac_slot", "channel_trims")
+
+_UPMIX_UI_TO_RAW = {v: k for k, v in UPMIX_RAW_TO_UI.items()}
+_LOUDNESS_UI_TO_RAW = {v: k for k, v in LOUDNESS_CURVE_RAW_TO_UI.items()}
+
+
+class SceneError(ValueError):
+    """Raised when a scene setting cannot be resolved for this device."""
+
+
+def apply(htp1, scene: dict[str, Any]) -> None:
+    """Stage every setting of a scene in the current transaction.
+
+    Labels are resolved to raw device values ("Dolby Surround" -> dolby,
+    Dirac slot names -> slot index, ...) and validated first, so nothing
+    is staged when any setting is invalid.
+    """
+    writes: list[tuple[str, Any]] = []
+
+    if scene.get("input") is not None:
+        writes.append(("input", _resolve_input(htp1, scene["input"])))
+    if scene.get("upmix") is not None:
+        writes.append(("upmix", _resolve_upmix(htp1, scene["upmix"])))
+    if scene.get("volume") is not None:
+        writes.append(("volume", _resolve_volume(htp1, scene["volume"])))
+    if scene.get("loudness_curve") is not None:
+        writes.append(("loudness_curve", _resolve_loudness(scene["loudness_curve"])))
+    if scene.get("dirac_slot") is not None:
+        writes.append(("dirac_slot", _resolve_dirac_slot(htp1, scene["dirac_slot"])))
+    if scene.get("channel_trims"):
+        writes.append(("channel_trims", htp1.validate_channel_trims(scene["channel_trims"])))
+
+    for key, value in writes:
+        if key == "input":
+            htp1.input = value
+        elif key == "upmix":
+            htp1.upmix = value
+        elif key == "volume":
+            htp1.volume = value
+        elif key == "loudness_curve":
+            htp1.set_loudness_curve_selection(value)
+        elif key == "dirac_slot":
+            htp1.cal_current_dirac_slot = value
+        elif key == "channel_trims":
+            htp1.set_channel_trims(value)
+
+
+def capture(htp1) -> dict[str, Any]:
+    """Current device settings as a scene (labels where the UI uses them)."""
+    upmix = htp1.upmix
+    curve = htp1.lcvc_selected_curve or htp1.loudness_curve
+    slot = htp1.cal_current_dirac_slot
+    scene = {
+        "input": htp1.input,
+        "upmix": UPMIX_RAW_TO_UI.get(upmix, upmix),
+        "volume": htp1.volume,
+        "loudness_curve": LOUDNESS_CURVE_RAW_TO_UI.get(curve, curve),
+        "dirac_slot": slot + 1 if slot is not None else None,
+        "channel_trims": htp1.channel_trims or None,
+    }
+    return {k: v for k, v in scene.items() if v is not None}
+
+
+def _resolve_input(htp1, value: str) -> str:
+    # The input setter matches labels; accept raw input ids as well.
+    labels = htp1.input_labels
+    if value in labels:
+        return labels[value]
+    if value in labels.values():
+        return value
+    raise SceneError(f"Unknown input '{value}'")
+
+
+def _resolve_upmix(htp1, value: str) -> str:
+    raw = _UPMIX_UI_TO_RAW.get(value, value)
+    if raw not in (htp1.upmixes or []):
+        raise SceneError(f"Upmix '{value}' is not available")
+    return raw
+
+
+def _resolve_volume(htp1, value) -> int:
+    volume = round(float(value))
+    low, high = htp1.cal_vpl, htp1.cal_vph
+    if low is not None and high is not None and not low <= volume <= high:
+        raise SceneError(f"Volume {volume} dB outside {low}..{high} dB")
+    return volume
+
+
+def _resolve_loudness(value: str) -> str:
+    raw = _LOUDNESS_UI_TO_RAW.get(value, value)
+    if raw not in LOUDNESS_CURVE_RAW_TO_UI:
+        raise SceneError(f"Unknown loudness curve '{value}'")
+    return raw
+
+
+def _resolve_dirac_slot(htp1, value) -> int:
+    """Slot name, or 1-based slot number as shown in the UI."""
+    slots = htp1.cal_slot_names
+    if value in slots:
+        return slots.index(value)
+    try:
+        idx = int(value) - 1
+    except (TypeError, ValueError):
+        raise SceneError(f"Unknown Dirac slot '{value}'") from None
+    if not 0 <= idx < max(len(slots), 1):
+        raise SceneError(f"Dirac slot {value} out of range")
+    return idx
+
@@ -6,9 +6,9 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, ui_lock_signal
+from . import availability
+from .const import DOMAIN
 from .helpers import schedule_entity_update_threadsafe
 
 _LOGGER = logging.getLogger(__name__)
@@ -55,6 +55,7 @@ class Htp1BaseSelect(SelectEntity):
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    _availability = availability.CONTROL
 
     def __init__(self, htp1, entry: ConfigEntry) -> None:
         self._htp1 = htp1
@@ -68,16 +69,7 @@ class Htp1BaseSelect(SelectEntity):
 
     @property
     def available(self) -> bool:
-        if not self._htp1.connected:
-            return False
-
-        # Lock selects when device is explicitly OFF/standby and UI lock is enabled.
-        if getattr(self._htp1, "lock_controls_when_off", True):
-            pwr = getattr(self._htp1, "power", None)
-            if pwr is False or pwr == 0:
-                return False
-
-        return True
+        return self._htp1.availability.is_available(self._availability)
 
 
 class Htp1InputSelect(Htp1BaseSelect):
@@ -121,17 +113,9 @@ class Htp1InputSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        # Availability depends on power/connection + UI lock; update immediately on change
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -142,10 +126,6 @@ class Htp1InputSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
 
@@ -169,13 +149,24 @@ class Htp1UpmixSelect(Htp1BaseSelect):
         self._attr_unique_id = f"{entry.entry_id}_upmix"
         self._ui_to_raw: dict[str, str] = {}
         self._raw_to_ui: dict[str, str] = {}
+        self._options: list[str] = []
+        self._maps_version: tuple[int, ...] | None = None
 
     def _format_ui(self, raw: str) -> str:
         if raw in self._RAW_TO_UI:
             return self._RAW_TO_UI[raw]
         return str(raw).replace("_", " ").replace("-", " ").title()
 
-    def _rebuild_maps(self, raws: list[str]) -> None:
+    def _rebuild_maps(self) -> None:
+        # Upmix names only change with /upmix; skip the rebuild otherwise.
+        version = self._htp1.version("upmix")
+        if version == self._maps_version:
+            return
+        try:
+            raws = list(self._htp1.upmixes or [])
+        except Exception:
+            raws = []
+
         self._raw_to_ui.clear()
         self._ui_to_raw.clear()
         for raw in raws:
@@ -183,16 +174,13 @@ class Htp1UpmixSelect(Htp1BaseSelect):
             ui = self._format_ui(raw_str)
             self._raw_to_ui[raw_str] = ui
             self._ui_to_raw.setdefault(ui, raw_str)
+        self._options = [self._raw_to_ui[str(r)] for r in raws]
+        self._maps_version = version
 
     @property
     def options(self) -> list[str]:
-        try:
-            raws = list(self._htp1.upmixes or [])
-        except Exception:
-            raws = []
-
-        self._rebuild_maps(raws)
-        return [self._raw_to_ui[r] for r in raws]
+        self._rebuild_maps()
+        return self._options
 
     @property
     def current_option(self) -> str | None:
@@ -202,9 +190,7 @@ class Htp1UpmixSelect(Htp1BaseSelect):
                 return None
 
             raw_str = str(raw)
-            if raw_str not in self._raw_to_ui:
-                self._rebuild_maps(list(self._htp1.upmixes or []))
-
+            self._rebuild_maps()
             return self._raw_to_ui.get(raw_str, self._format_ui(raw_str))
         except Exception:
             return None
@@ -216,6 +202,7 @@ class Htp1UpmixSelect(Htp1BaseSelect):
             if pwr is False or pwr == 0:
                 return
 
+        self._rebuild_maps()
         raw = self._ui_to_raw.get(option, option)
 
         async with self._htp1:
@@ -232,17 +219,9 @@ class Htp1UpmixSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        # Availability depends on power/connection + UI lock; update immediately on change
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_upmix_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -253,10 +232,6 @@ class Htp1UpmixSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_upmix_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
 
@@ -304,16 +279,8 @@ class Htp1LoudnessCurveSelect(Htp1BaseSelect):
         if raw is None:
             return
 
-        loudness_raw = "vintage" if raw == "vintageCustom" else raw
         async with self._htp1:
-            if self._htp1.lcvc_selected_curve == "vintageCustom" and raw != "vintageCustom":
-                self._htp1.save_lcvc_params()
-            self._htp1.loudness_curve = loudness_raw
-            self._htp1.lcvc_selected_curve = raw
-            if raw == "vintageCustom":
-                self._htp1.restore_lcvc_saved_params()
-            elif raw == "vintage":
-                self._htp1.reset_lcvc_vintage_defaults()
+            self._htp1.set_loudness_curve_selection(raw)
             await self._htp1.commit()
 
         schedule_entity_update_threadsafe(self)
@@ -325,16 +292,9 @@ class Htp1LoudnessCurveSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -345,10 +305,6 @@ class Htp1LoudnessCurveSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
 
@@ -408,16 +364,9 @@ class Htp1DiracActiveSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -428,10 +377,6 @@ class Htp1DiracActiveSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
 
@@ -491,16 +436,9 @@ class Htp1NightModeSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -511,10 +449,6 @@ class Htp1NightModeSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
 
@@ -580,16 +514,9 @@ class Htp1DialnormSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -600,10 +527,6 @@ class Htp1DialnormSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
 
@@ -612,6 +535,8 @@ class Htp1ShakerPresetSelect(Htp1BaseSelect):
     _attr_name = "Seat Shaker Active Preset"
     _attr_icon = "mdi:vibrate"
 
+    _availability = availability.SHAKER
+
     # UI shows 1–6, device stores 0–5
     _OPTIONS = ["1", "2", "3", "4", "5", "6"]
 
@@ -619,18 +544,6 @@ class Htp1ShakerPresetSelect(Htp1BaseSelect):
         super().__init__(htp1, entry)
         self._attr_unique_id = f"{entry.entry_id}_shaker_active_preset"
 
-    @property
-    def available(self) -> bool:
-        if not self._htp1.connected:
-            return False
-        if getattr(self._htp1, "shaker_output", None) == "off":
-            return False
-        if getattr(self._htp1, "lock_controls_when_off", True):
-            pwr = getattr(self._htp1, "power", None)
-            if pwr is False or pwr == 0:
-                return False
-        return True
-
     @property
     def options(self) -> list:
         return self._OPTIONS
@@ -665,21 +578,9 @@ class Htp1ShakerPresetSelect(Htp1BaseSelect):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        # Availability depends on shaker output routing.
-        unsub = self._htp1.subscribe("/shaker/output", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry.entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -690,9 +591,5 @@ class Htp1ShakerPresetSelect(Htp1BaseSelect):
                 except Exception:
                     pass
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            unsub()
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+import threading
+from functools import partial
+from operator import methodcaller
 from typing import Any, Callable
 
 from homeassistant.components.sensor import (
@@ -12,7 +15,13 @@ from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN
+from .aiohtp1 import CHANNEL_TRIM_KEYS
+from .const import CONF_SENSOR_THROTTLE, DOMAIN
+from .helpers import schedule_entity_update_threadsafe
+from .layout import ChannelEntityManager, trim_channel, trim_definitions, trim_unique_ids
+from .peq_response import filter_headroom
+from .registry import sensor_fields
+from .throttle import DEFAULT_SENSOR_THROTTLE, Throttle
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,47 +48,57 @@ NIGHT_MODE_DISPLAY = {
 }
 
 
+def _trim_sensor_fields(ch: str) -> dict[str, Any]:
+    return {
+        "value_fn": methodcaller("channel_trim", ch),
+        "native_unit_of_measurement": "dB",
+        "suggested_display_precision": 2,
+        "device_class": SensorDeviceClass.SOUND_PRESSURE,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:knob",
+    }
+
+
 
 SENSOR_DEFINITIONS = [
     {
         "key": "power",
         "name": "Power",
-        "path": "/powerIsOn",
+        **sensor_fields("power"),
         "value_fn": lambda htp1: STATE_ON if htp1.power else STATE_OFF,
         "icon": "mdi:power",
     },
     {
         "key": "volume",
         "name": "Volume",
-        "path": "/volume",
-        "value_fn": lambda htp1: htp1.volume,
+        **sensor_fields("volume"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:volume-high",
+        "throttle": True,
     },
     {
         "key": "mute",
         "name": "Mute",
-        "path": "/muted",
+        **sensor_fields("muted"),
         "value_fn": lambda htp1: STATE_ON if htp1.muted else STATE_OFF,
         "icon": "mdi:volume-off",
     },
     {
         "key": "secondary_volume",
         "name": "Mix Out Volume",
-        "path": "/secondaryVolume",
-        "value_fn": lambda htp1: htp1.secondary_volume,
+        **sensor_fields("secondary_volume"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:volume-high",
+        "throttle": True,
     },
     {
         "key": "secondary_poweron_volume",
         "name": "Mix Out Power On Volume",
-        "path": "/secondaryPowerOnVolume",
-        "value_fn": lambda htp1: htp1.secondary_poweron_volume,
+        **sensor_fields("secondary_poweron_volume"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -88,15 +107,14 @@ SENSOR_DEFINITIONS = [
     {
         "key": "secondary_muted",
         "name": "Mix Out Mute",
-        "path": "/secondaryMuted",
+        **sensor_fields("secondary_muted"),
         "value_fn": lambda htp1: STATE_ON if htp1.secondary_muted else STATE_OFF,
         "icon": "mdi:volume-off",
     },
     {
         "key": "dialogenh",
         "name": "Dialog Enhance",
-        "path": "/dialogEnh",
-        "value_fn": lambda htp1: htp1.dialogenh,
+        **sensor_fields("dialogenh"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -112,7 +130,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "upmix",
         "name": "Upmix",
-        "path": "/upmix/select",
+        **sensor_fields("upmix"),
         "value_fn": lambda htp1: (
             UPMIX_DISPLAY.get(htp1.upmix, htp1.upmix) if htp1.upmix is not None else None
         ),
@@ -121,8 +139,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "bass_level",
         "name": "Bass Level",
-        "path": "/eq/bass/level",
-        "value_fn": lambda htp1: htp1.bass_level,
+        **sensor_fields("bass_level"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -131,8 +148,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "bass_frequency",
         "name": "Bass Corner Frequency",
-        "path": "/eq/bass/freq",
-        "value_fn": lambda htp1: htp1.bass_frequency,
+        **sensor_fields("bass_frequency"),
         "native_unit_of_measurement": "Hz",
         "device_class": SensorDeviceClass.FREQUENCY,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -141,8 +157,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "treble_level",
         "name": "Treble Level",
-        "path": "/eq/treble/level",
-        "value_fn": lambda htp1: htp1.treble_level,
+        **sensor_fields("treble_level"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -151,8 +166,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "treble_frequency",
         "name": "Treble Corner Frequency",
-        "path": "/eq/treble/freq",
-        "value_fn": lambda htp1: htp1.treble_frequency,
+        **sensor_fields("treble_frequency"),
         "native_unit_of_measurement": "Hz",
         "device_class": SensorDeviceClass.FREQUENCY,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -161,37 +175,35 @@ SENSOR_DEFINITIONS = [
     {
         "key": "display_brightness",
         "name": "Display Brightness",
-        "path": "/hw/fpBright",
-        "value_fn": lambda htp1: htp1.display_brightness,
+        **sensor_fields("display_brightness"),
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:brightness-4",
     },
     {
         "key": "tone_control",
         "name": "Tone Control",
-        "path": "/eq/tc",
+        **sensor_fields("tone_control"),
         "value_fn": lambda htp1: STATE_ON if htp1.tone_control else STATE_OFF,
         "icon": "mdi:music-note",
     },
     {
         "key": "widesynth",
         "name": "Wide Synth",
-        "path": "/upmix/dts/ws",
+        **sensor_fields("widesynth"),
         "value_fn": lambda htp1: STATE_ON if htp1.widesynth else STATE_OFF,
         "icon": "mdi:arrow-split-vertical",
     },
     {
         "key": "aurohs",
         "name": "Auro High Sides",
-        "path": "/upmix/auro/highSides",
+        **sensor_fields("aurohs"),
         "value_fn": lambda htp1: STATE_ON if htp1.aurohs else STATE_OFF,
         "icon": "mdi:align-vertical-top",
     },
     {
         "key": "loudness_cal",
         "name": "Loudness Calibration",
-        "path": "/loudnessCal",
-        "value_fn": lambda htp1: htp1.loudness_cal,
+        **sensor_fields("loudness_cal"),
         "native_unit_of_measurement": "dB",
         "device_class": SensorDeviceClass.SOUND_PRESSURE,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -200,14 +212,13 @@ SENSOR_DEFINITIONS = [
     {
         "key": "loudness_status",
         "name": "Loudness Status",
-        "path": "/loudness",
-        "value_fn": lambda htp1: htp1.loudness_raw,
+        **sensor_fields("loudness_raw"),
         "icon": "mdi:ear-hearing",
     },
     {
         "key": "loudness_curve",
         "name": "Loudness Curve",
-        "path": "/lcvc/selectedCurve",
+        **sensor_fields("lcvc_selected_curve"),
         "value_fn": lambda htp1: (
             LOUDNESS_CURVE_DISPLAY.get(htp1.lcvc_selected_curve, htp1.lcvc_selected_curve)
             if htp1.lcvc_selected_curve is not None
@@ -218,7 +229,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "night_mode",
         "name": "Night Mode",
-        "path": "/night",
+        **sensor_fields("night_mode"),
         "value_fn": lambda htp1: (
             NIGHT_MODE_DISPLAY.get(str(htp1.night_mode), str(htp1.night_mode))
             if htp1.night_mode is not None
@@ -229,8 +240,7 @@ SENSOR_DEFINITIONS = [
     {
         "key": "lipsync_delay",
         "name": "Lipsync Delay",
-        "path": "/cal/lipsync",
-        "value_fn": lambda htp1: htp1.lipsync_delay,
+        **sensor_fields("lipsync_delay"),
         "native_unit_of_measurement": "ms",
         "device_class": SensorDeviceClass.DURATION,
         "state_class": SensorStateClass.MEASUREMENT,
@@ -239,323 +249,90 @@ SENSOR_DEFINITIONS = [
     {
         "key": "video_resolution",
         "name": "Video Resolution",
-        "path": "/videostat/VideoResolution",
-        "value_fn": lambda htp1: htp1.video_resolution,
+        **sensor_fields("video_resolution"),
         "icon": "mdi:television",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "video_colorspace",
         "name": "Video Color Space",
-        "path": "/videostat/VideoColorSpace",
-        "value_fn": lambda htp1: htp1.video_colorspace,
+        **sensor_fields("video_colorspace"),
         "icon": "mdi:television",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "video_mode",
         "name": "Video Mode",
-        "path": "/videostat/VideoMode",
-        "value_fn": lambda htp1: htp1.video_mode,
+        **sensor_fields("video_mode"),
         "icon": "mdi:television",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "video_bitdepth",
         "name": "Video Bit Depth",
-        "path": "/videostat/VideoBitDepth",
-        "value_fn": lambda htp1: htp1.video_bitdepth,
+        **sensor_fields("video_bitdepth"),
         "icon": "mdi:television",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "video_hdrstatus",
         "name": "Video HDR Status",
-        "path": "/videostat/HDRstatus",
-        "value_fn": lambda htp1: htp1.video_hdrstatus,
+        **sensor_fields("video_hdrstatus"),
         "icon": "mdi:television",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "sourceprogram",
         "name": "Audio Source Program",
-        "path": "/status/DECSourceProgram",
-        "value_fn": lambda htp1: htp1.sourceprogram,
+        **sensor_fields("sourceprogram"),
         "icon": "mdi:speaker",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "surroundmode",
         "name": "Audio Surround Mode",
-        "path": "/status/SurroundMode",
-        "value_fn": lambda htp1: htp1.surroundmode,
+        **sensor_fields("surroundmode"),
         "icon": "mdi:speaker",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "decsamplerate",
         "name": "Audio Samplerate",
-        "path": "/status/DECSampleRate",
-        "value_fn": lambda htp1: htp1.decsamplerate,
+        **sensor_fields("decsamplerate"),
         "icon": "mdi:speaker",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "decprogramformat",
         "name": "Audio Program Format",
-        "path": "/status/DECProgramFormat",
-        "value_fn": lambda htp1: htp1.decprogramformat,
+        **sensor_fields("decprogramformat"),
         "icon": "mdi:speaker",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "currentLayout",
         "name": "Speaker layout",
-        "path": "/cal/currentLayout",
-        "value_fn": lambda htp1: htp1.currentlayout,
+        **sensor_fields("currentlayout"),
         "icon": "mdi:speaker",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
         "key": "enclisteningformat",
         "name": "Audio Listening Format",
-        "path": "/status/ENCListeningFormat",
-        "value_fn": lambda htp1: htp1.enclisteningformat,
+        **sensor_fields("enclisteningformat"),
         "icon": "mdi:speaker",
         "entity_category": EntityCategory.DIAGNOSTIC,
     },
     {
-        "key": "channeltrim_left",
-        "name": "Trim Left",
-        "path": "/channeltrim/channels/lf",
-        "value_fn": lambda htp1: htp1.channeltrim_left,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_right",
-        "name": "Trim Right",
-        "path": "/channeltrim/channels/rf",
-        "value_fn": lambda htp1: htp1.channeltrim_right,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_center",
-        "name": "Trim Center",
-        "path": "/channeltrim/channels/c",
-        "value_fn": lambda htp1: htp1.channeltrim_center,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_lfe",
-        "name": "Trim LFE",
-        "path": "/channeltrim/channels/lfe",
-        "value_fn": lambda htp1: htp1.channeltrim_lfe,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_rightsurround",
-        "name": "Trim Right Surround",
-        "path": "/channeltrim/channels/rs",
-        "value_fn": lambda htp1: htp1.channeltrim_rightsurround,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_leftsurround",
-        "name": "Trim Left Surround",
-        "path": "/channeltrim/channels/ls",
-        "value_fn": lambda htp1: htp1.channeltrim_leftsurround,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_rightback",
-        "name": "Trim Right Back",
-        "path": "/channeltrim/channels/rb",
-        "value_fn": lambda htp1: htp1.channeltrim_rightback,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_leftback",
-        "name": "Trim Left Back",
-        "path": "/channeltrim/channels/lb",
-        "value_fn": lambda htp1: htp1.channeltrim_leftback,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-    },
-    {
-        "key": "channeltrim_ltf",
-        "name": "Trim Left Top Front",
-        "path": "/channeltrim/channels/ltf",
-        "value_fn": lambda htp1: htp1.channeltrim_ltf,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rtf",
-        "name": "Trim Right Top Front",
-        "path": "/channeltrim/channels/rtf",
-        "value_fn": lambda htp1: htp1.channeltrim_rtf,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_ltm",
-        "name": "Trim Left Top Middle",
-        "path": "/channeltrim/channels/ltm",
-        "value_fn": lambda htp1: htp1.channeltrim_ltm,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rtm",
-        "name": "Trim Right Top Middle",
-        "path": "/channeltrim/channels/rtm",
-        "value_fn": lambda htp1: htp1.channeltrim_rtm,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_ltr",
-        "name": "Trim Left Top Rear",
-        "path": "/channeltrim/channels/ltr",
-        "value_fn": lambda htp1: htp1.channeltrim_ltr,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rtr",
-        "name": "Trim Right Top Rear",
-        "path": "/channeltrim/channels/rtr",
-        "value_fn": lambda htp1: htp1.channeltrim_rtr,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_lw",
-        "name": "Trim Left Wide",
-        "path": "/channeltrim/channels/lw",
-        "value_fn": lambda htp1: htp1.channeltrim_lw,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rw",
-        "name": "Trim Right Wide",
-        "path": "/channeltrim/channels/rw",
-        "value_fn": lambda htp1: htp1.channeltrim_rw,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_lfh",
-        "name": "Trim Left Front Height",
-        "path": "/channeltrim/channels/lfh",
-        "value_fn": lambda htp1: htp1.channeltrim_lfh,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rfh",
-        "name": "Trim Right Front Height",
-        "path": "/channeltrim/channels/rfh",
-        "value_fn": lambda htp1: htp1.channeltrim_rfh,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_lhb",
-        "name": "Trim Left Height Back",
-        "path": "/channeltrim/channels/lhb",
-        "value_fn": lambda htp1: htp1.channeltrim_lhb,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
-    },
-    {
-        "key": "channeltrim_rhb",
-        "name": "Trim Right Height Back",
-        "path": "/channeltrim/channels/rhb",
-        "value_fn": lambda htp1: htp1.channeltrim_rhb,
-        "native_unit_of_measurement": "dB",
-        "suggested_display_precision": 2,
-        "device_class": SensorDeviceClass.SOUND_PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:knob",
-        "entity_registry_enabled_default": False,
+        "key": "channel_trims",
+        "name": "Channel Trims",
+        "path": "/channeltrim/channels",
+        "watch_paths": tuple(f"/channeltrim/channels/{ch}" for ch in CHANNEL_TRIM_KEYS),
+        "value_fn": lambda htp1: sum(1 for v in htp1.channel_trims.values() if v),
+        "attrs_fn": lambda htp1: _channel_trims_attrs(htp1),
+        "icon": "mdi:tune-vertical",
     },
+    *trim_definitions(_trim_sensor_fields),
     {
         "key": "cal_current_slot_name",
         "name": "Calibration Slot",
@@ -566,42 +343,42 @@ SENSOR_DEFINITIONS = [
     {
         "key": "peq_status",
         "name": "PEQ Status",
-        "path": "/peq/peqsw",
+        **sensor_fields("peq_status"),
         "value_fn": lambda htp1: STATE_ON if htp1.peq_status else STATE_OFF,
         "icon": "mdi:music-note",
     },
     {
         "key": "beq_active",
         "name": "BEQ Filter",
-        "path": "/peq/beqActive",
+        **sensor_fields("beq_active"),
         "value_fn": lambda htp1: htp1.beq_active or "None",
+        "attrs_fn": lambda htp1: _beq_headroom_attrs(htp1),
         "icon": "mdi:equalizer",
     },
     {
         "key": "shaker_mute",
         "name": "Seat Shaker Mute",
-        "path": "/shaker/mute",
+        **sensor_fields("shaker_mute"),
         "value_fn": lambda htp1: STATE_ON if htp1.shaker_mute else STATE_OFF,
         "icon": "mdi:vibrate-off",
     },
     {
         "key": "shaker_trim",
         "name": "Seat Shaker Trim",
-        "path": "/shaker/trim",
-        "value_fn": lambda htp1: htp1.shaker_trim,
+        **sensor_fields("shaker_trim"),
         "icon": "mdi:vibrate",
     },
     {
         "key": "shaker_active_preset",
         "name": "Seat Shaker Active Preset",
-        "path": "/shaker/activePreset",
-        "value_fn": lambda htp1: str(int(htp1.shaker_active_preset) + 1) if htp1.shaker_active_preset is not None else None,
+        **sensor_fields("shaker_active_preset"),
+        "value_fn": lambda htp1: _preset_number(htp1.shaker_active_preset),
         "icon": "mdi:vibrate",
     },
     {
         "key": "shaker_output",
         "name": "Seat Shaker Output",
-        "path": "/shaker/output",
+        **sensor_fields("shaker_output"),
         "value_fn": lambda htp1: {
             "off":     "Off",
             "nextsub": "Sub Out",
@@ -613,21 +390,60 @@ SENSOR_DEFINITIONS = [
 ]
 
 
+def _preset_number(preset: str | None) -> str | None:
+    """1-based preset number as shown in the UI."""
+    return str(int(preset) + 1) if preset is not None else None
+
+
+def _channel_trims_attrs(htp1) -> dict | None:
+    """Full trim vector plus its extremes."""
+    trims = htp1.channel_trims
+    if not trims:
+        return None
+    return {"trims": trims, "min_db": min(trims.values()), "max_db": max(trims.values())}
+
+
+def _beq_headroom_attrs(htp1) -> dict | None:
+    """Peak boost of the loaded BEQ filters (cached per filter set)."""
+    filters = htp1.beq_filters
+    if not filters:
+        return None
+    peak_db, peak_hz = filter_headroom(filters)
+    return {
+        "filter_count": len(filters),
+        "peak_boost_db": peak_db,
+        "peak_boost_frequency_hz": peak_hz,
+    }
+
+
 async def async_setup_entry(hass, entry, async_add_entities):
     htp1 = hass.data[DOMAIN][entry.entry_id]
+    throttle_interval = entry.options.get(CONF_SENSOR_THROTTLE, DEFAULT_SENSOR_THROTTLE)
 
     sensors = [
         Htp1Sensor(
             htp1=htp1,
             entry_id=entry.entry_id,
+            throttle_interval=throttle_interval,
             **definition,
         )
         for definition in SENSOR_DEFINITIONS
+        if trim_channel(definition) is None
     ]
 
     # Request an immediate first update so entities don't sit at unknown.
     async_add_entities(sensors, True)
 
+    # Channel trims only for speakers present in the current layout.
+    factories = {
+        ch: partial(Htp1Sensor, htp1=htp1, entry_id=entry.entry_id, **definition)
+        for definition in SENSOR_DEFINITIONS
+        if (ch := trim_channel(definition)) is not None
+    }
+    unique_ids = trim_unique_ids(entry.entry_id, SENSOR_DEFINITIONS)
+    trims = ChannelEntityManager(hass, htp1, "sensor", factories, unique_ids, async_add_entities)
+    entry.async_on_unload(trims.async_start())
+
 
 class Htp1Sensor(SensorEntity):
     _attr_has_entity_name = True
@@ -648,10 +464,19 @@ class Htp1Sensor(SensorEntity):
         suggested_display_precision: int | None = None,
         entity_registry_enabled_default: bool = True,
         entity_category: EntityCategory | str | None = None,
+        attrs_fn: Callable[[Any], dict | None] | None = None,
+        watch_paths: tuple[str, ...] = (),
+        throttle: bool = False,
+        throttle_interval: float = 0.0,
     ):
         self._htp1 = htp1
         self._path = path
         self._value_fn = value_fn
+        self._attrs_fn = attrs_fn
+        self._watch_paths = watch_paths
+        # High-rate sensors (volume) are rate limited to spare the recorder.
+        self._throttle_interval = throttle_interval if throttle else 0.0
+        self._throttle: Throttle | None = None
 
         self._attr_unique_id = f"{entry_id}_{key}"
         self._attr_name = name
@@ -688,19 +513,48 @@ class Htp1Sensor(SensorEntity):
             _LOGGER.debug("Failed to compute sensor value for %s (%s)", self.entity_id, self._path, exc_info=True)
             return None
 
+    @property
+    def extra_state_attributes(self):
+        if self._attrs_fn is None:
+            return None
+        try:
+            return self._attrs_fn(self._htp1)
+        except Exception:
+            _LOGGER.debug("Failed to compute sensor attributes for %s (%s)", self.entity_id, self._path, exc_info=True)
+            return None
+
     async def async_added_to_hass(self):
+        if self._throttle_interval > 0:
+            self._throttle = Throttle(
+                self._throttle_interval,
+                partial(schedule_entity_update_threadsafe, self),
+                loop=self.hass.loop,
+            )
         # Subscribe to path updates from the device.
         # Callback is sync to avoid accidental coroutine creation if subscribe() calls it synchronously.
         self._unsub = self._htp1.subscribe(self._path, self._handle_update)
+        self._unsub_watch = [
+            self._htp1.subscribe(path, self._handle_update) for path in self._watch_paths
+        ]
 
     async def async_will_remove_from_hass(self) -> None:
-        unsub = getattr(self, "_unsub", None)
-        if callable(unsub):
-            try:
-                unsub()
-            except Exception:
-                pass
+        if self._throttle is not None:
+            self._throttle.cancel()
+            self._throttle = None
+        for unsub in [getattr(self, "_unsub", None), *getattr(self, "_unsub_watch", [])]:
+            if callable(unsub):
+                try:
+                    unsub()
+                except Exception:
+                    pass
 
     def _handle_update(self, value):
-        # Schedule a state update on the HA loop.
-        self.async_schedule_update_ha_state()
+        throttle = self._throttle
+        if throttle is not None:
+            if threading.get_ident() == self.hass.loop_thread_id:
+                throttle()
+            else:
+                self.hass.loop.call_soon_threadsafe(throttle)
+            return
+        # Coalesced: one device frame can touch many watched paths.
+        schedule_entity_update_threadsafe(self)
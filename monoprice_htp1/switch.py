@@ -6,13 +6,22 @@ from typing import Any, Callable
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 
-from .const import DOMAIN, ui_lock_signal
+from . import availability
+from .const import DOMAIN
 from .helpers import schedule_entity_update_threadsafe
+from .registry import switch_fields
 
 _LOGGER = logging.getLogger(__name__)
 
+# Power must always be available; everything else not listed follows the
+# UI lock toggle.
+_SWITCH_AVAILABILITY = {
+    "power": availability.CONNECTED,
+    "shaker_mute": availability.SHAKER,
+    "secondary_muted": availability.MIX_OUT,
+}
+
 
 # -------------------------------------------------------------
 #  HTP-1 switches
@@ -21,67 +30,51 @@ SWITCH_DEFINITIONS = [
     {
         "key": "power",
         "name": "Power",
-        "path": "/powerIsOn",
+        **switch_fields("power"),
         "icon": "mdi:power",
-        "get_fn": lambda h: h.power,
-        "set_fn": lambda h, v: setattr(h, "power", v),
     },
     {
         "key": "tone_control",
         "name": "Tone Control",
-        "path": "/eq/tc",
+        **switch_fields("tone_control"),
         "icon": "mdi:music-note",
-        "get_fn": lambda h: h.tone_control,
-        "set_fn": lambda h, v: setattr(h, "tone_control", v),
     },
     {
         "key": "muted",
         "name": "Mute",
-        "path": "/muted",
+        **switch_fields("muted"),
         "icon": "mdi:volume-off",
-        "get_fn": lambda h: h.muted,
-        "set_fn": lambda h, v: setattr(h, "muted", v),
     },
     {
         "key": "secondary_muted",
         "name": "Mix Out Mute",
-        "path": "/secondaryMuted",
+        **switch_fields("secondary_muted"),
         "icon": "mdi:volume-off",
-        "get_fn": lambda h: h.secondary_muted,
-        "set_fn": lambda h, v: setattr(h, "secondary_muted", v),
     },
     {
         "key": "loudness_status",
         "name": "Loudness",
-        "path": "/loudness",
+        **switch_fields("loudness_status"),
         "icon": "mdi:ear-hearing",
-        "get_fn": lambda h: h.loudness_status,
-        "set_fn": lambda h, v: setattr(h, "loudness_status", v),
     },
 
     {
         "key": "widesynth",
         "name": "Widesynth",
-        "path": "/upmix/dts/ws",
+        **switch_fields("widesynth"),
         "icon": "mdi:arrow-split-vertical",
-        "get_fn": lambda h: h.widesynth,
-        "set_fn": lambda h, v: setattr(h, "widesynth", v),
     },
     {
         "key": "aurohs",
         "name": "Auro High Sides",
-        "path": "/upmix/auro/highSides",
+        **switch_fields("aurohs"),
         "icon": "mdi:align-vertical-top",
-        "get_fn": lambda h: h.aurohs,
-        "set_fn": lambda h, v: setattr(h, "aurohs", v),
     },
     {
         "key": "shaker_mute",
         "name": "Seat Shaker Mute",
-        "path": "/shaker/mute",
+        **switch_fields("shaker_mute"),
         "icon": "mdi:vibrate-off",
-        "get_fn": lambda h: h.shaker_mute,
-        "set_fn": lambda h, v: setattr(h, "shaker_mute", v),
     },
 ]
 
@@ -157,7 +150,7 @@ class Htp1UiLockSwitch(SwitchEntity, RestoreEntity):
     @property
     def available(self) -> bool:
         # The toggle should be available whenever the integration is connected.
-        return bool(getattr(self._htp1, "connected", False))
+        return self._htp1.availability.is_available(availability.CONNECTED)
 
     @property
     def is_on(self) -> bool:
@@ -167,9 +160,9 @@ class Htp1UiLockSwitch(SwitchEntity, RestoreEntity):
         await super().async_added_to_hass()
 
         # Keep availability/state refreshed when connection changes
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
+        self._unsubs.append(
+            self._htp1.availability.listen(availability.CONNECTED, self._handle_update)
+        )
 
         last = await self.async_get_last_state()
         if last is None:
@@ -178,8 +171,7 @@ class Htp1UiLockSwitch(SwitchEntity, RestoreEntity):
         else:
             self._htp1.lock_controls_when_off = (last.state == "on")
 
-        # Notify other entities immediately (avoid "stuck" availability until toggled)
-        async_dispatcher_send(self.hass, ui_lock_signal(self._entry_id))
+        # Entities whose availability flipped are notified by htp1.availability.
         schedule_entity_update_threadsafe(self)
 
     async def async_will_remove_from_hass(self) -> None:
@@ -193,12 +185,10 @@ class Htp1UiLockSwitch(SwitchEntity, RestoreEntity):
 
     async def async_turn_on(self, **kwargs) -> None:
         self._htp1.lock_controls_when_off = True
-        async_dispatcher_send(self.hass, ui_lock_signal(self._entry_id))
         schedule_entity_update_threadsafe(self)
 
     async def async_turn_off(self, **kwargs) -> None:
         self._htp1.lock_controls_when_off = False
-        async_dispatcher_send(self.hass, ui_lock_signal(self._entry_id))
         schedule_entity_update_threadsafe(self)
 
     def _handle_update(self, *args):
@@ -227,6 +217,7 @@ class Htp1Switch(SwitchEntity):
         self._path = path
         self._get_fn = get_fn
         self._set_fn = set_fn
+        self._availability = _SWITCH_AVAILABILITY.get(key, availability.CONTROL)
 
         self._attr_unique_id = f"{entry_id}_{key}"
         self._attr_name = name
@@ -244,30 +235,7 @@ class Htp1Switch(SwitchEntity):
 
     @property
     def available(self) -> bool:
-        if not self._htp1.connected:
-            return False
-
-        # Power must always be available.
-        if self._key == "power":
-            return True
-
-        # Shaker controls are unavailable when shaker output is off.
-        if self._key == "shaker_mute":
-            if getattr(self._htp1, "shaker_output", None) == "off":
-                return False
-
-        # Mix Out Mute is unavailable when the shaker routes through Mix Out.
-        if self._key == "secondary_muted":
-            if getattr(self._htp1, "shaker_output", None) in ("mono17", "diff17"):
-                return False
-
-        # Lock switches when device is explicitly OFF/standby and UI lock is enabled.
-        if getattr(self._htp1, "lock_controls_when_off", True):
-            pwr = getattr(self._htp1, "power", None)
-            if pwr is False or pwr == 0:
-                return False
-
-        return True
+        return self._htp1.availability.is_available(self._availability)
 
     @property
     def is_on(self) -> bool | None:
@@ -314,25 +282,9 @@ class Htp1Switch(SwitchEntity):
         if callable(unsub):
             self._unsubs.append(unsub)
 
-        # Also subscribe to power/connection so availability updates immediately
-        if self._path != "/powerIsOn":
-            unsub = self._htp1.subscribe("/powerIsOn", self._handle_update)
-            if callable(unsub):
-                self._unsubs.append(unsub)
-
-        unsub = self._htp1.subscribe("#connection", self._handle_update)
-        if callable(unsub):
-            self._unsubs.append(unsub)
-
-        # Shaker/Mix Out availability depends on shaker output routing.
-        if self._key in ("shaker_mute", "secondary_muted"):
-            unsub = self._htp1.subscribe("/shaker/output", self._handle_update)
-            if callable(unsub):
-                self._unsubs.append(unsub)
-
-        # And UI lock changes
-        self._unsub_ui_lock = async_dispatcher_connect(
-            self.hass, ui_lock_signal(self._entry_id), self._handle_update
+        # Availability (power, connection, UI lock, shaker routing).
+        self._unsubs.append(
+            self._htp1.availability.listen(self._availability, self._handle_update)
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -344,12 +296,5 @@ class Htp1Switch(SwitchEntity):
                     pass
         self._unsubs = []
 
-        unsub = getattr(self, "_unsub_ui_lock", None)
-        if callable(unsub):
-            try:
-                unsub()
-            except Exception:
-                pass
-
     def _handle_update(self, *args):
         schedule_entity_update_threadsafe(self)
@@ -0,0 +1,69 @@
+"""Leading/trailing-edge rate limiter for event-loop callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+DEFAULT_SENSOR_THROTTLE = 0.5
+MAX_SENSOR_THROTTLE = 10.0
+
+
+class Throttle:
+    """Run an action at most once per interval without losing the last request.
+
+    The first request after a quiet period runs the action immediately
+    (leading edge). Requests arriving within the interval are folded into
+    one trailing run at the end of it, so the final state always gets
+    through. The action reads current state when it runs; requests carry no
+    value. Must be used on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        action: Callable[[], None],
+        loop: asyncio.AbstractEventLoop | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self._action = action
+        self._loop = loop
+        self._clock = clock
+        self._last = float("-inf")
+        self._timer: asyncio.TimerHandle | None = None
+        self.requested = 0
+        self.runs = 0
+
+    def __call__(self) -> None:
+        self.requested += 1
+        if self._timer is not None:
+            return  # trailing run already scheduled
+        wait = self._last + self.interval - self._clock()
+        if wait <= 0:
+            self._run()
+            return
+        loop = self._loop or asyncio.get_running_loop()
+        self._timer = loop.call_later(wait, self._trailing)
+
+    def _trailing(self) -> None:
+        self._timer = None
+        self._run()
+
+    def _run(self) -> None:
+        self._last = self._clock()
+        self.runs += 1
+        self._action()
+
+    def flush(self) -> None:
+        """Run a pending trailing request now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._trailing()
+
+    def cancel(self) -> None:
+        """Drop a pending trailing request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,149 @@
+"""Press-and-hold volume stepping with accumulated, rate-limited writes."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aiohtp1 import Htp1
+
+_LOGGER = getLogger(__name__)
+
+STEP_INTERVAL = 0.1  # Minimum time between two volume writes (s)
+SETTLE_TIMEOUT = 1.0  # Drop an unconfirmed target this long after the last write (s)
+
+
+class VolumeStepper:
+    """Accumulate volume steps into one target and send only the net value.
+
+    A step issued while earlier ones are still in flight is added to the
+    pending target instead of the last reported volume, so rapid presses
+    never race the device echo. Writes go out at most once per
+    STEP_INTERVAL, always carrying the latest target, which is clamped to
+    the calibrated range (never above cal_vph).
+
+    latency keeps the time from a step request to the device echoing the
+    volume it produced.
+    """
+
+    def __init__(self, htp1: Htp1, interval: float = STEP_INTERVAL) -> None:
+        self._htp1 = htp1
+        self.interval = interval
+        self._target: int | None = None
+        self._sent: int | None = None
+        self._last_send = float("-inf")
+        self._requested_at: float | None = None
+        self._inflight: dict[int, float] = {}
+        self._task: asyncio.Task | None = None
+
+        self.steps = 0
+        self.writes = 0
+        self.clamped = 0
+        self.latency: deque[float] = deque(maxlen=64)
+
+        htp1.subscribe("/volume", self._on_volume)
+        htp1.subscribe("#connection", self._on_connection)
+
+    @property
+    def target(self) -> int | None:
+        """Volume (dB) the pending steps lead to, None when idle."""
+        return self._target
+
+    def step(self, delta: int) -> int:
+        """Add delta dB to the pending target and schedule a write; returns the target."""
+        htp1 = self._htp1
+        now = time.monotonic()
+        base = self._target
+        if base is None or (self._task is None and now - self._last_send > SETTLE_TIMEOUT):
+            base = htp1.volume
+            if base is None:
+                raise ValueError("volume is not known yet")
+            base = int(round(base))
+
+        low, high = int(htp1.cal_vpl), int(htp1.cal_vph)
+        target = base + int(delta)
+        if not low <= target <= high:
+            self.clamped += 1
+            target = max(low, min(high, target))
+
+        self.steps += 1
+        self._target = target
+        if self._requested_at is None:
+            self._requested_at = now
+        if self._task is None and target != self._sent:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return target
+
+    def reset(self) -> None:
+        """Drop pending steps, e.g. after an absolute volume change."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._target = None
+        self._sent = None
+        self._requested_at = None
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        latency = None
+        if self.latency:
+            ordered = sorted(self.latency)
+            latency = {
+                "count": len(ordered),
+                "mean": round(sum(ordered) / len(ordered) * 1e3, 1),
+                "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e3, 1),
+                "max": round(ordered[-1] * 1e3, 1),
+            }
+        return {
+            "steps": self.steps,
+            "writes": self.writes,
+            "clamped": self.clamped,
+            "latency_ms": latency,
+        }
+
+    async def _run(self) -> None:
+        htp1 = self._htp1
+        try:
+            while self._target is not None and self._target != self._sent:
+                wait = self._last_send + self.interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+
+                target = self._target
+                async with htp1:
+                    htp1.volume = target
+                    await htp1.commit()
+                self._last_send = time.monotonic()
+                self._sent = target
+                self.writes += 1
+                if self._requested_at is not None:
+                    self._inflight[target] = self._requested_at
+                    self._requested_at = None
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            _LOGGER.warning("Volume step to %s dB failed", self._target, exc_info=True)
+            self._target = None
+            self._sent = None
+            self._requested_at = None
+        finally:
+            if asyncio.current_task() is self._task:
+                self._task = None
+
+    def _on_volume(self, value) -> None:
+        requested_at = self._inflight.pop(value, None)
+        if requested_at is not None:
+            self.latency.append(time.monotonic() - requested_at)
+        if self._task is None and value == self._target:
+            # Settled: the next step starts from the reported volume.
+            self._target = None
+            self._sent = None
+            self._inflight.clear()
+
+    def _on_connection(self, _value=None) -> None:
+        self.reset()
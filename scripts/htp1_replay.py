@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Replay a websocket frame capture into an Htp1 client, without a device or HA.
+
+Usage:
+    python scripts/htp1_replay.py capture.jsonl.gz [--speed X] [--subscribers N] [--repeat N]
+
+Captures are written by the start_frame_capture service (Htp1.start_capture).
+Frames go through the same Htp1._handle_frame() path as frames read from the
+websocket. By default they are fed as fast as possible; --speed 1 replays in
+real time (2 = twice as fast, ...). Every path seen in the capture gets N
+no-op subscribers so dispatch cost is included.
+
+Reports frames per second and, per frame, the time spent applying patches
+and dispatching to subscribers.
+
+Needs aiohttp and aiodns (as in any Home Assistant environment); the
+integration package is loaded without importing Home Assistant itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "monoprice_htp1"
+
+
+def _load_package():
+    """Import the integration modules without running its HA-dependent __init__."""
+    pkg = types.ModuleType("monoprice_htp1")
+    pkg.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["monoprice_htp1"] = pkg
+    from monoprice_htp1 import aiohtp1, capture
+
+    return aiohtp1, capture
+
+
+def _update_paths(frames: list[tuple[float, str]]) -> set[str]:
+    paths = set()
+    for _, frame in frames:
+        if not frame.startswith("msoupdate "):
+            continue
+        payload = json.loads(frame.split(" ", 1)[1])
+        for piece in payload if isinstance(payload, list) else [payload]:
+            if isinstance(piece, dict) and isinstance(piece.get("path"), str):
+                paths.add(piece["path"])
+    return paths
+
+
+def _us(seconds: float) -> str:
+    return f"{seconds * 1e6:9.1f} us"
+
+
+async def replay(aiohtp1, frames, speed: float, subscribers: int) -> dict:
+    htp1 = aiohtp1.Htp1("replay", None)
+    for path in _update_paths(frames):
+        for _ in range(subscribers):
+            htp1.subscribe(path, lambda value: None)
+
+    # Time spent in subscriber dispatch, accumulated per frame.
+    dispatch = 0.0
+    notify = htp1._notify
+
+    async def timed_notify(subject, value=None):
+        nonlocal dispatch
+        start = time.perf_counter()
+        await notify(subject, value)
+        dispatch += time.perf_counter() - start
+
+    htp1._notify = timed_notify
+
+    apply_times: list[float] = []
+    dispatch_times: list[float] = []
+    start = time.perf_counter()
+    for t, frame in frames:
+        if speed > 0:
+            delay = start + t / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        dispatch = 0.0
+        t0 = time.perf_counter()
+        await htp1._handle_frame(frame)
+        total = time.perf_counter() - t0
+        if frame.startswith("msoupdate "):
+            apply_times.append(total - dispatch)
+            dispatch_times.append(dispatch)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "apply": apply_times,
+        "dispatch": dispatch_times,
+        "state_ok": htp1._state is not None,
+    }
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    if not samples:
+        return f"  {label:<9} -"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"  {label:<9} mean {_us(statistics.fmean(samples))}  p95 {_us(p95)}"
+        f"  max {_us(ordered[-1])}  total {sum(samples) * 1e3:8.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("capture")
+    parser.add_argument("--speed", type=float, default=0, help="0 = as fast as possible (default), 1 = real time")
+    parser.add_argument("--subscribers", type=int, default=1, help="no-op subscribers per captured path (default 1)")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    aiohtp1, capture = _load_package()
+    frames = list(capture.read_frames(args.capture))
+    updates = sum(1 for _, f in frames if f.startswith("msoupdate "))
+    span = frames[-1][0] - frames[0][0] if frames else 0.0
+    print(f"{args.capture}: {len(frames)} frames ({updates} msoupdate) over {span:.1f} s")
+    if not frames or not frames[0][1].startswith("mso "):
+        print("warning: capture does not start with an mso snapshot; early updates are ignored")
+
+    for run in range(1, args.repeat + 1):
+        result = asyncio.run(replay(aiohtp1, frames, args.speed, args.subscribers))
+        fps = len(frames) / result["elapsed"] if result["elapsed"] else float("inf")
+        print(f"run {run}: {result['elapsed'] * 1e3:.1f} ms, {fps:,.0f} frames/s")
+        print(_summary("apply", result["apply"]))
+        print(_summary("dispatch", result["dispatch"]))
+        if not result["state_ok"]:
+            print("  no state after replay")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Compare Mix Out tracking write modes on simulated main volume changes.
+
+Usage:
+    python scripts/mix_out_tracking_bench.py [--delay S]
+
+Runs the two MixOutTracker write policies on virtual time:
+
+  debounce      every change restarts the delay; one write once the volume
+                has been still for the whole delay (the default mode)
+  leading edge  throttle.Throttle: first change written at once, then at
+                most one write per delay, and a final write after the last
+                change
+
+For each scenario it reports the number of writes, the lag from each main
+volume change to the first write that includes it (mean / max), the time
+from the last change to the final write, and whether the final write
+carried the settled volume.
+
+Only the standard library is needed; the integration package is loaded
+without importing Home Assistant.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import statistics
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "monoprice_htp1"
+
+
+def _load_package():
+    """Import the throttle without running the HA-dependent package __init__."""
+    pkg = types.ModuleType("monoprice_htp1")
+    pkg.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["monoprice_htp1"] = pkg
+    from monoprice_htp1 import throttle
+
+    return throttle
+
+
+class _Handle:
+    def __init__(self, when: float, callback) -> None:
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class VirtualLoop:
+    """Just enough of an event loop (call_later, time) to run on virtual time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._queue: list[tuple[float, int, _Handle]] = []
+        self._seq = 0
+
+    def time(self) -> float:
+        return self.now
+
+    def call_later(self, delay: float, callback) -> _Handle:
+        handle = _Handle(self.now + delay, callback)
+        self._seq += 1
+        heapq.heappush(self._queue, (handle.when, self._seq, handle))
+        return handle
+
+    def run_until(self, when: float) -> None:
+        while self._queue and self._queue[0][0] <= when:
+            at, _, handle = heapq.heappop(self._queue)
+            if not handle.cancelled:
+                self.now = at
+                handle.callback()
+        self.now = max(self.now, when)
+
+
+def scenarios() -> dict[str, list[tuple[float, int]]]:
+    """Main volume changes as (time s, dB)."""
+    def sweep(start: float, count: int, interval: float, first_db: int, step: int = 1):
+        return [(start + i * interval, first_db + i * step) for i in range(count)]
+
+    bursts = []
+    for b in range(5):
+        bursts += sweep(b * 1.5, 5, 0.05, -40 + b * 5)
+    return {
+        "single step": [(0.0, -39)],
+        "fast sweep (40 ms/dB)": sweep(0.0, 30, 0.04, -60),
+        "slow fade (250 ms/dB)": sweep(0.0, 30, 0.25, -30, -1),
+        "5 bursts of 5 steps": bursts,
+    }
+
+
+def simulate(events: list[tuple[float, int]], mode: str, delay: float, throttle) -> dict:
+    loop = VirtualLoop()
+    state = {"main": None}
+    writes: list[tuple[float, int]] = []
+
+    def write() -> None:
+        writes.append((loop.now, state["main"]))
+
+    if mode == "debounce":
+        pending = {"handle": None}
+
+        def on_change() -> None:
+            if pending["handle"] is not None:
+                pending["handle"].cancel()
+            pending["handle"] = loop.call_later(delay, write)
+    else:
+        on_change = throttle.Throttle(delay, write, loop=loop, clock=loop.time)
+
+    for at, value in events:
+        loop.run_until(at)
+        state["main"] = value
+        on_change()
+    loop.run_until(events[-1][0] + 10 * delay + 1)
+
+    lags = []
+    for at, _value in events:
+        lags.append(next((w - at for w, _ in writes if w >= at), float("inf")))
+    return {
+        "writes": len(writes),
+        "lag_mean": statistics.fmean(lags),
+        "lag_max": max(lags),
+        "settle": writes[-1][0] - events[-1][0] if writes else float("inf"),
+        "final_ok": bool(writes) and writes[-1][1] == events[-1][1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.5, help="tracking delay (s), default 0.5")
+    args = parser.parse_args()
+
+    throttle = _load_package()
+    failures = 0
+    for name, events in scenarios().items():
+        print(f"{name}: {len(events)} changes over {events[-1][0] - events[0][0]:.2f} s")
+        for mode in ("debounce", "leading edge"):
+            r = simulate(events, mode, args.delay, throttle)
+            failures += not r["final_ok"]
+            print(
+                f"  {mode:<13} writes {r['writes']:3d}  lag mean {r['lag_mean'] * 1e3:6.0f} ms"
+                f"  max {r['lag_max'] * 1e3:6.0f} ms  settle {r['settle'] * 1e3:5.0f} ms"
+                f"  final {'ok' if r['final_ok'] else 'WRONG'}"
+            )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Benchmark msodiff on mso snapshots and round-trip it through the patch applier.
+
+Usage:
+    python scripts/msodiff_bench.py [mso.json ...] [--mutations N] [--rounds N]
+
+Each file is a full state tree as returned by "getmso". Without files a
+synthetic tree of similar shape is used. For every snapshot the script
+times diffing against itself (identity short-circuit), against a deep copy,
+and against randomly mutated copies, then applies each diff with
+Htp1._cmd_msoupdate and checks the result equals the target.
+
+Needs aiohttp and aiodns (as in any Home Assistant environment); the
+integration package is loaded without importing Home Assistant itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+import sys
+import time
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "monoprice_htp1"
+
+
+def _load_package():
+    """Import the integration modules without running its HA-dependent __init__."""
+    pkg = types.ModuleType("monoprice_htp1")
+    pkg.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["monoprice_htp1"] = pkg
+    from monoprice_htp1 import aiohtp1, msodiff
+
+    return aiohtp1, msodiff
+
+
+def synthetic_mso() -> dict:
+    channels = ["lf", "rf", "c", "ls", "rs", "lb", "rb", "ltf", "rtf", "ltr", "rtr", "sub1", "sub2", "sub3"]
+    return {
+        "powerIsOn": True,
+        "volume": -40,
+        "muted": False,
+        "input": "h1",
+        "inputs": {f"h{i}": {"label": f"HDMI {i}", "visible": True, "gain": 0} for i in range(1, 9)},
+        "upmix": {"select": "dolby", "dolby": {"homevis": True, "cnt": False}, "dts": {"homevis": True, "ws": False}},
+        "cal": {"vpl": -80, "vph": 0, "currentdiracslot": 0, "slots": [{"name": f"Slot {i}", "valid": True} for i in range(6)]},
+        "channeltrim": {"channels": {ch: 0 for ch in channels}},
+        "speakers": {"groups": {ch: {"present": True, "size": "l"} for ch in channels}},
+        "peq": {
+            "peqsw": True,
+            "location": "post",
+            "slots": [
+                {"channels": {ch: {"Fc": 100, "gaindB": 0, "Q": 1, "FilterType": 0} for ch in channels}}
+                for _ in range(16)
+            ],
+        },
+    }
+
+
+def _containers(node, path=""):
+    """Yield (path, container) for every dict/list in the tree."""
+    yield path, node
+    items = node.items() if isinstance(node, dict) else enumerate(node)
+    for key, value in items:
+        if isinstance(value, (dict, list)):
+            yield from _containers(value, f"{path}/{key}")
+
+
+def mutate(tree: dict, count: int, rng: random.Random) -> dict:
+    tree = copy.deepcopy(tree)
+    containers = [c for _, c in _containers(tree)]
+    for _ in range(count):
+        node = rng.choice(containers)
+        if isinstance(node, dict):
+            scalars = [k for k, v in node.items() if not isinstance(v, (dict, list))]
+            roll = rng.random()
+            if scalars and roll < 0.7:
+                key = rng.choice(scalars)
+                value = node[key]
+                if isinstance(value, bool):
+                    node[key] = not value
+                elif isinstance(value, (int, float)):
+                    node[key] = value + rng.choice((-1, 0.5, 3))
+                else:
+                    node[key] = f"{value}~/x"
+            elif scalars and roll < 0.85:
+                del node[rng.choice(scalars)]
+            else:
+                node[f"k~{rng.randrange(1000)}/n"] = rng.random()
+        elif node:
+            if rng.random() < 0.5:
+                node.append(copy.deepcopy(node[-1]))
+            elif len(node) > 1:
+                node.pop()
+    return tree
+
+
+async def _apply(aiohtp1, state: dict, ops: list[dict]) -> dict:
+    htp1 = aiohtp1.Htp1("bench", None)
+    htp1._state = state
+    await htp1._cmd_msoupdate(ops)
+    return htp1._state
+
+
+def _time(fn, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--mutations", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    aiohtp1, msodiff = _load_package()
+    rng = random.Random(args.seed)
+    snapshots = [(str(p), json.loads(p.read_text())) for p in args.files] or [("synthetic", synthetic_mso())]
+
+    failures = 0
+    for name, tree in snapshots:
+        clone = copy.deepcopy(tree)
+        mutated = [mutate(tree, args.mutations, rng) for _ in range(20)]
+        print(f"{name}: {len(json.dumps(tree))} bytes")
+        print(f"  identical object  {_time(lambda: msodiff.diff(tree, tree), args.rounds):9.1f} us")
+        print(f"  deep copy         {_time(lambda: msodiff.diff(tree, clone), args.rounds):9.1f} us")
+        print(
+            f"  {args.mutations:3d} mutations     "
+            f"{_time(lambda: [msodiff.diff(tree, m) for m in mutated], args.rounds) / len(mutated):9.1f} us"
+        )
+
+        ok = 0
+        for target in mutated:
+            ops = msodiff.diff(tree, target)
+            result = asyncio.run(_apply(aiohtp1, copy.deepcopy(tree), ops))
+            if result == target:
+                ok += 1
+            else:
+                print(f"  round-trip mismatch after {len(ops)} ops")
+        failures += len(mutated) - ok
+        print(f"  round-trip        {ok}/{len(mutated)} ok")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
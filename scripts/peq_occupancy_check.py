@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Cross-check the incremental PEQ occupancy index against full scans.
+
+Usage:
+    python scripts/peq_occupancy_check.py [--states N] [--ops N] [--seed N]
+
+Two checks:
+
+  scan         random PEQ states; PeqOccupancy.scan() must agree with a
+               slot-by-slot classification of the state
+  incremental  random msoupdate ops on /peq (field, channel, slot and
+               whole-subtree writes, BEQ tags added and removed) applied
+               with Htp1._cmd_msoupdate; after every op the index the
+               client keeps must equal a fresh scan of its state
+
+Mismatches are printed with the op that caused them; the exit status is 1
+if there were any.
+
+Needs aiohttp and aiodns (as in any Home Assistant environment); the
+integration package is loaded without importing Home Assistant itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "monoprice_htp1"
+
+CHANNELS = ("lf", "rf", "c", "sub1", "sub2", "sub3", "sub4", "sub5")
+# Also write channels that are not in the initial state.
+EXTRA_CHANNELS = ("ltf", "x9")
+
+
+def _load_package():
+    """Import the integration modules without running its HA-dependent __init__."""
+    pkg = types.ModuleType("monoprice_htp1")
+    pkg.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["monoprice_htp1"] = pkg
+    from monoprice_htp1 import aiohtp1, peq_occupancy
+
+    return aiohtp1, peq_occupancy
+
+
+def random_entry(rng: random.Random, ch: str) -> dict:
+    entry = {"Fc": rng.choice((20, 100, 1000)), "gaindB": 0, "Q": 1, "FilterType": 0}
+    roll = rng.random()
+    if roll < 0.2:
+        entry["gaindB"] = rng.choice((-3, 1.5, 2))
+    elif roll < 0.3:
+        entry["FilterType"] = rng.choice((3, 4, 5))
+    elif roll < 0.45 and ch.startswith("sub"):
+        entry.update(beq=True, gaindB=1, FilterType=1)
+    return entry
+
+
+def random_peq(rng: random.Random) -> dict:
+    return {
+        "peqsw": rng.random() < 0.5,
+        "slots": [
+            {"channels": {ch: random_entry(rng, ch) for ch in CHANNELS}} for _ in range(16)
+        ],
+    }
+
+
+def random_op(rng: random.Random) -> dict:
+    slot = rng.randrange(16)
+    ch = rng.choice(CHANNELS + EXTRA_CHANNELS)
+    base = f"/peq/slots/{slot}/channels/{ch}"
+    roll = rng.random()
+    if roll < 0.3:
+        return {"op": "replace", "path": f"{base}/gaindB", "value": rng.choice((0, 0, 2))}
+    if roll < 0.45:
+        return {"op": "replace", "path": f"{base}/FilterType", "value": rng.choice((0, 1, 4, 5))}
+    if roll < 0.6:
+        return {"op": "add", "path": f"{base}/beq", "value": True}
+    if roll < 0.72:
+        return {"op": "remove", "path": f"{base}/beq"}
+    if roll < 0.84:
+        return {"op": "replace", "path": base, "value": random_entry(rng, ch)}
+    if roll < 0.9:
+        return {"op": "remove", "path": base}
+    if roll < 0.97:
+        value = {"channels": {c: random_entry(rng, c) for c in rng.sample(CHANNELS, 3)}}
+        return {"op": "replace", "path": f"/peq/slots/{slot}", "value": value}
+    return {"op": "replace", "path": "/peq", "value": random_peq(rng)}
+
+
+def reference_masks(peq_occupancy, state: dict, channels) -> dict:
+    """(free, user, beq) masks per channel by classifying every slot directly."""
+    slots = state["peq"]["slots"][: peq_occupancy.BEQ_SLOT_COUNT]
+    masks = {}
+    for ch in channels:
+        free = user = beq = 0
+        for i, slot in enumerate(slots):
+            kind = peq_occupancy.classify(slot.get("channels", {}).get(ch, {}))
+            bit = 1 << i
+            if kind == peq_occupancy.FREE:
+                free |= bit
+            elif kind == peq_occupancy.USER:
+                user |= bit
+            else:
+                beq |= bit
+        masks[ch] = (free, user, beq)
+    return masks
+
+
+def index_masks(index, channels) -> dict:
+    return {ch: (index.free(ch), index.user(ch), index.beq(ch)) for ch in channels}
+
+
+def check_scans(peq_occupancy, rng: random.Random, count: int) -> int:
+    channels = CHANNELS + EXTRA_CHANNELS
+    failures = 0
+    for n in range(count):
+        state = {"peq": random_peq(rng)}
+        expected = reference_masks(peq_occupancy, state, channels)
+        if index_masks(peq_occupancy.PeqOccupancy.scan(state), channels) != expected:
+            print(f"  scan mismatch on state {n}")
+            failures += 1
+    return failures
+
+
+async def check_incremental(aiohtp1, peq_occupancy, rng: random.Random, count: int) -> int:
+    channels = CHANNELS + EXTRA_CHANNELS
+    htp1 = aiohtp1.Htp1("check", None)
+    htp1._state = {"peq": random_peq(rng)}
+    htp1.peq_occupancy.rebuild(htp1._state)
+
+    failures = 0
+    for n in range(count):
+        op = random_op(rng)
+        await htp1._cmd_msoupdate([op])
+        expected = index_masks(peq_occupancy.PeqOccupancy.scan(htp1._state), channels)
+        if index_masks(htp1.peq_occupancy, channels) != expected:
+            print(f"  incremental mismatch after op {n}: {op}")
+            failures += 1
+            htp1.peq_occupancy.rebuild(htp1._state)  # report each divergence once
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=200, help="random states for the scan check")
+    parser.add_argument("--ops", type=int, default=5000, help="random ops for the incremental check")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    aiohtp1, peq_occupancy = _load_package()
+    rng = random.Random(args.seed)
+
+    scan_failures = check_scans(peq_occupancy, rng, args.states)
+    print(f"scan:        {args.states - scan_failures}/{args.states} states ok")
+    inc_failures = asyncio.run(check_incremental(aiohtp1, peq_occupancy, rng, args.ops))
+    print(f"incremental: {args.ops - inc_failures}/{args.ops} ops ok")
+    return 1 if scan_failures or inc_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())